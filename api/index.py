@@ -4,4 +4,9 @@ import os
 # Add server directory to Python path so imports work
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'server'))
 
+# Selects NullPool and disables in-process periodic tasks (see app.config).
+# Challenges are settled by the Vercel Cron entry in vercel.json, which
+# calls /api/v1/internal/challenges/sweep with CRON_SECRET.
+os.environ.setdefault("DEPLOYMENT_TARGET", "serverless")
+
 from main import app  # FastAPI ASGI app - Vercel handles ASGI natively
@@ -5,7 +5,10 @@ export const nudgeApi = baseApi.injectEndpoints({
     checkNudge: builder.mutation({
       query: (body) => ({ url: '/nudge/check', method: 'POST', body }),
     }),
+    checkNudgeBatch: builder.mutation({
+      query: (items) => ({ url: '/nudge/check-batch', method: 'POST', body: { items } }),
+    }),
   }),
 });
 
-export const { useCheckNudgeMutation } = nudgeApi;
+export const { useCheckNudgeMutation, useCheckNudgeBatchMutation } = nudgeApi;
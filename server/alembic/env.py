@@ -7,7 +7,7 @@ from sqlalchemy import engine_from_config, pool
 from app.models.base import Base
 
 # Import all models so metadata is populated
-from app.models import budget, challenge, chat, checklist, expense, goal, user  # noqa: F401
+from app.models import budget, challenge, chat, checklist, expense, goal, schema_state, user  # noqa: F401
 
 config = context.config
 if config.config_file_name is not None:
@@ -34,6 +34,15 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
+    # schema_service passes its own connection so upgrades run inside its
+    # transaction (and advisory lock) instead of on a new engine
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -0,0 +1,225 @@
+"""Baseline: the schema created by create_all before migrations were introduced
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UUID = postgresql.UUID(as_uuid=True)
+
+# Shared by several tables, so created once up front rather than per table
+challengetype_enum = postgresql.ENUM("SAVINGS", "SPENDING_LIMIT", "NO_SPEND", "STREAK", name="challengetype", create_type=False)
+expensecategory_enum = postgresql.ENUM("FOOD_DINING", "GROCERIES", "TRANSPORT", "SHOPPING", "ENTERTAINMENT", "BILLS", "HEALTH", "EDUCATION_EXP", "PERSONAL_CARE", "GIFTS_DONATIONS", "OTHER", name="expensecategory", create_type=False)
+badgetype_enum = postgresql.ENUM("SAVINGS_MASTER", "BUDGET_NINJA", "STREAK_CHAMPION", "SPENDING_WARRIOR", name="badgetype", create_type=False)
+dependenttype_enum = postgresql.ENUM("JUST_ME", "ME_SPOUSE", "ME_SPOUSE_KIDS", "ME_PARENTS", "ME_SPOUSE_PARENTS", name="dependenttype", create_type=False)
+fixedexpensecategory_enum = postgresql.ENUM("RENT", "EMI", "BILLS", "OTHER_FIXED", name="fixedexpensecategory", create_type=False)
+goalicon_enum = postgresql.ENUM("BIKE", "CAR", "HOME", "TRIP", "WEDDING", "GADGET", "EDUCATION_GOAL", "OTHER_GOAL", name="goalicon", create_type=False)
+challengestatus_enum = postgresql.ENUM("ACTIVE", "COMPLETED", "FAILED", "ABANDONED", name="challengestatus", create_type=False)
+checklistitemtype_enum = postgresql.ENUM("EMERGENCY_FUND", "HEALTH_INSURANCE", "TERM_INSURANCE", "EPF_PPF", "BASIC_SAVINGS_HABIT", "NO_HIGH_INTEREST_DEBT", name="checklistitemtype", create_type=False)
+checkliststatus_enum = postgresql.ENUM("COMPLETE", "INCOMPLETE", "MISSING", name="checkliststatus", create_type=False)
+
+ENUMS = (challengetype_enum, expensecategory_enum, badgetype_enum, dependenttype_enum, fixedexpensecategory_enum, goalicon_enum, challengestatus_enum, checklistitemtype_enum, checkliststatus_enum)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for enum in ENUMS:
+        enum.create(bind, checkfirst=True)
+
+    op.create_table("challenges",
+    sa.Column("title", sa.String(length=200), nullable=False),
+    sa.Column("description", sa.String(length=500), nullable=False),
+    sa.Column("challenge_type", challengetype_enum, nullable=False),
+    sa.Column("target_category", expensecategory_enum, nullable=True),
+    sa.Column("target_amount", sa.Numeric(precision=12, scale=2), nullable=True),
+    sa.Column("duration_days", sa.Integer(), nullable=False),
+    sa.Column("badge_type", badgetype_enum, nullable=False),
+    sa.Column("is_active", sa.Boolean(), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_table("users",
+    sa.Column("phone", sa.String(length=15), nullable=False),
+    sa.Column("name", sa.String(length=100), nullable=False),
+    sa.Column("age", sa.Integer(), nullable=True),
+    sa.Column("city", sa.String(length=100), nullable=True),
+    sa.Column("password_hash", sa.String(length=255), nullable=False),
+    sa.Column("monthly_salary", sa.Numeric(precision=12, scale=2), nullable=True),
+    sa.Column("other_income", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("dependent_type", dependenttype_enum, nullable=True),
+    sa.Column("onboarding_complete", sa.Boolean(), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("phone")
+    )
+    op.create_table("budgets",
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("month", sa.Integer(), nullable=False),
+    sa.Column("year", sa.Integer(), nullable=False),
+    sa.Column("total_income", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("user_id", "month", "year", name="uq_user_month_year")
+    )
+    op.create_table("chat_messages",
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("role", sa.String(length=10), nullable=False),
+    sa.Column("content", sa.String(length=2000), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_table("expenses",
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("category", expensecategory_enum, nullable=False),
+    sa.Column("description", sa.String(length=255), nullable=True),
+    sa.Column("date", sa.Date(), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_expenses_user_category", "expenses", ["user_id", "category"], unique=False)
+    op.create_index("ix_expenses_user_date", "expenses", ["user_id", "date"], unique=False)
+    op.create_table("fixed_expenses",
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("category", fixedexpensecategory_enum, nullable=False),
+    sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("user_id", "category", name="uq_user_fixed_category")
+    )
+    op.create_table("goals",
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("name", sa.String(length=100), nullable=False),
+    sa.Column("icon", goalicon_enum, nullable=False),
+    sa.Column("target_amount", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("saved_amount", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("target_date", sa.Date(), nullable=False),
+    sa.Column("initial_amount", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("is_active", sa.Boolean(), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_table("refresh_tokens",
+    sa.Column("token", sa.String(length=500), nullable=False),
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("token")
+    )
+    op.create_table("user_badges",
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("badge_type", badgetype_enum, nullable=False),
+    sa.Column("challenge_id", UUID, nullable=False),
+    sa.Column("earned_at", sa.DateTime(timezone=True), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.ForeignKeyConstraint(["challenge_id"], ["challenges.id"], ),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("user_id", "badge_type", name="uq_user_badge")
+    )
+    op.create_table("user_challenges",
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("challenge_id", UUID, nullable=False),
+    sa.Column("status", challengestatus_enum, nullable=False),
+    sa.Column("start_date", sa.Date(), nullable=False),
+    sa.Column("end_date", sa.Date(), nullable=False),
+    sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.ForeignKeyConstraint(["challenge_id"], ["challenges.id"], ),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_user_challenges_challenge", "user_challenges", ["challenge_id"], unique=False)
+    op.create_index("ix_user_challenges_user_status", "user_challenges", ["user_id", "status"], unique=False)
+    op.create_table("user_checklist_items",
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("item_type", checklistitemtype_enum, nullable=False),
+    sa.Column("status", checkliststatus_enum, nullable=False),
+    sa.Column("details", sa.JSON(), nullable=True),
+    sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Column("id", UUID, nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("user_id", "item_type", name="uq_user_checklist_item")
+    )
+    op.create_table("budget_categories",
+    sa.Column("budget_id", UUID, nullable=False),
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("category", expensecategory_enum, nullable=False),
+    sa.Column("allocated_amount", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.ForeignKeyConstraint(["budget_id"], ["budgets.id"], ),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("budget_id", "category", name="uq_budget_category")
+    )
+    op.create_table("goal_contributions",
+    sa.Column("goal_id", UUID, nullable=False),
+    sa.Column("user_id", UUID, nullable=False),
+    sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("date", sa.Date(), nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    sa.Column("id", UUID, nullable=False),
+    sa.ForeignKeyConstraint(["goal_id"], ["goals.id"], ),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ),
+    sa.PrimaryKeyConstraint("id")
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("goal_contributions")
+    op.drop_table("budget_categories")
+    op.drop_table("user_checklist_items")
+    op.drop_index("ix_user_challenges_user_status", table_name="user_challenges")
+    op.drop_index("ix_user_challenges_challenge", table_name="user_challenges")
+    op.drop_table("user_challenges")
+    op.drop_table("user_badges")
+    op.drop_table("refresh_tokens")
+    op.drop_table("goals")
+    op.drop_table("fixed_expenses")
+    op.drop_index("ix_expenses_user_date", table_name="expenses")
+    op.drop_index("ix_expenses_user_category", table_name="expenses")
+    op.drop_table("expenses")
+    op.drop_table("chat_messages")
+    op.drop_table("budgets")
+    op.drop_table("users")
+    op.drop_table("challenges")
+    bind = op.get_bind()
+    for enum in ENUMS:
+        enum.drop(bind, checkfirst=True)
@@ -0,0 +1,49 @@
+"""Per-user monthly category spend rollup
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+Filled from existing expenses in the same transaction, so reads switched
+to the rollup see every user's spend as soon as the upgrade commits.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UUID = postgresql.UUID(as_uuid=True)
+expensecategory_enum = postgresql.ENUM(name="expensecategory", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_month_category_totals",
+        sa.Column("user_id", UUID, nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("category", expensecategory_enum, nullable=False),
+        sa.Column("total", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("expense_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "year", "month", "category"),
+    )
+    op.execute(
+        """
+        INSERT INTO user_month_category_totals (user_id, year, month, category, total, expense_count)
+        SELECT user_id, extract(year FROM date)::int, extract(month FROM date)::int, category,
+               sum(amount), count(*)
+        FROM expenses
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_month_category_totals")
@@ -0,0 +1,46 @@
+"""Persisted challenge leaderboard scores
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+Scores are computed in Python, so schema_service rescores existing
+participants in the setup transaction after upgrading past this revision.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UUID = postgresql.UUID(as_uuid=True)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "challenge_leaderboard_entries",
+        sa.Column("user_challenge_id", UUID, nullable=False),
+        sa.Column("challenge_id", UUID, nullable=False),
+        sa.Column("user_id", UUID, nullable=False),
+        sa.Column("progress_percent", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_challenge_id"], ["user_challenges.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["challenge_id"], ["challenges.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_challenge_id"),
+    )
+    op.create_index(
+        "ix_leaderboard_challenge_score",
+        "challenge_leaderboard_entries",
+        ["challenge_id", "progress_percent", "user_challenge_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leaderboard_challenge_score", table_name="challenge_leaderboard_entries")
+    op.drop_table("challenge_leaderboard_entries")
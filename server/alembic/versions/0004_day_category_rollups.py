@@ -0,0 +1,47 @@
+"""Per-user daily category spend rollup
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+Filled from existing expenses in the same transaction, like the monthly
+rollup in 0002.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UUID = postgresql.UUID(as_uuid=True)
+expensecategory_enum = postgresql.ENUM(name="expensecategory", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_day_category_totals",
+        sa.Column("user_id", UUID, nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("category", expensecategory_enum, nullable=False),
+        sa.Column("total", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("expense_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "day", "category"),
+    )
+    op.execute(
+        """
+        INSERT INTO user_day_category_totals (user_id, day, category, total, expense_count)
+        SELECT user_id, date, category, sum(amount), count(*)
+        FROM expenses
+        GROUP BY user_id, date, category
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_day_category_totals")
@@ -0,0 +1,40 @@
+"""Store refresh tokens as SHA-256 digests
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+Existing raw tokens are hashed in place with the same digest as
+app.utils.security.hash_token (hex SHA-256 of the UTF-8 token), so
+signed-in users stay signed in across the upgrade.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("refresh_tokens", sa.Column("token_hash", sa.String(length=64), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')")
+    op.alter_column("refresh_tokens", "token_hash", nullable=False)
+    op.drop_column("refresh_tokens", "token")
+    op.create_unique_constraint("refresh_tokens_token_hash_key", "refresh_tokens", ["token_hash"])
+    op.create_index("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"])
+    op.create_index("ix_refresh_tokens_user_expires", "refresh_tokens", ["user_id", "expires_at"])
+
+
+def downgrade() -> None:
+    # Digests cannot be turned back into tokens
+    op.execute("DELETE FROM refresh_tokens")
+    op.drop_index("ix_refresh_tokens_user_expires", table_name="refresh_tokens")
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens")
+    op.drop_constraint("refresh_tokens_token_hash_key", "refresh_tokens", type_="unique")
+    op.drop_column("refresh_tokens", "token_hash")
+    op.add_column("refresh_tokens", sa.Column("token", sa.String(length=500), nullable=False))
+    op.create_unique_constraint("refresh_tokens_token_key", "refresh_tokens", ["token"])
@@ -0,0 +1,27 @@
+"""Replace (user_id, date) with the keyset index on expenses
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+(user_id, date, created_at, id) serves both month ranges and the
+(date, created_at, id) cursor ordering, so the narrower index is dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_expenses_user_date_created_id", "expenses", ["user_id", "date", "created_at", "id"])
+    op.drop_index("ix_expenses_user_date", table_name="expenses")
+
+
+def downgrade() -> None:
+    op.create_index("ix_expenses_user_date", "expenses", ["user_id", "date"])
+    op.drop_index("ix_expenses_user_date_created_id", table_name="expenses")
@@ -0,0 +1,27 @@
+"""Extend the (user_id, category) expense index with date
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+(user_id, category, date) range-scans category spend within a month and
+still serves the old prefix lookups, so the narrower index is dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_expenses_user_category_date", "expenses", ["user_id", "category", "date"])
+    op.drop_index("ix_expenses_user_category", table_name="expenses")
+
+
+def downgrade() -> None:
+    op.create_index("ix_expenses_user_category", "expenses", ["user_id", "category"])
+    op.drop_index("ix_expenses_user_category_date", table_name="expenses")
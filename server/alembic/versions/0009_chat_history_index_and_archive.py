@@ -0,0 +1,41 @@
+"""Chat history cursor index and archive table
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UUID = postgresql.UUID(as_uuid=True)
+
+
+def upgrade() -> None:
+    op.create_index("ix_chat_messages_user_created_id", "chat_messages", ["user_id", "created_at", "id"])
+    op.create_table(
+        "chat_message_archive",
+        sa.Column("id", UUID, nullable=False),
+        sa.Column("user_id", UUID, nullable=False),
+        sa.Column("role", sa.String(length=10), nullable=False),
+        sa.Column("content", sa.String(length=2000), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_chat_message_archive_user_created", "chat_message_archive", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_message_archive_user_created", table_name="chat_message_archive")
+    op.drop_table("chat_message_archive")
+    op.drop_index("ix_chat_messages_user_created_id", table_name="chat_messages")
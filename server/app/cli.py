@@ -0,0 +1,192 @@
+"""Maintenance commands. Run from the server directory: ``python -m app.cli <command>``."""
+
+import argparse
+import os
+import subprocess
+import sys
+import uuid
+
+from app.database import SessionLocal
+from app.services import leaderboard_service, rollup_service, schema_service
+from app.services.auth_service import purge_refresh_tokens
+from app.services.challenge_lifecycle_service import sweep_challenges
+from app.services.chat_service import compact_chat_history
+
+
+def _db_setup(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        if schema_service.is_current(db) and not args.force:
+            print("Schema and seed data are current")
+            return 0
+        result = schema_service.apply_schema_and_seed(db, force=args.force)
+    finally:
+        db.close()
+    print(
+        f"Schema at revision {result['revision']}, seed v{result['seed_version']} "
+        f"({result['seeded']} challenge(s) added, {result['rescored']} leaderboard entries scored)"
+    )
+    return 0
+
+
+def _rollups_rebuild(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        written = rollup_service.rebuild_rollups(db, args.user_id)
+    finally:
+        db.close()
+    print(f"Rebuilt {written} rollup row(s)")
+    return 0
+
+
+def _rollups_verify(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        drift = rollup_service.verify_rollups(db, args.user_id)
+    finally:
+        db.close()
+    for d in drift:
+        period = d["day"].isoformat() if "day" in d else f"{d['year']}-{d['month']:02d}"
+        print(
+            f"{d['user_id']} {period} {d['category'].value}: "
+            f"expected {d['expected_total']:.2f}/{d['expected_count']}, "
+            f"stored {d['stored_total']:.2f}/{d['stored_count']}"
+        )
+    print(f"{len(drift)} drifted rollup row(s)")
+    return 1 if drift else 0
+
+
+def _leaderboards_rebuild(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        written = leaderboard_service.rebuild_leaderboards(db, args.challenge_id)
+    finally:
+        db.close()
+    print(f"Rebuilt {written} leaderboard entries")
+    return 0
+
+
+def _leaderboards_verify(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        mismatches = leaderboard_service.verify_leaderboards(db, args.challenge_id)
+    finally:
+        db.close()
+    for m in mismatches:
+        print(f"{m['user_challenge_id']}: expected {m['expected']}, stored {m['stored']}")
+    print(f"{len(mismatches)} inconsistent leaderboard entries")
+    return 1 if mismatches else 0
+
+
+def _challenges_sweep(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        result = sweep_challenges(db)
+    finally:
+        db.close()
+    print(
+        f"Checked {result['checked']} active challenge(s): "
+        f"{result['completed']} completed, {result['failed']} failed"
+    )
+    return 0
+
+
+def _chat_compact(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        result = compact_chat_history(db, args.keep)
+    finally:
+        db.close()
+    print(f"Archived {result['archived']} message(s) for {result['users']} user(s)")
+    return 0
+
+
+def _tokens_purge(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        purged = purge_refresh_tokens(db, args.batch_size)
+    finally:
+        db.close()
+    print(f"Purged {purged} expired refresh token(s)")
+    return 0
+
+
+def _importtime(args: argparse.Namespace) -> int:
+    """Import ``main`` in a fresh interpreter under ``-X importtime`` and report the slowest modules."""
+    env = dict(os.environ)
+    if args.serverless:
+        env["DEPLOYMENT_TARGET"] = "serverless"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        capture_output=True, text=True, env=env,
+    )
+    if proc.returncode != 0:
+        print(proc.stderr, file=sys.stderr)
+        return proc.returncode
+
+    # "import time: self [us] | cumulative | imported package"
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    total = next((cum for cum, _, name in rows if name.strip() == "main"), sum(s for _, s, _ in rows))
+    print(f"import main: {total / 1000:.1f} ms across {len(rows)} module(s)")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    setup = commands.add_parser("db-setup", help="Apply Alembic migrations and seed reference data")
+    setup.add_argument("--force", action="store_true", help="Re-run seeding even if everything is current")
+    setup.set_defaults(func=_db_setup)
+
+    rebuild = commands.add_parser("rollups-rebuild", help="Recompute daily and monthly spend rollups from expenses")
+    rebuild.add_argument("--user-id", type=uuid.UUID, default=None)
+    rebuild.set_defaults(func=_rollups_rebuild)
+
+    verify = commands.add_parser("rollups-verify", help="Report rollup rows that drifted from expenses")
+    verify.add_argument("--user-id", type=uuid.UUID, default=None)
+    verify.set_defaults(func=_rollups_verify)
+
+    lb_rebuild = commands.add_parser("leaderboards-rebuild", help="Recompute stored challenge leaderboard scores")
+    lb_rebuild.add_argument("--challenge-id", type=uuid.UUID, default=None)
+    lb_rebuild.set_defaults(func=_leaderboards_rebuild)
+
+    lb_verify = commands.add_parser("leaderboards-verify", help="Check stored scores against live progress")
+    lb_verify.add_argument("--challenge-id", type=uuid.UUID, default=None)
+    lb_verify.set_defaults(func=_leaderboards_verify)
+
+    sweep = commands.add_parser("challenges-sweep", help="Complete or fail finished challenges and award badges")
+    sweep.set_defaults(func=_challenges_sweep)
+
+    compact = commands.add_parser("chat-compact", help="Archive chat messages beyond the per-user cap")
+    compact.add_argument("--keep", type=int, default=None, help="Messages to keep per user (default: CHAT_HISTORY_MAX_MESSAGES)")
+    compact.set_defaults(func=_chat_compact)
+
+    purge = commands.add_parser("tokens-purge", help="Delete expired refresh tokens in batches")
+    purge.add_argument("--batch-size", type=int, default=5000)
+    purge.set_defaults(func=_tokens_purge)
+
+    importtime = commands.add_parser("importtime", help="Profile app import time with -X importtime")
+    importtime.add_argument("--top", type=int, default=25)
+    importtime.add_argument("--serverless", action="store_true", help="Profile with DEPLOYMENT_TARGET=serverless")
+    importtime.set_defaults(func=_importtime)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,10 +6,101 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "change-me-to-a-random-secret-key"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Outstanding refresh tokens (signed-in devices) kept per user; oldest are revoked
+    MAX_REFRESH_TOKENS_PER_USER: int = 10
     CORS_ORIGINS: str = "http://localhost:5173"
     ALGORITHM: str = "HS256"
+    # "jose" (python-jose) or "pyjwt" (PyJWT, noticeably faster to verify)
+    JWT_BACKEND: str = "jose"
+    # Verified access tokens remembered per process until their own exp
+    TOKEN_CLAIMS_CACHE_MAX_ENTRIES: int = 10000
 
-    model_config = {"env_file": ".env", "extra": "ignore"}
+    # "server" for long-running processes (Render/uvicorn), "serverless" for
+    # the Vercel entry point, which sets it before importing the app
+    DEPLOYMENT_TARGET: str = "server"
+    # "queue" or "null"; empty picks queue for servers and null for serverless
+    DB_POOL_MODE: str = ""
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    # Ping pooled connections on checkout so ones dropped by the server or a
+    # proxy while idle are replaced instead of failing a request. Empty means
+    # on for queue mode and off for null mode, whose connections are new.
+    DB_POOL_PRE_PING: bool | None = None
+
+    # Serve read-heavy routes through an asyncpg engine instead of the threadpool.
+    # ASYNC_DATABASE_URL defaults to DATABASE_URL with the asyncpg driver.
+    DB_ASYNC_ENABLED: bool = False
+    ASYNC_DATABASE_URL: str = ""
+
+    # Independent read queries one request may run at once on separate pooled
+    # connections (1 runs them in sequence), and the shared worker count
+    DB_FANOUT_CONCURRENCY: int = 3
+    DB_FANOUT_WORKERS: int = 8
+
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    DASHBOARD_CACHE_TTL_SECONDS: int = 30
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 10000
+    FINANCIAL_CONTEXT_CACHE_TTL_SECONDS: int = 30
+    FINANCIAL_CONTEXT_CACHE_MAX_ENTRIES: int = 10000
+
+    # Active challenge catalog: in-process cache lifetime and client max-age
+    CHALLENGE_CATALOG_CACHE_TTL_SECONDS: int = 300
+    CHALLENGE_CATALOG_MAX_AGE_SECONDS: int = 60
+
+    # Messages kept per user in chat_messages; older ones go to the archive
+    CHAT_HISTORY_MAX_MESSAGES: int = 500
+
+    # Import and mount each router on the first request to its prefix;
+    # unset means lazily on serverless, eagerly on servers
+    LAZY_ROUTERS: bool | None = None
+
+    # Apply Alembic migrations and seeding at startup when the database is
+    # behind (servers only); otherwise use `python -m app.cli db-setup`
+    SCHEMA_AUTO_APPLY: bool = True
+
+    # Seconds between in-process challenge lifecycle sweeps on servers; 0 disables them
+    CHALLENGE_SWEEP_INTERVAL_SECONDS: int = 3600
+    # Bearer secret for the internal sweep endpoint that Vercel Cron calls on
+    # serverless deployments (Vercel sends it as CRON_SECRET); empty disables it
+    CRON_SECRET: str = ""
+
+    # Empty values in .env.example mean "use the default"
+    model_config = {"env_file": ".env", "extra": "ignore", "env_ignore_empty": True}
+
+    @property
+    def is_serverless(self) -> bool:
+        return self.DEPLOYMENT_TARGET == "serverless"
+
+    @property
+    def db_pool_mode(self) -> str:
+        if self.DB_POOL_MODE:
+            return self.DB_POOL_MODE
+        return "null" if self.is_serverless else "queue"
+
+    @property
+    def db_pool_pre_ping(self) -> bool:
+        if self.DB_POOL_PRE_PING is not None:
+            return self.DB_POOL_PRE_PING
+        return self.db_pool_mode == "queue"
+
+    @property
+    def lazy_routers(self) -> bool:
+        return self.is_serverless if self.LAZY_ROUTERS is None else self.LAZY_ROUTERS
+
+    @property
+    def async_database_url(self) -> str:
+        if self.ASYNC_DATABASE_URL:
+            return self.ASYNC_DATABASE_URL
+        _, rest = self.DATABASE_URL.split("://", 1)
+        # asyncpg takes ssl=, not libpq's sslmode=
+        return "postgresql+asyncpg://" + rest.replace("sslmode=", "ssl=")
 
 
 settings = Settings()
@@ -1,20 +1,243 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 
 from app.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    poolclass=NullPool,
-)
+
+class PoolMetrics:
+    """Thread-safe counters for connection checkouts and pool wait time."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "wait_total_ms": round(self.wait_total * 1000, 2),
+                "wait_max_ms": round(self.wait_max * 1000, 2),
+                "wait_avg_ms": round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start)
+
+
+def _engine_options() -> dict:
+    if settings.db_pool_mode == "null":
+        # Serverless: each invocation may be the last, so never hold connections
+        return {"poolclass": NullPool, "pool_pre_ping": settings.db_pool_pre_ping}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@event.listens_for(engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    pool_metrics.incr("connects")
+
+
+@event.listens_for(engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool_metrics.incr("checkouts")
+
+
+@event.listens_for(engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    pool_metrics.incr("checkins")
+
+
+def _async_engine_options() -> dict:
+    if settings.db_pool_mode == "null":
+        return {"poolclass": NullPool, "pool_pre_ping": settings.db_pool_pre_ping}
+    # The async engine keeps its default AsyncAdaptedQueuePool
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_ASYNC_ENABLED:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(settings.async_database_url, **_async_engine_options())
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+def get_pool_status() -> dict:
+    status = {
+        "mode": settings.db_pool_mode,
+        "status": engine.pool.status(),
+        **pool_metrics.snapshot(),
+    }
+    if async_engine is not None:
+        status["async_status"] = async_engine.pool.status()
+    return status
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """AsyncSession dependency; only available with DB_ASYNC_ENABLED."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("DB_ASYNC_ENABLED is off; use get_db")
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+class ReadDB:
+    """Runs sync service functions for ``async def`` routes.
+
+    With the async engine the function runs on the AsyncSession's greenlet via
+    ``run_sync``, so no worker thread is held while PostgreSQL responds.
+    Otherwise it runs in the threadpool with a regular Session, exactly as a
+    sync route would.
+    """
+
+    def __init__(self, session) -> None:
+        self._session = session
+
+    async def run(self, fn, *args, **kwargs):
+        if AsyncSessionLocal is not None:
+            return await self._session.run_sync(fn, *args, **kwargs)
+        return await run_in_threadpool(fn, self._session, *args, **kwargs)
+
+
+async def get_read_db():
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as session:
+            yield ReadDB(session)
+        return
+    db = SessionLocal()
+    try:
+        yield ReadDB(db)
+    finally:
+        await run_in_threadpool(db.close)
+
+
+_fanout_executor: ThreadPoolExecutor | None = None
+_fanout_lock = threading.Lock()
+# Helper connections across all requests in this process. One pool slot is
+# left for the requests' own sessions, so fan-out cannot drain the pool and
+# push everyone else into max_overflow or pool_timeout.
+_fanout_permits = threading.BoundedSemaphore(max(settings.DB_POOL_SIZE - 1, 0))
+
+
+def _get_fanout_executor() -> ThreadPoolExecutor:
+    global _fanout_executor
+    with _fanout_lock:
+        if _fanout_executor is None:
+            _fanout_executor = ThreadPoolExecutor(
+                max_workers=settings.DB_FANOUT_WORKERS, thread_name_prefix="db-fanout"
+            )
+        return _fanout_executor
+
+
+def fan_out(db: Session, *tasks: Callable[[Session], Any]) -> list[Any]:
+    """Run independent read-only ``tasks`` and return their results in order.
+
+    Each task receives a session. Up to DB_FANOUT_CONCURRENCY tasks run at
+    once: the calling thread works through the queue on ``db`` while helper
+    threads do the same, each on its own pooled connection. Tasks run on a
+    helper get a session that is closed afterwards, so they must return data
+    that is fully loaded. With NullPool or a limit of 1 the tasks simply run
+    in sequence on ``db``.
+    """
+    limit = min(settings.DB_FANOUT_CONCURRENCY, len(tasks))
+    if limit <= 1 or settings.db_pool_mode == "null":
+        return [task(db) for task in tasks]
+
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    for item in enumerate(tasks):
+        pending.put(item)
+    results: list[Any] = [None] * len(tasks)
+
+    def drain(session: Session) -> None:
+        while True:
+            try:
+                i, task = pending.get_nowait()
+            except queue.Empty:
+                return
+            results[i] = task(session)
+
+    def helper() -> None:
+        try:
+            own = SessionLocal()
+            try:
+                drain(own)
+            finally:
+                own.close()
+        finally:
+            _fanout_permits.release()
+
+    permits = 0
+    while permits < limit - 1 and _fanout_permits.acquire(blocking=False):
+        permits += 1
+    if not permits:
+        return [task(db) for task in tasks]
+
+    executor = _get_fanout_executor()
+    helpers = [executor.submit(helper) for _ in range(permits)]
+    try:
+        drain(db)
+    finally:
+        wait(helpers)
+    for f in helpers:
+        f.result()
+    return results
@@ -1,30 +1,67 @@
+import time
 import uuid
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.models.user import User
-from app.utils.security import decode_token
+from app.services.user_service import UserSnapshot, get_user_snapshot
+from app.utils.cache import TTLCache
+from app.utils.security import InvalidToken, decode_token, hash_token
 
 security = HTTPBearer()
 
+# sha256(access token) -> user id; each entry expires with the token's exp
+_claims_cache = TTLCache(settings.TOKEN_CLAIMS_CACHE_MAX_ENTRIES, settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
 
-def get_current_user(
+
+def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+) -> uuid.UUID:
+    """Verify the access token and return its subject without touching the database.
+
+    Tokens that verified before are answered from a digest-keyed cache until
+    their ``exp``, skipping signature verification on repeat requests.
+    """
     token = credentials.credentials
+    key = hash_token(token)
+    user_id = _claims_cache.get(key)
+    if user_id is not None:
+        return user_id
+
     try:
         payload = decode_token(token)
         if payload.get("type") != "access":
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
         user_id = uuid.UUID(payload["sub"])
-    except (JWTError, ValueError, KeyError):
+        remaining = float(payload["exp"]) - time.time()
+    except (InvalidToken, ValueError, KeyError, TypeError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
 
+    if remaining > 0:
+        _claims_cache.set(key, user_id, ttl_seconds=remaining)
+    return user_id
+
+
+def get_current_user_snapshot(
+    user_id: uuid.UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> UserSnapshot:
+    """Cached read-only view of the user; use for endpoints that only read profile data."""
+    snapshot = get_user_snapshot(db, user_id)
+    if not snapshot:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    return snapshot
+
+
+def get_current_user(
+    user_id: uuid.UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+) -> User:
+    """Session-bound ORM user; use for endpoints that modify the user."""
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
@@ -0,0 +1,60 @@
+import importlib
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Router prefix (below the API root) -> module exposing ``router``
+ROUTER_MODULES = {
+    "/auth": "app.routers.auth",
+    "/users": "app.routers.users",
+    "/expenses": "app.routers.expenses",
+    "/budgets": "app.routers.budgets",
+    "/goals": "app.routers.goals",
+    "/checklist": "app.routers.checklist",
+    "/nudge": "app.routers.nudge",
+    "/dashboard": "app.routers.dashboard",
+    "/challenges": "app.routers.challenges",
+    "/chat": "app.routers.chat",
+    "/internal": "app.routers.internal",
+}
+
+
+def include_router_module(app: FastAPI, module_path: str, api_prefix: str) -> None:
+    module = importlib.import_module(module_path)
+    app.include_router(module.router, prefix=api_prefix)
+    # Regenerate the schema with the new routes on the next /openapi.json
+    app.openapi_schema = None
+
+
+class LazyRouterMiddleware:
+    """Import and mount each router the first time a request hits its prefix.
+
+    A cold start then pays only for the routers it actually serves. The docs
+    and OpenAPI endpoints mount everything first so the schema is complete.
+    """
+
+    def __init__(self, app: ASGIApp, fastapi_app: FastAPI, api_prefix: str, modules: dict[str, str]) -> None:
+        self.app = app
+        self.fastapi_app = fastapi_app
+        self.api_prefix = api_prefix
+        self._pending = dict(modules)
+        self._schema_paths = {fastapi_app.openapi_url, fastapi_app.docs_url, fastapi_app.redoc_url} - {None}
+
+    def _mount(self, prefix: str) -> None:
+        module_path = self._pending.pop(prefix, None)
+        if module_path is not None:
+            include_router_module(self.fastapi_app, module_path, self.api_prefix)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self._pending:
+            path = scope["path"]
+            if path in self._schema_paths:
+                for prefix in list(self._pending):
+                    self._mount(prefix)
+            elif path.startswith(self.api_prefix):
+                rest = path[len(self.api_prefix):]
+                for prefix in list(self._pending):
+                    if rest == prefix or rest.startswith(prefix + "/"):
+                        self._mount(prefix)
+                        break
+        await self.app(scope, receive, send)
@@ -1,11 +1,12 @@
 from app.models.base import Base
 from app.models.user import User, FixedExpense, RefreshToken
-from app.models.expense import Expense
+from app.models.expense import Expense, UserDayCategoryTotal, UserMonthCategoryTotal
 from app.models.goal import Goal, GoalContribution
 from app.models.budget import Budget, BudgetCategory
 from app.models.checklist import UserChecklistItem
-from app.models.challenge import Challenge, UserChallenge, UserBadge
-from app.models.chat import ChatMessage
+from app.models.challenge import Challenge, ChallengeLeaderboardEntry, UserChallenge, UserBadge
+from app.models.chat import ChatMessage, ChatMessageArchive
+from app.models.schema_state import SchemaState
 
 __all__ = [
     "Base",
@@ -13,6 +14,8 @@ __all__ = [
     "FixedExpense",
     "RefreshToken",
     "Expense",
+    "UserMonthCategoryTotal",
+    "UserDayCategoryTotal",
     "Goal",
     "GoalContribution",
     "Budget",
@@ -21,5 +24,8 @@ __all__ = [
     "Challenge",
     "UserChallenge",
     "UserBadge",
+    "ChallengeLeaderboardEntry",
     "ChatMessage",
+    "ChatMessageArchive",
+    "SchemaState",
 ]
@@ -1,5 +1,6 @@
 import enum
 import uuid
+from datetime import datetime
 
 from sqlalchemy import (
     Boolean,
@@ -13,6 +14,7 @@ from sqlalchemy import (
     Numeric,
     String,
     UniqueConstraint,
+    func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -97,3 +99,36 @@ class UserBadge(Base, UUIDMixin, TimestampMixin):
     earned_at: Mapped[str] = mapped_column(DateTime(timezone=True), nullable=False)
 
     challenge = relationship("Challenge", lazy="joined")
+
+
+class ChallengeLeaderboardEntry(Base):
+    """Persisted leaderboard score per participating user-challenge.
+
+    Kept current by leaderboard_service whenever expenses or goal
+    contributions inside an open challenge window are written.
+    """
+
+    __tablename__ = "challenge_leaderboard_entries"
+    __table_args__ = (
+        # Scanned backwards for ORDER BY progress_percent DESC, user_challenge_id DESC
+        Index(
+            "ix_leaderboard_challenge_score",
+            "challenge_id",
+            "progress_percent",
+            "user_challenge_id",
+        ),
+    )
+
+    user_challenge_id: Mapped[uuid.UUID] = mapped_column(
+        GUID, ForeignKey("user_challenges.id", ondelete="CASCADE"), primary_key=True
+    )
+    challenge_id: Mapped[uuid.UUID] = mapped_column(
+        GUID, ForeignKey("challenges.id"), nullable=False
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        GUID, ForeignKey("users.id"), nullable=False
+    )
+    progress_percent: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import GUID, Base, TimestampMixin, UUIDMixin
@@ -8,7 +9,27 @@ from app.models.base import GUID, Base, TimestampMixin, UUIDMixin
 
 class ChatMessage(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Scanned backwards for newest-first history and "load older" cursors
+        Index("ix_chat_messages_user_created_id", "user_id", "created_at", "id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(GUID, ForeignKey("users.id"), nullable=False)
     role: Mapped[str] = mapped_column(String(10), nullable=False)   # "user" | "bot"
     content: Mapped[str] = mapped_column(String(2000), nullable=False)
+
+
+class ChatMessageArchive(Base):
+    """Messages moved out of chat_messages by the retention job."""
+
+    __tablename__ = "chat_message_archive"
+    __table_args__ = (
+        Index("ix_chat_message_archive_user_created", "user_id", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(GUID, primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(GUID, ForeignKey("users.id"), nullable=False)
+    role: Mapped[str] = mapped_column(String(10), nullable=False)
+    content: Mapped[str] = mapped_column(String(2000), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
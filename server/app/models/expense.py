@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import date
 
-from sqlalchemy import Date, Enum, ForeignKey, Index, Numeric, String
+from sqlalchemy import Date, Enum, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import GUID, Base, TimestampMixin, UUIDMixin
@@ -25,8 +25,9 @@ class ExpenseCategory(str, enum.Enum):
 class Expense(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "expenses"
     __table_args__ = (
-        Index("ix_expenses_user_date", "user_id", "date"),
-        Index("ix_expenses_user_category", "user_id", "category"),
+        # Serves month ranges and the (date, created_at, id) keyset ordering
+        Index("ix_expenses_user_date_created_id", "user_id", "date", "created_at", "id"),
+        Index("ix_expenses_user_category_date", "user_id", "category", "date"),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(GUID, ForeignKey("users.id"), nullable=False)
@@ -34,3 +35,28 @@ class Expense(Base, UUIDMixin, TimestampMixin):
     category: Mapped[ExpenseCategory] = mapped_column(Enum(ExpenseCategory), nullable=False)
     description: Mapped[str | None] = mapped_column(String(255), nullable=True)
     date: Mapped[date] = mapped_column(Date, nullable=False)
+
+
+class UserMonthCategoryTotal(Base):
+    """Per-user monthly spend rollup, maintained by expense_service on every write."""
+
+    __tablename__ = "user_month_category_totals"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(GUID, ForeignKey("users.id"), primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    month: Mapped[int] = mapped_column(Integer, primary_key=True)
+    category: Mapped[ExpenseCategory] = mapped_column(Enum(ExpenseCategory), primary_key=True)
+    total: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    expense_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class UserDayCategoryTotal(Base):
+    """Per-user daily spend rollup; the source for weekly/daily analytics series."""
+
+    __tablename__ = "user_day_category_totals"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(GUID, ForeignKey("users.id"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    category: Mapped[ExpenseCategory] = mapped_column(Enum(ExpenseCategory), primary_key=True)
+    total: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    expense_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class SchemaState(Base):
+    """Single-row marker of the seed data version last applied.
+
+    The schema itself is tracked by Alembic in ``alembic_version``.
+    """
+
+    __tablename__ = "schema_state"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    seed_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
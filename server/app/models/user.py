@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -65,8 +66,13 @@ class FixedExpense(Base, UUIDMixin):
 
 class RefreshToken(Base, UUIDMixin):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+        Index("ix_refresh_tokens_user_expires", "user_id", "expires_at"),
+    )
 
-    token: Mapped[str] = mapped_column(String(500), unique=True, nullable=False)
+    # SHA-256 hex digest of the token; the token itself is never stored
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(GUID, ForeignKey("users.id"), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
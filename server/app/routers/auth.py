@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -9,15 +10,15 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=TokenResponse)
-def register(body: RegisterRequest, db: Session = Depends(get_db)):
-    user = register_user(db, body.phone, body.name, body.password)
-    return create_tokens(db, user)
+async def register(body: RegisterRequest, db: Session = Depends(get_db)):
+    user = await register_user(db, body.phone, body.name, body.password)
+    return await run_in_threadpool(create_tokens, db, user)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(body: LoginRequest, db: Session = Depends(get_db)):
-    user = authenticate_user(db, body.phone, body.password)
-    return create_tokens(db, user)
+async def login(body: LoginRequest, db: Session = Depends(get_db)):
+    user = await authenticate_user(db, body.phone, body.password)
+    return await run_in_threadpool(create_tokens, db, user)
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -1,12 +1,12 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.middleware.auth import get_current_user
+from app.config import settings
+from app.database import ReadDB, get_db, get_read_db
+from app.middleware.auth import get_current_user_id
 from app.models.challenge import ChallengeStatus
-from app.models.user import User
 from app.schemas.challenge import (
     ChallengeListResponse,
     LeaderboardResponse,
@@ -15,34 +15,49 @@ from app.schemas.challenge import (
     UserChallengeResponse,
     UserProgressResponse,
 )
+from app.services.challenge_progress_service import calculate_challenge_progress, calculate_progress_batch
 from app.services.challenge_service import (
     abandon_challenge,
-    calculate_challenge_progress,
-    check_and_complete_challenge,
+    get_challenge_catalog,
     get_leaderboard,
     get_user_challenge,
     get_user_progress,
     join_challenge,
-    list_available_challenges,
     list_user_challenges,
 )
 
 router = APIRouter(prefix="/challenges", tags=["challenges"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
 @router.get("", response_model=ChallengeListResponse)
-def get_challenges(db: Session = Depends(get_db)):
-    items, total = list_available_challenges(db)
-    return {"items": items, "total": total}
+def get_challenges(request: Request, db: Session = Depends(get_db)):
+    """Served from the catalog cache; a matching If-None-Match gets 304 with no query."""
+    catalog = get_challenge_catalog(db)
+    headers = {
+        "ETag": catalog.etag,
+        "Cache-Control": f"public, max-age={settings.CHALLENGE_CATALOG_MAX_AGE_SECONDS}",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), catalog.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=catalog.body, media_type="application/json", headers=headers)
 
 
 @router.post("/join", response_model=UserChallengeResponse, status_code=201)
 def post_join_challenge(
     body: UserChallengeCreate,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    uc = join_challenge(db, user.id, body.challenge_id)
+    uc = join_challenge(db, user_id, body.challenge_id)
     progress = calculate_challenge_progress(db, uc)
     return {
         "id": uc.id,
@@ -62,13 +77,13 @@ def post_join_challenge(
 def get_my_challenges(
     status: ChallengeStatus | None = Query(None),
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    items, total = list_user_challenges(db, user.id, status)
+    items, total = list_user_challenges(db, user_id, status)
+    progress_by_id = calculate_progress_batch(db, items)
     result = []
     for uc in items:
-        check_and_complete_challenge(db, uc)
-        progress = calculate_challenge_progress(db, uc)
+        progress = progress_by_id[uc.id]
         result.append(
             {
                 "id": uc.id,
@@ -89,19 +104,18 @@ def get_my_challenges(
 @router.get("/my-progress", response_model=UserProgressResponse)
 def get_progress(
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    return get_user_progress(db, user.id)
+    return get_user_progress(db, user_id)
 
 
 @router.get("/my-challenges/{user_challenge_id}", response_model=UserChallengeResponse)
 def get_my_challenge_detail(
     user_challenge_id: uuid.UUID,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    uc = get_user_challenge(db, user.id, user_challenge_id)
-    check_and_complete_challenge(db, uc)
+    uc = get_user_challenge(db, user_id, user_challenge_id)
     progress = calculate_challenge_progress(db, uc)
     return {
         "id": uc.id,
@@ -118,19 +132,19 @@ def get_my_challenge_detail(
 
 
 @router.get("/{challenge_id}/leaderboard", response_model=LeaderboardResponse)
-def get_challenge_leaderboard(
+async def get_challenge_leaderboard(
     challenge_id: uuid.UUID,
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: ReadDB = Depends(get_read_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    return get_leaderboard(db, challenge_id, user.id, limit)
+    return await db.run(get_leaderboard, challenge_id, user_id, limit)
 
 
 @router.delete("/my-challenges/{user_challenge_id}", status_code=204)
 def delete_my_challenge(
     user_challenge_id: uuid.UUID,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    abandon_challenge(db, user.id, user_challenge_id)
+    abandon_challenge(db, user_id, user_challenge_id)
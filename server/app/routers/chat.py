@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends
+import uuid
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.middleware.auth import get_current_user
-from app.models.user import User
+from app.database import ReadDB, get_db, get_read_db
+from app.middleware.auth import get_current_user_id
 from app.schemas.chat import ChatHistoryResponse, ChatMessageResponse, ChatSendRequest
 from app.services.chat_service import clear_history, get_history, send_message
 
@@ -11,28 +12,29 @@ router = APIRouter(prefix="/chat", tags=["chat"])
 
 
 @router.get("/history", response_model=ChatHistoryResponse)
-def get_chat_history(
-    limit: int = 50,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+async def get_chat_history(
+    limit: int = Query(50, ge=1, le=200),
+    before: str | None = Query(None, description="next_cursor from a previous page, to load older messages"),
+    db: ReadDB = Depends(get_read_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    messages = get_history(db, user.id, limit=limit)
-    return {"messages": messages}
+    messages, next_cursor = await db.run(get_history, user_id, limit=limit, before=before)
+    return {"messages": messages, "next_cursor": next_cursor}
 
 
 @router.post("/send", response_model=list[ChatMessageResponse], status_code=201)
 def post_send_message(
     body: ChatSendRequest,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    user_msg, bot_msg = send_message(db, user.id, body.content)
+    user_msg, bot_msg = send_message(db, user_id, body.content)
     return [user_msg, bot_msg]
 
 
 @router.delete("/history", status_code=204)
 def delete_chat_history(
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    clear_history(db, user.id)
+    clear_history(db, user_id)
@@ -1,14 +1,23 @@
 import uuid
 from datetime import date
+from typing import Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.middleware.auth import get_current_user
+from app.database import ReadDB, get_db, get_read_db
+from app.middleware.auth import get_current_user_id
 from app.models.expense import ExpenseCategory
-from app.models.user import User
-from app.schemas.expense import ExpenseCreate, ExpenseListResponse, ExpenseResponse, ExpenseUpdate, MonthlySummary
+from app.schemas.expense import (
+    ExpenseBulkResult,
+    ExpenseCreate,
+    ExpenseListResponse,
+    ExpenseResponse,
+    ExpenseUpdate,
+    MonthlySummary,
+    SpendingSeries,
+)
 from app.services.expense_service import (
     create_expense,
     delete_expense,
@@ -17,59 +26,126 @@ from app.services.expense_service import (
     list_expenses,
     update_expense,
 )
+from app.services.analytics_service import get_spending_series
+from app.services.expense_export_service import stream_expenses_csv, stream_expenses_ndjson
+from app.services.expense_import_service import import_expenses
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
 
 
 @router.get("", response_model=ExpenseListResponse)
-def get_expenses(
+async def get_expenses(
     month: int | None = Query(None, ge=1, le=12),
     year: int | None = Query(None, ge=2020),
     category: ExpenseCategory | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    cursor: str | None = Query(None, description="next_cursor from a previous page; overrides page"),
+    include_total: bool | None = Query(None, description="Defaults to true in page mode, false with a cursor"),
+    db: ReadDB = Depends(get_read_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    items, total = list_expenses(db, user.id, month, year, category, page, page_size)
-    return {"items": items, "total": total, "page": page, "page_size": page_size}
+    if include_total is None:
+        include_total = cursor is None
+    items, total, next_cursor = await db.run(
+        list_expenses, user_id, month, year, category, page, page_size, cursor=cursor, include_total=include_total
+    )
+    return {"items": items, "total": total, "page": page, "page_size": page_size, "next_cursor": next_cursor}
 
 
 @router.post("", response_model=ExpenseResponse, status_code=201)
-def post_expense(body: ExpenseCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return create_expense(db, user.id, body)
+def post_expense(body: ExpenseCreate, db: Session = Depends(get_db), user_id: uuid.UUID = Depends(get_current_user_id)):
+    return create_expense(db, user_id, body)
+
+
+@router.post("/bulk", response_model=ExpenseBulkResult)
+async def post_expenses_bulk(
+    request: Request,
+    db: Session = Depends(get_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
+):
+    """Import many expenses from a streamed body.
+
+    Send ``text/csv`` (header row of amount,category,description,date) or
+    ``application/x-ndjson`` (one ExpenseCreate object per line).
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type == "text/csv":
+        fmt = "csv"
+    elif content_type in ("application/x-ndjson", "application/jsonl"):
+        fmt = "ndjson"
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Use text/csv or application/x-ndjson",
+        )
+    return await import_expenses(db, user_id, request.stream(), fmt)
 
 
 @router.get("/summary/monthly", response_model=MonthlySummary)
-def get_summary(
+async def get_summary(
     month: int = Query(..., ge=1, le=12),
     year: int = Query(..., ge=2020),
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: ReadDB = Depends(get_read_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    return get_monthly_summary(db, user.id, month, year)
+    return await db.run(get_monthly_summary, user_id, month, year)
 
 
 @router.get("/summary/breakdown", response_model=MonthlySummary)
-def get_breakdown(
+async def get_breakdown(
     month: int = Query(..., ge=1, le=12),
     year: int = Query(..., ge=2020),
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: ReadDB = Depends(get_read_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
+):
+    return await db.run(get_monthly_summary, user_id, month, year)
+
+
+@router.get("/analytics/series", response_model=SpendingSeries)
+async def get_series(
+    start_date: date,
+    end_date: date,
+    granularity: Literal["day", "week", "month"] = "month",
+    db: ReadDB = Depends(get_read_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
+):
+    return await db.run(get_spending_series, user_id, start_date, end_date, granularity)
+
+
+@router.get("/export")
+def export_expenses(
+    format: Literal["csv", "ndjson"] = "csv",
+    start_date: date | None = None,
+    end_date: date | None = None,
+    category: ExpenseCategory | None = None,
+    user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    return get_monthly_summary(db, user.id, month, year)
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date is after end_date")
+    if format == "csv":
+        body = stream_expenses_csv(user_id, start_date, end_date, category)
+        media_type = "text/csv"
+    else:
+        body = stream_expenses_ndjson(user_id, start_date, end_date, category)
+        media_type = "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="expenses.{format}"'},
+    )
 
 
 @router.get("/{expense_id}", response_model=ExpenseResponse)
-def get_single(expense_id: uuid.UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return get_expense(db, user.id, expense_id)
+def get_single(expense_id: uuid.UUID, db: Session = Depends(get_db), user_id: uuid.UUID = Depends(get_current_user_id)):
+    return get_expense(db, user_id, expense_id)
 
 
 @router.patch("/{expense_id}", response_model=ExpenseResponse)
-def patch_expense(expense_id: uuid.UUID, body: ExpenseUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return update_expense(db, user.id, expense_id, body)
+def patch_expense(expense_id: uuid.UUID, body: ExpenseUpdate, db: Session = Depends(get_db), user_id: uuid.UUID = Depends(get_current_user_id)):
+    return update_expense(db, user_id, expense_id, body)
 
 
 @router.delete("/{expense_id}", status_code=204)
-def del_expense(expense_id: uuid.UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    delete_expense(db, user.id, expense_id)
+def del_expense(expense_id: uuid.UUID, db: Session = Depends(get_db), user_id: uuid.UUID = Depends(get_current_user_id)):
+    delete_expense(db, user_id, expense_id)
@@ -0,0 +1,24 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_db
+from app.services.challenge_lifecycle_service import sweep_challenges
+
+router = APIRouter(prefix="/internal", tags=["internal"], include_in_schema=False)
+
+
+def require_cron_secret(authorization: str | None = Header(None)) -> None:
+    """Scheduled jobs authenticate with ``Authorization: Bearer <CRON_SECRET>``."""
+    if not settings.CRON_SECRET:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not hmac.compare_digest(authorization or "", f"Bearer {settings.CRON_SECRET}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid cron secret")
+
+
+@router.get("/challenges/sweep", dependencies=[Depends(require_cron_secret)])
+def run_challenge_sweep(db: Session = Depends(get_db)):
+    """Settle finished challenges where no in-process sweeper runs (Vercel Cron issues a GET)."""
+    return sweep_challenges(db)
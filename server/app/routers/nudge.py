@@ -1,10 +1,11 @@
+import uuid
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.middleware.auth import get_current_user
-from app.models.user import User
-from app.schemas.nudge import NudgeCheckRequest, NudgeCheckResponse
+from app.middleware.auth import get_current_user_id
+from app.schemas.nudge import NudgeBatchRequest, NudgeBatchResponse, NudgeCheckRequest, NudgeCheckResponse
 from app.services import nudge_service
 
 router = APIRouter(prefix="/nudge", tags=["nudge"])
@@ -13,7 +14,17 @@ router = APIRouter(prefix="/nudge", tags=["nudge"])
 @router.post("/check", response_model=NudgeCheckResponse)
 def check_nudge(
     data: NudgeCheckRequest,
-    user: User = Depends(get_current_user),
+    user_id: uuid.UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    return nudge_service.evaluate_spend(db, user_id, data.amount, data.category)
+
+
+@router.post("/check-batch", response_model=NudgeBatchResponse)
+def check_nudge_batch(
+    data: NudgeBatchRequest,
+    user_id: uuid.UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    return nudge_service.evaluate_spend(db, user.id, data.amount, data.category)
+    candidates = [(item.amount, item.category) for item in data.items]
+    return {"results": nudge_service.evaluate_spend_batch(db, user_id, candidates)}
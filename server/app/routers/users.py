@@ -1,11 +1,20 @@
+from dataclasses import asdict
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.middleware.auth import get_current_user
+from app.middleware.auth import get_current_user, get_current_user_snapshot
 from app.models.user import User
 from app.schemas.user import DependentUpdate, FixedExpensesUpdate, IncomeUpdate, UserResponse, UserUpdate
-from app.services.user_service import complete_onboarding, set_dependents, set_fixed_expenses, set_income, update_profile
+from app.services.user_service import (
+    UserSnapshot,
+    complete_onboarding,
+    set_dependents,
+    set_fixed_expenses,
+    set_income,
+    update_profile,
+)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -17,8 +26,8 @@ def _user_response(user: User) -> dict:
 
 
 @router.get("/me", response_model=UserResponse)
-def get_me(user: User = Depends(get_current_user)):
-    return _user_response(user)
+def get_me(user: UserSnapshot = Depends(get_current_user_snapshot)):
+    return asdict(user)
 
 
 @router.patch("/me", response_model=UserResponse)
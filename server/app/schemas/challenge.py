@@ -65,6 +65,7 @@ class LeaderboardResponse(BaseModel):
     challenge_title: str
     entries: list[LeaderboardEntry]
     total_participants: int
+    current_user_rank: int | None = None
 
 
 class UserBadgeResponse(BaseModel):
@@ -19,3 +19,4 @@ class ChatMessageResponse(BaseModel):
 
 class ChatHistoryResponse(BaseModel):
     messages: list[ChatMessageResponse]
+    next_cursor: str | None = None
@@ -1,19 +1,27 @@
 import uuid
 from datetime import date as date_type
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from app.models.expense import ExpenseCategory
 
 
+def _blank_to_none(value: str | None) -> str | None:
+    # A blank description means none, whether it comes from the JSON API or
+    # an import (where COPY would load an empty field as NULL anyway)
+    return value or None
+
+
 class ExpenseCreate(BaseModel):
     amount: float = Field(gt=0)
     category: ExpenseCategory
     description: str | None = None
     date: date_type
 
+    _normalize_description = field_validator("description")(_blank_to_none)
+
 
 class ExpenseUpdate(BaseModel):
     amount: float | None = Field(None, gt=0)
@@ -21,6 +29,8 @@ class ExpenseUpdate(BaseModel):
     description: str | None = None
     date: Optional[date_type] = None
 
+    _normalize_description = field_validator("description")(_blank_to_none)
+
 
 class ExpenseResponse(BaseModel):
     id: uuid.UUID
@@ -35,9 +45,21 @@ class ExpenseResponse(BaseModel):
 
 class ExpenseListResponse(BaseModel):
     items: list[ExpenseResponse]
-    total: int
+    total: int | None = None
     page: int
     page_size: int
+    next_cursor: str | None = None
+
+
+class BulkRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ExpenseBulkResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: list[BulkRowError]
 
 
 class CategorySummary(BaseModel):
@@ -51,3 +73,16 @@ class MonthlySummary(BaseModel):
     year: int
     total_spent: float
     by_category: list[CategorySummary]
+
+
+class SeriesPoint(BaseModel):
+    period_start: date_type
+    total: float
+    by_category: dict[ExpenseCategory, float]
+
+
+class SpendingSeries(BaseModel):
+    granularity: Literal["day", "week", "month"]
+    start_date: date_type
+    end_date: date_type
+    points: list[SeriesPoint]
@@ -35,6 +35,14 @@ class NudgeCheckResponse(BaseModel):
     adjustment_options: list[AdjustmentOption] = []
 
 
+class NudgeBatchRequest(BaseModel):
+    items: list[NudgeCheckRequest] = Field(min_length=1, max_length=50)
+
+
+class NudgeBatchResponse(BaseModel):
+    results: list[NudgeCheckResponse]
+
+
 class NudgeConfirmRequest(BaseModel):
     amount: float = Field(gt=0)
     category: ExpenseCategory
@@ -0,0 +1,129 @@
+import uuid
+from datetime import date, timedelta
+from typing import Literal
+
+from fastapi import HTTPException, status
+from sqlalchemy import Date, cast, func, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.expense import ExpenseCategory, UserDayCategoryTotal, UserMonthCategoryTotal
+from app.utils.date_ranges import month_bounds
+
+Granularity = Literal["day", "week", "month"]
+MAX_SERIES_POINTS = 1500
+
+
+def _bucket_start(day: date, granularity: Granularity) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(start: date, granularity: Granularity) -> date:
+    if granularity == "day":
+        return start + timedelta(days=1)
+    if granularity == "week":
+        return start + timedelta(days=7)
+    return month_bounds(start.month, start.year)[1]
+
+
+def _bucket_starts(start_date: date, end_date: date, granularity: Granularity) -> list[date]:
+    starts = []
+    current = _bucket_start(start_date, granularity)
+    while current <= end_date:
+        starts.append(current)
+        if len(starts) > MAX_SERIES_POINTS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Range too large: more than {MAX_SERIES_POINTS} {granularity} buckets",
+            )
+        current = _next_bucket(current, granularity)
+    return starts
+
+
+def _is_whole_months(start_date: date, end_date: date) -> bool:
+    return start_date.day == 1 and (end_date + timedelta(days=1)).day == 1
+
+
+def _monthly_rows(db: Session, user_id: uuid.UUID, start_date: date, end_date: date):
+    """Read whole months straight from the monthly rollup."""
+    return (
+        db.query(
+            UserMonthCategoryTotal.year,
+            UserMonthCategoryTotal.month,
+            UserMonthCategoryTotal.category,
+            UserMonthCategoryTotal.total,
+        )
+        .filter(
+            UserMonthCategoryTotal.user_id == user_id,
+            tuple_(UserMonthCategoryTotal.year, UserMonthCategoryTotal.month)
+            >= tuple_(start_date.year, start_date.month),
+            tuple_(UserMonthCategoryTotal.year, UserMonthCategoryTotal.month)
+            <= tuple_(end_date.year, end_date.month),
+            UserMonthCategoryTotal.expense_count > 0,
+        )
+        .all()
+    )
+
+
+def _daily_rows(db: Session, user_id: uuid.UUID, start_date: date, end_date: date, granularity: Granularity):
+    """Group the daily rollup into buckets with date_trunc (weeks start on Monday)."""
+    if granularity == "day":
+        bucket = UserDayCategoryTotal.day
+    else:
+        bucket = cast(func.date_trunc(granularity, UserDayCategoryTotal.day), Date)
+    bucket = bucket.label("bucket")
+    return (
+        db.query(bucket, UserDayCategoryTotal.category, func.sum(UserDayCategoryTotal.total).label("total"))
+        .filter(
+            UserDayCategoryTotal.user_id == user_id,
+            UserDayCategoryTotal.day >= start_date,
+            UserDayCategoryTotal.day <= end_date,
+            UserDayCategoryTotal.expense_count > 0,
+        )
+        .group_by(bucket, UserDayCategoryTotal.category)
+        .all()
+    )
+
+
+def get_spending_series(
+    db: Session,
+    user_id: uuid.UUID,
+    start_date: date,
+    end_date: date,
+    granularity: Granularity,
+) -> dict:
+    """Spend per bucket and category over ``[start_date, end_date]`` in one query.
+
+    Monthly series over whole months read the monthly rollup; everything else
+    groups the daily rollup. Empty buckets are returned as zero.
+    """
+    if start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date is after end_date")
+
+    starts = _bucket_starts(start_date, end_date, granularity)
+    by_bucket: dict[date, dict[ExpenseCategory, float]] = {s: {} for s in starts}
+
+    if granularity == "month" and _is_whole_months(start_date, end_date):
+        for r in _monthly_rows(db, user_id, start_date, end_date):
+            by_bucket[date(r.year, r.month, 1)][r.category] = float(r.total)
+    else:
+        for r in _daily_rows(db, user_id, start_date, end_date, granularity):
+            by_bucket[r.bucket][r.category] = float(r.total)
+
+    points = [
+        {
+            "period_start": s,
+            "total": round(sum(cats.values()), 2),
+            "by_category": cats,
+        }
+        for s, cats in by_bucket.items()
+    ]
+    return {
+        "granularity": granularity,
+        "start_date": start_date,
+        "end_date": end_date,
+        "points": points,
+    }
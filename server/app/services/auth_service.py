@@ -1,25 +1,51 @@
-from datetime import datetime, timezone
+import uuid
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.models.checklist import ChecklistItemType, ChecklistStatus, UserChecklistItem
 from app.models.user import RefreshToken, User
 from app.utils.security import (
+    PasswordHasherBusy,
     create_access_token,
     create_refresh_token,
     decode_token,
     hash_password,
+    hash_token,
+    password_needs_rehash,
     verify_password,
 )
 
+PURGE_BATCH_SIZE = 5000
+
+
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in attempts right now, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _phone_taken(db: Session, phone: str) -> bool:
+    taken = db.query(User.id).filter(User.phone == phone).first() is not None
+    # End the read so the connection goes back to the pool while bcrypt runs
+    db.rollback()
+    return taken
 
-def register_user(db: Session, phone: str, name: str, password: str) -> User:
-    existing = db.query(User).filter(User.phone == phone).first()
-    if existing:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Phone number already registered")
 
-    user = User(phone=phone, name=name, password_hash=hash_password(password))
+def _find_credentials(db: Session, phone: str):
+    """(id, password_hash) for the phone, or None. Releases the connection like ``_phone_taken``."""
+    row = db.execute(select(User.id, User.password_hash).where(User.phone == phone)).first()
+    db.rollback()
+    return row
+
+
+def _create_user(db: Session, phone: str, name: str, password_hash: str) -> User:
+    user = User(phone=phone, name=name, password_hash=password_hash)
     db.add(user)
     db.flush()
 
@@ -32,52 +58,137 @@ def register_user(db: Session, phone: str, name: str, password: str) -> User:
     return user
 
 
-def authenticate_user(db: Session, phone: str, password: str) -> User:
-    user = db.query(User).filter(User.phone == phone).first()
-    if not user or not verify_password(password, user.password_hash):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid phone or password")
+def _signed_in_user(db: Session, user_id: uuid.UUID, new_password_hash: str | None) -> User:
+    user = db.get(User, user_id)
+    if new_password_hash:
+        # Persisted by the commit in create_tokens
+        user.password_hash = new_password_hash
     return user
 
 
+# register_user and authenticate_user are awaited from async routes: the
+# database work goes to the threadpool and bcrypt to its own pool, and no
+# request thread or pooled connection is held while a hash is computed.
+
+async def register_user(db: Session, phone: str, name: str, password: str) -> User:
+    if await run_in_threadpool(_phone_taken, db, phone):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Phone number already registered")
+
+    try:
+        password_hash = await hash_password(password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+    return await run_in_threadpool(_create_user, db, phone, name, password_hash)
+
+
+async def authenticate_user(db: Session, phone: str, password: str) -> User:
+    credentials = await run_in_threadpool(_find_credentials, db, phone)
+    try:
+        verified = credentials is not None and await verify_password(password, credentials.password_hash)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+    if not verified:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid phone or password")
+
+    new_password_hash = None
+    if password_needs_rehash(credentials.password_hash):
+        try:
+            new_password_hash = await hash_password(password)
+        except PasswordHasherBusy:
+            # The upgrade is optional; the next login tries again
+            pass
+    return await run_in_threadpool(_signed_in_user, db, credentials.id, new_password_hash)
+
+
+def _issue_refresh_token(db: Session, user_id: uuid.UUID) -> str:
+    """Store a new refresh token and revoke the user's oldest beyond the cap. The caller commits."""
+    refresh_token, expires_at = create_refresh_token(user_id)
+    db.add(RefreshToken(token_hash=hash_token(refresh_token), user_id=user_id, expires_at=expires_at))
+    db.flush()
+
+    # Every token has the same lifetime, so the latest expiry is the newest token
+    beyond_cap = (
+        select(RefreshToken.id)
+        .where(RefreshToken.user_id == user_id)
+        .order_by(RefreshToken.expires_at.desc())
+        .offset(settings.MAX_REFRESH_TOKENS_PER_USER)
+    )
+    db.execute(
+        delete(RefreshToken).where(RefreshToken.id.in_(beyond_cap)),
+        execution_options={"synchronize_session": False},
+    )
+    return refresh_token
+
+
 def create_tokens(db: Session, user: User) -> dict:
     access_token = create_access_token(user.id)
-    refresh_token, expires_at = create_refresh_token(user.id)
-
-    db_token = RefreshToken(token=refresh_token, user_id=user.id, expires_at=expires_at)
-    db.add(db_token)
+    refresh_token = _issue_refresh_token(db, user.id)
     db.commit()
 
     return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
 
 
 def refresh_access_token(db: Session, refresh_token: str) -> dict:
-    db_token = db.query(RefreshToken).filter(RefreshToken.token == refresh_token).first()
-    if not db_token:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
-
-    if db_token.expires_at.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc):
-        db.delete(db_token)
-        db.commit()
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired")
+    """Rotate a refresh token with a single conditional UPDATE.
 
+    The token's signature, expiry and type are checked without the database;
+    the UPDATE then swaps the stored digest only if the presented token is
+    still outstanding, so a token can be redeemed at most once.
+    """
     try:
         payload = decode_token(refresh_token)
-        if payload.get("type") != "refresh":
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
+        user_id = uuid.UUID(payload["sub"])
     except Exception:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    if payload.get("type") != "refresh":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
+
+    new_refresh_token, new_expires_at = create_refresh_token(user_id)
+    rotated = db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == hash_token(refresh_token),
+            RefreshToken.user_id == user_id,
+            RefreshToken.expires_at > func.now(),
+        )
+        .values(token_hash=hash_token(new_refresh_token), expires_at=new_expires_at)
+        .returning(RefreshToken.id),
+        execution_options={"synchronize_session": False},
+    ).first()
+    if rotated is None:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    db.commit()
 
-    user = db.query(User).filter(User.id == db_token.user_id).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-
-    # Rotate refresh token
-    db.delete(db_token)
-    return create_tokens(db, user)
+    return {
+        "access_token": create_access_token(user_id),
+        "refresh_token": new_refresh_token,
+        "token_type": "bearer",
+    }
 
 
 def logout_user(db: Session, refresh_token: str) -> None:
-    db_token = db.query(RefreshToken).filter(RefreshToken.token == refresh_token).first()
-    if db_token:
-        db.delete(db_token)
+    db.query(RefreshToken).filter(
+        RefreshToken.token_hash == hash_token(refresh_token)
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+def purge_refresh_tokens(db: Session, batch_size: int = PURGE_BATCH_SIZE) -> int:
+    """Delete expired refresh tokens in batches, committing each. Returns rows deleted."""
+    purged = 0
+    while True:
+        expired = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < func.now())
+            .limit(batch_size)
+        )
+        deleted = db.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(expired)),
+            execution_options={"synchronize_session": False},
+        ).rowcount
         db.commit()
+        purged += deleted
+        if deleted < batch_size:
+            return purged
@@ -1,11 +1,12 @@
 import uuid
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.budget import Budget, BudgetCategory
 from app.schemas.budget import BudgetCategoriesUpdate, BudgetCreate
-from app.services.expense_service import get_category_spend
+from app.services.financial_context_service import invalidate_financial_context
+from app.services.rollup_service import month_totals_by_category
 
 
 def create_budget(db: Session, user_id: uuid.UUID, data: BudgetCreate) -> Budget:
@@ -20,6 +21,7 @@ def create_budget(db: Session, user_id: uuid.UUID, data: BudgetCreate) -> Budget
     budget = Budget(user_id=user_id, month=data.month, year=data.year, total_income=data.total_income)
     db.add(budget)
     db.commit()
+    invalidate_financial_context(user_id)
     db.refresh(budget)
     return budget
 
@@ -27,6 +29,7 @@ def create_budget(db: Session, user_id: uuid.UUID, data: BudgetCreate) -> Budget
 def get_current_budget(db: Session, user_id: uuid.UUID, month: int, year: int) -> Budget | None:
     return (
         db.query(Budget)
+        .options(selectinload(Budget.categories))
         .filter(Budget.user_id == user_id, Budget.month == month, Budget.year == year)
         .first()
     )
@@ -46,14 +49,17 @@ def set_budget_categories(db: Session, user_id: uuid.UUID, budget_id: uuid.UUID,
             allocated_amount=cat.allocated_amount,
         ))
     db.commit()
+    invalidate_financial_context(user_id)
     db.refresh(budget)
     return budget
 
 
 def enrich_budget(db: Session, budget: Budget) -> dict:
+    # One lookup for every category's spend instead of a SUM per category
+    spend = month_totals_by_category(db, budget.user_id, budget.month, budget.year)
     categories = []
     for bc in budget.categories:
-        spent = get_category_spend(db, budget.user_id, bc.category, budget.month, budget.year)
+        spent = spend.get(bc.category, 0.0)
         categories.append({
             "category": bc.category,
             "allocated_amount": float(bc.allocated_amount),
@@ -67,14 +73,3 @@ def enrich_budget(db: Session, budget: Budget) -> dict:
         "total_income": float(budget.total_income),
         "categories": categories,
     }
-
-
-def get_category_allocation(db: Session, user_id: uuid.UUID, category: str, month: int, year: int) -> float:
-    budget = get_current_budget(db, user_id, month, year)
-    if not budget:
-        return 0.0
-    bc = db.query(BudgetCategory).filter(
-        BudgetCategory.budget_id == budget.id,
-        BudgetCategory.category == category,
-    ).first()
-    return float(bc.allocated_amount) if bc else 0.0
@@ -0,0 +1,136 @@
+import uuid
+from datetime import date, datetime, timezone
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.challenge import (
+    BadgeType,
+    ChallengeLeaderboardEntry,
+    ChallengeStatus,
+    UserBadge,
+    UserChallenge,
+)
+from app.services.challenge_progress_service import calculate_progress_batch
+from app.services.financial_context_service import invalidate_financial_context
+from app.services.leaderboard_service import upsert_entries
+
+SWEEP_CHUNK_SIZE = 500
+
+
+def sweep_challenges(db: Session, today: date | None = None) -> dict:
+    """Move finished ACTIVE challenges to COMPLETED/FAILED, award badges and rescore leaderboards.
+
+    Works through active challenges in chunks; each chunk is scored with one
+    batched progress calculation and settled with set-based UPDATE/INSERT
+    statements, then committed. The same scores refresh the stored
+    leaderboard entries, which otherwise only change on the user's own
+    writes and go stale as days pass or other paths touch the data.
+    """
+    today = today or date.today()
+    active_ids = [
+        uc_id
+        for (uc_id,) in db.query(UserChallenge.id)
+        .filter(UserChallenge.status == ChallengeStatus.ACTIVE)
+        .order_by(UserChallenge.id)
+        .all()
+    ]
+
+    completed_total = 0
+    failed_total = 0
+    for i in range(0, len(active_ids), SWEEP_CHUNK_SIZE):
+        chunk = (
+            db.query(UserChallenge)
+            .filter(UserChallenge.id.in_(active_ids[i:i + SWEEP_CHUNK_SIZE]))
+            .all()
+        )
+        progress_by_id = calculate_progress_batch(db, chunk)
+
+        completed = [uc for uc in chunk if progress_by_id[uc.id]["is_completed"]]
+        failed_ids = [
+            uc.id for uc in chunk
+            if not progress_by_id[uc.id]["is_completed"] and today > uc.end_date
+        ]
+
+        completed_ids = _mark_completed(db, completed)
+        settled_failed_ids = _mark_failed(db, failed_ids)
+        ranked = [uc for uc in chunk if uc.id not in failed_ids]
+        upsert_entries(db, ranked, progress_by_id)
+        db.commit()
+        settled = completed_ids | settled_failed_ids
+        for user_id in {uc.user_id for uc in chunk if uc.id in settled}:
+            invalidate_financial_context(user_id)
+
+        completed_total += len(completed_ids)
+        failed_total += len(settled_failed_ids)
+
+    return {"checked": len(active_ids), "completed": completed_total, "failed": failed_total}
+
+
+def _mark_completed(db: Session, user_challenges: list[UserChallenge]) -> set[uuid.UUID]:
+    """Complete the rows that are still ACTIVE and badge their users; returns the ids completed here.
+
+    A row settled or abandoned since the chunk was read is left alone and
+    earns no badge from this sweep.
+    """
+    if not user_challenges:
+        return set()
+    now = datetime.now(timezone.utc)
+    completed_ids = set(
+        db.execute(
+            update(UserChallenge)
+            .where(
+                UserChallenge.id.in_([uc.id for uc in user_challenges]),
+                UserChallenge.status == ChallengeStatus.ACTIVE,
+            )
+            .values(status=ChallengeStatus.COMPLETED, completed_at=now)
+            .returning(UserChallenge.id),
+            execution_options={"synchronize_session": False},
+        ).scalars()
+    )
+    if not completed_ids:
+        return completed_ids
+
+    # One badge per (user, badge type); the unique constraint absorbs repeats.
+    badges: dict[tuple[uuid.UUID, BadgeType], dict] = {}
+    for uc in user_challenges:
+        if uc.id not in completed_ids:
+            continue
+        key = (uc.user_id, uc.challenge.badge_type)
+        badges.setdefault(key, {
+            "id": uuid.uuid4(),
+            "user_id": uc.user_id,
+            "badge_type": uc.challenge.badge_type,
+            "challenge_id": uc.challenge_id,
+            "earned_at": now,
+        })
+    db.execute(
+        insert(UserBadge)
+        .values(list(badges.values()))
+        .on_conflict_do_nothing(index_elements=["user_id", "badge_type"])
+    )
+    return completed_ids
+
+
+def _mark_failed(db: Session, user_challenge_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+    """Fail the rows that are still ACTIVE and drop their leaderboard entries; returns the ids failed here."""
+    if not user_challenge_ids:
+        return set()
+    failed_ids = set(
+        db.execute(
+            update(UserChallenge)
+            .where(
+                UserChallenge.id.in_(user_challenge_ids),
+                UserChallenge.status == ChallengeStatus.ACTIVE,
+            )
+            .values(status=ChallengeStatus.FAILED)
+            .returning(UserChallenge.id),
+            execution_options={"synchronize_session": False},
+        ).scalars()
+    )
+    if failed_ids:
+        db.query(ChallengeLeaderboardEntry).filter(
+            ChallengeLeaderboardEntry.user_challenge_id.in_(failed_ids)
+        ).delete(synchronize_session=False)
+    return failed_ids
@@ -0,0 +1,218 @@
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import Integer, and_, cast, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.challenge import Challenge, ChallengeType, UserChallenge
+from app.models.expense import Expense
+from app.models.goal import GoalContribution
+
+
+def _progress_from_metrics(user_challenge: UserChallenge, metrics: dict, today: date) -> dict:
+    """Turn raw per-challenge metrics (saved/spent/count/streak) into a progress dict."""
+    challenge = user_challenge.challenge
+    end = user_challenge.end_date
+
+    progress_percent = 0.0
+    current_value = 0.0
+    target_value = float(challenge.target_amount or challenge.duration_days)
+    is_completed = False
+
+    if challenge.challenge_type == ChallengeType.SAVINGS:
+        current_value = float(metrics.get("saved", 0))
+        target_value = float(challenge.target_amount or 0)
+        if target_value > 0:
+            progress_percent = min(100, (current_value / target_value) * 100)
+        is_completed = current_value >= target_value
+
+    elif challenge.challenge_type == ChallengeType.SPENDING_LIMIT:
+        spent = float(metrics.get("spent", 0))
+        current_value = spent
+        target_value = float(challenge.target_amount or 0)
+        if target_value > 0:
+            progress_percent = max(0, 100 - (spent / target_value) * 100)
+        is_completed = today >= end and spent <= target_value
+
+    elif challenge.challenge_type == ChallengeType.NO_SPEND:
+        count = int(metrics.get("count", 0))
+        current_value = float(count)
+        target_value = 0.0
+        progress_percent = 100.0 if count == 0 else 0.0
+        is_completed = today >= end and count == 0
+
+    elif challenge.challenge_type == ChallengeType.STREAK:
+        consecutive = int(metrics.get("streak", 0))
+        current_value = float(consecutive)
+        target_value = float(challenge.duration_days)
+        if target_value > 0:
+            progress_percent = min(100, (consecutive / target_value) * 100)
+        is_completed = consecutive >= challenge.duration_days
+
+    return {
+        "progress_percent": round(progress_percent, 1),
+        "current_value": round(current_value, 2),
+        "target_value": round(target_value, 2),
+        "is_completed": is_completed,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Single user-challenge (reference implementation)
+# ---------------------------------------------------------------------------
+
+def calculate_challenge_progress(
+    db: Session, user_challenge: UserChallenge
+) -> dict:
+    challenge = user_challenge.challenge
+    start = user_challenge.start_date
+    today = date.today()
+    effective_end = min(today, user_challenge.end_date)
+    metrics: dict = {}
+
+    if challenge.challenge_type == ChallengeType.SAVINGS:
+        metrics["saved"] = (
+            db.query(func.coalesce(func.sum(GoalContribution.amount), 0))
+            .filter(
+                GoalContribution.user_id == user_challenge.user_id,
+                GoalContribution.date >= start,
+                GoalContribution.date <= effective_end,
+            )
+            .scalar()
+        )
+
+    elif challenge.challenge_type in (ChallengeType.SPENDING_LIMIT, ChallengeType.NO_SPEND):
+        query = (
+            db.query(func.coalesce(func.sum(Expense.amount), 0), func.count(Expense.id))
+            .filter(
+                Expense.user_id == user_challenge.user_id,
+                Expense.date >= start,
+                Expense.date <= effective_end,
+            )
+        )
+        if challenge.target_category:
+            query = query.filter(Expense.category == challenge.target_category)
+        metrics["spent"], metrics["count"] = query.one()
+
+    elif challenge.challenge_type == ChallengeType.STREAK:
+        dates = (
+            db.query(Expense.date)
+            .filter(
+                Expense.user_id == user_challenge.user_id,
+                Expense.date >= start,
+                Expense.date <= effective_end,
+            )
+            .distinct()
+            .order_by(Expense.date.asc())
+            .all()
+        )
+        metrics["streak"] = _count_consecutive_days(sorted({d[0] for d in dates}), start)
+
+    return _progress_from_metrics(user_challenge, metrics, today)
+
+
+def _count_consecutive_days(expense_dates: list[date], start_date: date) -> int:
+    if not expense_dates:
+        return 0
+    consecutive = 0
+    expected = start_date
+    for d in expense_dates:
+        if d == expected:
+            consecutive += 1
+            expected = d + timedelta(days=1)
+        elif d > expected:
+            break
+    return consecutive
+
+
+# ---------------------------------------------------------------------------
+# Set-based progress for many user-challenges
+# ---------------------------------------------------------------------------
+
+def calculate_progress_batch(
+    db: Session, user_challenges: list[UserChallenge]
+) -> dict[uuid.UUID, dict]:
+    """Progress for many user-challenges in at most three grouped queries.
+
+    Returns a map of ``UserChallenge.id`` to the same dict
+    ``calculate_challenge_progress`` produces.
+    """
+    today = date.today()
+    by_type: dict[ChallengeType, list[uuid.UUID]] = {}
+    for uc in user_challenges:
+        by_type.setdefault(uc.challenge.challenge_type, []).append(uc.id)
+
+    metrics: dict[uuid.UUID, dict] = {uc.id: {} for uc in user_challenges}
+    effective_end = func.least(UserChallenge.end_date, today)
+
+    savings_ids = by_type.get(ChallengeType.SAVINGS, [])
+    if savings_ids:
+        rows = db.execute(
+            select(UserChallenge.id, func.coalesce(func.sum(GoalContribution.amount), 0))
+            .outerjoin(GoalContribution, and_(
+                GoalContribution.user_id == UserChallenge.user_id,
+                GoalContribution.date >= UserChallenge.start_date,
+                GoalContribution.date <= effective_end,
+            ))
+            .where(UserChallenge.id.in_(savings_ids))
+            .group_by(UserChallenge.id)
+        )
+        for uc_id, saved in rows:
+            metrics[uc_id]["saved"] = saved
+
+    expense_ids = by_type.get(ChallengeType.SPENDING_LIMIT, []) + by_type.get(ChallengeType.NO_SPEND, [])
+    if expense_ids:
+        rows = db.execute(
+            select(UserChallenge.id, func.coalesce(func.sum(Expense.amount), 0), func.count(Expense.id))
+            .join(Challenge, Challenge.id == UserChallenge.challenge_id)
+            .outerjoin(Expense, and_(
+                Expense.user_id == UserChallenge.user_id,
+                Expense.date >= UserChallenge.start_date,
+                Expense.date <= effective_end,
+                or_(Challenge.target_category.is_(None), Expense.category == Challenge.target_category),
+            ))
+            .where(UserChallenge.id.in_(expense_ids))
+            .group_by(UserChallenge.id)
+        )
+        for uc_id, spent, count in rows:
+            metrics[uc_id]["spent"] = spent
+            metrics[uc_id]["count"] = count
+
+    streak_ids = by_type.get(ChallengeType.STREAK, [])
+    if streak_ids:
+        for uc_id, streak in db.execute(_streak_query(streak_ids, today)):
+            metrics[uc_id]["streak"] = streak
+
+    return {uc.id: _progress_from_metrics(uc, metrics[uc.id], today) for uc in user_challenges}
+
+
+def _streak_query(user_challenge_ids: list[uuid.UUID], today: date):
+    # Gaps-and-islands: for distinct expense days ordered per challenge,
+    # day - row_number() is constant across a run of consecutive days. The run
+    # that starts on start_date has island == start_date - 1.
+    days = (
+        select(
+            UserChallenge.id.label("uc_id"),
+            UserChallenge.start_date.label("start_date"),
+            Expense.date.label("day"),
+        )
+        .join(Expense, and_(
+            Expense.user_id == UserChallenge.user_id,
+            Expense.date >= UserChallenge.start_date,
+            Expense.date <= func.least(UserChallenge.end_date, today),
+        ))
+        .where(UserChallenge.id.in_(user_challenge_ids))
+        .distinct()
+        .subquery()
+    )
+    row_number = func.row_number().over(partition_by=days.c.uc_id, order_by=days.c.day)
+    islands = select(
+        days.c.uc_id,
+        days.c.start_date,
+        (days.c.day - cast(row_number, Integer)).label("island"),
+    ).subquery()
+    return (
+        select(islands.c.uc_id, func.count())
+        .where(islands.c.island == islands.c.start_date - 1)
+        .group_by(islands.c.uc_id)
+    )
@@ -1,27 +1,91 @@
+import hashlib
+import threading
 import uuid
-from datetime import date, datetime, timedelta, timezone
+from dataclasses import dataclass
+from datetime import date, timedelta
 
 from fastapi import HTTPException, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session, object_session
 
-from app.models.challenge import (
-    BadgeType,
-    Challenge,
-    ChallengeStatus,
-    ChallengeType,
-    UserBadge,
-    UserChallenge,
-)
-from app.models.expense import Expense
-from app.models.goal import GoalContribution
+from app.config import settings
+from app.database import fan_out
+from app.models.challenge import Challenge, ChallengeStatus, UserBadge, UserChallenge
+from app.schemas.challenge import ChallengeListResponse
+from app.services import leaderboard_service
+from app.services.challenge_progress_service import calculate_progress_batch
+from app.services.financial_context_service import invalidate_financial_context
+from app.utils.cache import TTLCache
 
 
 def list_available_challenges(db: Session) -> tuple[list[Challenge], int]:
-    query = db.query(Challenge).filter(Challenge.is_active == True)
-    total = query.count()
-    items = query.order_by(Challenge.created_at.asc()).all()
-    return items, total
+    items = (
+        db.query(Challenge)
+        .filter(Challenge.is_active == True)
+        .order_by(Challenge.created_at.asc())
+        .all()
+    )
+    return items, len(items)
+
+
+# ---------------------------------------------------------------------------
+# Catalog cache
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ChallengeCatalog:
+    """Serialized active-challenge list with its strong ETag."""
+
+    version: int
+    etag: str
+    body: bytes
+
+
+# catalog version -> ChallengeCatalog; the TTL bounds staleness in other processes
+_catalog_cache = TTLCache(4, settings.CHALLENGE_CATALOG_CACHE_TTL_SECONDS)
+_catalog_version = 0
+_catalog_lock = threading.Lock()
+
+
+def invalidate_challenge_catalog() -> None:
+    global _catalog_version
+    with _catalog_lock:
+        _catalog_version += 1
+    _catalog_cache.clear()
+
+
+def get_challenge_catalog(db: Session) -> ChallengeCatalog:
+    """The active catalog, loaded and serialized once per catalog version."""
+    version = _catalog_version
+    catalog = _catalog_cache.get(version)
+    if catalog is None:
+        items, total = list_available_challenges(db)
+        body = ChallengeListResponse.model_validate({"items": items, "total": total}).model_dump_json().encode()
+        # Content-derived, so every process hands out the same ETag for the same catalog
+        catalog = ChallengeCatalog(version, f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+        _catalog_cache.set(version, catalog)
+    return catalog
+
+
+@event.listens_for(Challenge, "after_insert")
+@event.listens_for(Challenge, "after_update")
+@event.listens_for(Challenge, "after_delete")
+def _mark_catalog_changed(mapper, connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info["challenge_catalog_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_catalog_after_commit(session) -> None:
+    # Only once the change is visible to other sessions
+    if session.info.pop("challenge_catalog_changed", False):
+        invalidate_challenge_catalog()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_change(session) -> None:
+    session.info.pop("challenge_catalog_changed", None)
 
 
 def join_challenge(
@@ -57,7 +121,10 @@ def join_challenge(
         end_date=today + timedelta(days=challenge.duration_days),
     )
     db.add(user_challenge)
+    db.flush()
+    leaderboard_service.upsert_entries(db, [user_challenge])
     db.commit()
+    invalidate_financial_context(user_id)
     db.refresh(user_challenge)
     return user_challenge
 
@@ -90,158 +157,6 @@ def get_user_challenge(
     return uc
 
 
-def calculate_challenge_progress(
-    db: Session, user_challenge: UserChallenge
-) -> dict:
-    challenge = user_challenge.challenge
-    start = user_challenge.start_date
-    today = date.today()
-    end = user_challenge.end_date
-    effective_end = min(today, end)
-
-    progress_percent = 0.0
-    current_value = 0.0
-    target_value = float(challenge.target_amount or challenge.duration_days)
-    is_completed = False
-
-    if challenge.challenge_type == ChallengeType.SAVINGS:
-        saved = (
-            db.query(func.coalesce(func.sum(GoalContribution.amount), 0))
-            .filter(
-                GoalContribution.user_id == user_challenge.user_id,
-                GoalContribution.date >= start,
-                GoalContribution.date <= effective_end,
-            )
-            .scalar()
-        )
-        current_value = float(saved)
-        target_value = float(challenge.target_amount or 0)
-        if target_value > 0:
-            progress_percent = min(100, (current_value / target_value) * 100)
-        is_completed = current_value >= target_value
-
-    elif challenge.challenge_type == ChallengeType.SPENDING_LIMIT:
-        spent = (
-            db.query(func.coalesce(func.sum(Expense.amount), 0))
-            .filter(
-                Expense.user_id == user_challenge.user_id,
-                Expense.date >= start,
-                Expense.date <= effective_end,
-            )
-        )
-        if challenge.target_category:
-            spent = spent.filter(Expense.category == challenge.target_category)
-        spent = float(spent.scalar())
-        current_value = spent
-        target_value = float(challenge.target_amount or 0)
-        if target_value > 0:
-            progress_percent = max(0, 100 - (spent / target_value) * 100)
-        is_completed = today >= end and spent <= target_value
-
-    elif challenge.challenge_type == ChallengeType.NO_SPEND:
-        count = (
-            db.query(func.count(Expense.id))
-            .filter(
-                Expense.user_id == user_challenge.user_id,
-                Expense.date >= start,
-                Expense.date <= effective_end,
-            )
-        )
-        if challenge.target_category:
-            count = count.filter(Expense.category == challenge.target_category)
-        count = int(count.scalar())
-        current_value = float(count)
-        target_value = 0.0
-        progress_percent = 100.0 if count == 0 else 0.0
-        is_completed = today >= end and count == 0
-
-    elif challenge.challenge_type == ChallengeType.STREAK:
-        dates = (
-            db.query(Expense.date)
-            .filter(
-                Expense.user_id == user_challenge.user_id,
-                Expense.date >= start,
-                Expense.date <= effective_end,
-            )
-            .distinct()
-            .order_by(Expense.date.asc())
-            .all()
-        )
-        expense_dates = sorted({d[0] for d in dates})
-        consecutive = _count_consecutive_days(expense_dates, start)
-        current_value = float(consecutive)
-        target_value = float(challenge.duration_days)
-        if target_value > 0:
-            progress_percent = min(100, (consecutive / target_value) * 100)
-        is_completed = consecutive >= challenge.duration_days
-
-    return {
-        "progress_percent": round(progress_percent, 1),
-        "current_value": round(current_value, 2),
-        "target_value": round(target_value, 2),
-        "is_completed": is_completed,
-    }
-
-
-def _count_consecutive_days(expense_dates: list[date], start_date: date) -> int:
-    if not expense_dates:
-        return 0
-    consecutive = 0
-    expected = start_date
-    for d in expense_dates:
-        if d == expected:
-            consecutive += 1
-            expected = d + timedelta(days=1)
-        elif d > expected:
-            break
-    return consecutive
-
-
-def check_and_complete_challenge(db: Session, user_challenge: UserChallenge) -> UserChallenge:
-    if user_challenge.status != ChallengeStatus.ACTIVE:
-        return user_challenge
-
-    progress = calculate_challenge_progress(db, user_challenge)
-    today = date.today()
-
-    if progress["is_completed"]:
-        user_challenge.status = ChallengeStatus.COMPLETED
-        user_challenge.completed_at = datetime.now(timezone.utc)
-        db.commit()
-        db.refresh(user_challenge)
-        award_badge(db, user_challenge.user_id, user_challenge)
-    elif today > user_challenge.end_date:
-        user_challenge.status = ChallengeStatus.FAILED
-        db.commit()
-        db.refresh(user_challenge)
-
-    return user_challenge
-
-
-def award_badge(
-    db: Session, user_id: uuid.UUID, user_challenge: UserChallenge
-) -> UserBadge | None:
-    badge_type = user_challenge.challenge.badge_type
-    existing = (
-        db.query(UserBadge)
-        .filter(UserBadge.user_id == user_id, UserBadge.badge_type == badge_type)
-        .first()
-    )
-    if existing:
-        return existing
-
-    badge = UserBadge(
-        user_id=user_id,
-        badge_type=badge_type,
-        challenge_id=user_challenge.challenge_id,
-        earned_at=datetime.now(timezone.utc),
-    )
-    db.add(badge)
-    db.commit()
-    db.refresh(badge)
-    return badge
-
-
 def get_leaderboard(
     db: Session, challenge_id: uuid.UUID, current_user_id: uuid.UUID, limit: int = 10
 ) -> dict:
@@ -251,38 +166,16 @@ def get_leaderboard(
             status_code=status.HTTP_404_NOT_FOUND, detail="Challenge not found"
         )
 
-    user_challenges = (
-        db.query(UserChallenge)
-        .filter(
-            UserChallenge.challenge_id == challenge_id,
-            UserChallenge.status.in_(
-                [ChallengeStatus.ACTIVE, ChallengeStatus.COMPLETED]
-            ),
-        )
-        .all()
-    )
-
-    entries = []
-    for uc in user_challenges:
-        progress = calculate_challenge_progress(db, uc)
-        entries.append(
-            {
-                "user_id": uc.user_id,
-                "progress_percent": progress["progress_percent"],
-            }
-        )
-
-    entries.sort(key=lambda x: x["progress_percent"], reverse=True)
-    entries = entries[:limit]
+    top = leaderboard_service.get_top_entries(db, challenge_id, limit)
 
     leaderboard_entries = []
-    for i, entry in enumerate(entries):
-        user_hash = hash(str(entry["user_id"])) % 10000
+    for i, entry in enumerate(top):
+        user_hash = hash(str(entry.user_id)) % 10000
         leaderboard_entries.append(
             {
                 "rank": i + 1,
-                "progress_percent": entry["progress_percent"],
-                "is_current_user": entry["user_id"] == current_user_id,
+                "progress_percent": entry.progress_percent,
+                "is_current_user": entry.user_id == current_user_id,
                 "anonymous_name": f"User #{abs(user_hash):04d}",
             }
         )
@@ -291,18 +184,41 @@ def get_leaderboard(
         "challenge_id": challenge_id,
         "challenge_title": challenge.title,
         "entries": leaderboard_entries,
-        "total_participants": len(user_challenges),
+        "total_participants": leaderboard_service.count_participants(db, challenge_id),
+        "current_user_rank": leaderboard_service.get_user_rank(db, challenge_id, current_user_id),
     }
 
 
-def get_user_progress(db: Session, user_id: uuid.UUID) -> dict:
-    active_ucs, _ = list_user_challenges(db, user_id, ChallengeStatus.ACTIVE)
-
-    for uc in active_ucs:
-        check_and_complete_challenge(db, uc)
-
-    active_ucs, _ = list_user_challenges(db, user_id, ChallengeStatus.ACTIVE)
-    completed_count = (
+def _active_with_progress(db: Session, user_id: uuid.UUID) -> list[dict]:
+    active_ucs = (
+        db.query(UserChallenge)
+        .filter(
+            UserChallenge.user_id == user_id,
+            UserChallenge.status == ChallengeStatus.ACTIVE,
+        )
+        .order_by(UserChallenge.created_at.desc())
+        .all()
+    )
+    progress_by_id = calculate_progress_batch(db, active_ucs)
+    return [
+        {
+            "id": uc.id,
+            "user_id": uc.user_id,
+            "challenge_id": uc.challenge_id,
+            "status": uc.status,
+            "start_date": uc.start_date,
+            "end_date": uc.end_date,
+            "completed_at": uc.completed_at,
+            "challenge": uc.challenge,
+            "created_at": uc.created_at,
+            **progress_by_id[uc.id],
+        }
+        for uc in active_ucs
+    ]
+
+
+def _completed_count(db: Session, user_id: uuid.UUID) -> int:
+    return (
         db.query(func.count(UserChallenge.id))
         .filter(
             UserChallenge.user_id == user_id,
@@ -311,40 +227,35 @@ def get_user_progress(db: Session, user_id: uuid.UUID) -> dict:
         .scalar()
     )
 
-    badges = db.query(UserBadge).filter(UserBadge.user_id == user_id).all()
 
-    active_with_progress = []
-    for uc in active_ucs:
-        progress = calculate_challenge_progress(db, uc)
-        active_with_progress.append(
-            {
-                "id": uc.id,
-                "user_id": uc.user_id,
-                "challenge_id": uc.challenge_id,
-                "status": uc.status,
-                "start_date": uc.start_date,
-                "end_date": uc.end_date,
-                "completed_at": uc.completed_at,
-                "challenge": uc.challenge,
-                "created_at": uc.created_at,
-                **progress,
-            }
-        )
+def _badge_responses(db: Session, user_id: uuid.UUID) -> list[dict]:
+    rows = (
+        db.query(UserBadge.badge_type, UserBadge.earned_at, Challenge.title)
+        .join(Challenge, Challenge.id == UserBadge.challenge_id)
+        .filter(UserBadge.user_id == user_id)
+        .all()
+    )
+    return [
+        {"badge_type": r.badge_type, "earned_at": r.earned_at, "challenge_title": r.title}
+        for r in rows
+    ]
 
-    badge_responses = []
-    for b in badges:
-        badge_responses.append(
-            {
-                "badge_type": b.badge_type,
-                "earned_at": b.earned_at,
-                "challenge_title": b.challenge.title,
-            }
-        )
 
+def get_user_progress(db: Session, user_id: uuid.UUID) -> dict:
+    """Active challenges with progress, completed count and badges.
+
+    The three parts are independent, so they are fetched with ``fan_out``.
+    """
+    active, completed_count, badges = fan_out(
+        db,
+        lambda s: _active_with_progress(s, user_id),
+        lambda s: _completed_count(s, user_id),
+        lambda s: _badge_responses(s, user_id),
+    )
     return {
-        "active_challenges": active_with_progress,
+        "active_challenges": active,
         "completed_count": completed_count,
-        "badges": badge_responses,
+        "badges": badges,
     }
 
 
@@ -358,4 +269,6 @@ def abandon_challenge(
             detail="Can only abandon active challenges",
         )
     uc.status = ChallengeStatus.ABANDONED
+    leaderboard_service.remove_entry(db, uc.id)
     db.commit()
+    invalidate_financial_context(user_id)
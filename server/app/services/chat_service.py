@@ -1,36 +1,62 @@
 import uuid
-from datetime import date
+from datetime import datetime, timezone
 
-from sqlalchemy import func
+from fastapi import HTTPException, status
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.orm import Session
 
-from app.models.budget import Budget, BudgetCategory
-from app.models.challenge import ChallengeStatus, UserChallenge
-from app.models.chat import ChatMessage
-from app.models.expense import Expense
-from app.models.goal import Goal
-from app.models.user import User
-
-
-def get_history(db: Session, user_id: uuid.UUID, limit: int = 50) -> list[ChatMessage]:
-    return (
-        db.query(ChatMessage)
-        .filter(ChatMessage.user_id == user_id)
-        .order_by(ChatMessage.created_at.asc())
-        .limit(limit)
+from app.config import settings
+from app.models.chat import ChatMessage, ChatMessageArchive
+from app.services.financial_context_service import FinancialContext
+from app.utils.intent_matcher import IntentMatcher
+from app.utils.pagination import decode_chat_cursor, encode_chat_cursor
+
+COMPACT_USER_CHUNK_SIZE = 200
+
+
+def get_history(
+    db: Session, user_id: uuid.UUID, limit: int = 50, before: str | None = None
+) -> tuple[list[ChatMessage], str | None]:
+    """The latest ``limit`` messages, oldest first within the page.
+
+    ``before`` is a cursor from a previous call and pages back to older
+    messages. The returned cursor is None once the start of the history has
+    been reached.
+    """
+    query = db.query(ChatMessage).filter(ChatMessage.user_id == user_id)
+    if before:
+        try:
+            created_at, message_id = decode_chat_cursor(before)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        query = query.filter(tuple_(ChatMessage.created_at, ChatMessage.id) < (created_at, message_id))
+
+    # Newest first off the index, one extra row to know whether older ones exist
+    messages = (
+        query.order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+        .limit(limit + 1)
         .all()
     )
+    next_cursor = None
+    if len(messages) > limit:
+        messages = messages[:limit]
+        oldest = messages[-1]
+        next_cursor = encode_chat_cursor(oldest.created_at, oldest.id)
+    messages.reverse()
+    return messages, next_cursor
 
 
 def send_message(
     db: Session, user_id: uuid.UUID, content: str
 ) -> tuple[ChatMessage, ChatMessage]:
-    user_msg = ChatMessage(user_id=user_id, role="user", content=content)
+    # Explicit timestamps: now() is fixed per transaction, which would give
+    # both messages the same created_at and an arbitrary order in history
+    user_msg = ChatMessage(user_id=user_id, role="user", content=content, created_at=datetime.now(timezone.utc))
     db.add(user_msg)
     db.flush()
 
     reply_text = _generate_response(db, user_id, content)
-    bot_msg = ChatMessage(user_id=user_id, role="bot", content=reply_text)
+    bot_msg = ChatMessage(user_id=user_id, role="bot", content=reply_text, created_at=datetime.now(timezone.utc))
     db.add(bot_msg)
     db.commit()
     db.refresh(user_msg)
@@ -40,46 +66,132 @@ def send_message(
 
 def clear_history(db: Session, user_id: uuid.UUID) -> None:
     db.query(ChatMessage).filter(ChatMessage.user_id == user_id).delete()
+    db.query(ChatMessageArchive).filter(ChatMessageArchive.user_id == user_id).delete()
     db.commit()
 
 
 # ---------------------------------------------------------------------------
-# Intent detection & response generation
+# Retention
 # ---------------------------------------------------------------------------
 
-def _generate_response(db: Session, user_id: uuid.UUID, question: str) -> str:
-    q = question.lower()
-
-    if any(w in q for w in ["hi", "hello", "hey", "howdy"]):
-        return _greeting(db, user_id)
-
-    if any(w in q for w in ["spend", "spent", "expense", "expenses", "spending"]):
-        return _spending_response(db, user_id)
+def compact_chat_history(db: Session, keep: int | None = None) -> dict:
+    """Archive each user's messages beyond the newest ``keep``.
+
+    Works through over-cap users in chunks. The ids to move are fixed before
+    copying, so messages sent while the job runs are never deleted unarchived.
+    """
+    keep = settings.CHAT_HISTORY_MAX_MESSAGES if keep is None else keep
+    user_ids = [
+        uid
+        for (uid,) in db.query(ChatMessage.user_id)
+        .group_by(ChatMessage.user_id)
+        .having(func.count(ChatMessage.id) > keep)
+        .all()
+    ]
+
+    archived = 0
+    for i in range(0, len(user_ids), COMPACT_USER_CHUNK_SIZE):
+        ranked = (
+            select(
+                ChatMessage.id,
+                func.row_number()
+                .over(
+                    partition_by=ChatMessage.user_id,
+                    order_by=(ChatMessage.created_at.desc(), ChatMessage.id.desc()),
+                )
+                .label("rn"),
+            )
+            .where(ChatMessage.user_id.in_(user_ids[i:i + COMPACT_USER_CHUNK_SIZE]))
+            .subquery()
+        )
+        ids = [mid for (mid,) in db.execute(select(ranked.c.id).where(ranked.c.rn > keep))]
+        if not ids:
+            continue
+
+        db.execute(
+            insert(ChatMessageArchive).from_select(
+                ["id", "user_id", "role", "content", "created_at"],
+                select(
+                    ChatMessage.id,
+                    ChatMessage.user_id,
+                    ChatMessage.role,
+                    ChatMessage.content,
+                    ChatMessage.created_at,
+                ).where(ChatMessage.id.in_(ids)),
+            )
+        )
+        db.query(ChatMessage).filter(ChatMessage.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+        archived += len(ids)
 
-    if any(w in q for w in ["budget"]):
-        return _budget_response(db, user_id)
+    return {"users": len(user_ids), "archived": archived}
 
-    if any(w in q for w in ["goal", "saving", "save", "target"]):
-        return _goal_response(db, user_id)
 
-    if any(w in q for w in ["challenge"]):
-        return _challenge_response(db, user_id)
+# ---------------------------------------------------------------------------
+# Intent detection & response generation
+# ---------------------------------------------------------------------------
 
-    if any(w in q for w in ["income", "salary", "earn", "earning"]):
-        return _income_response(db, user_id)
+# Keyword -> weight per intent. Greetings weigh less so "hi, what did I spend?"
+# answers the question rather than just saying hello.
+_INTENT_KEYWORDS: dict[str, dict[str, float]] = {
+    "greeting": {
+        "hi": 0.5, "hello": 0.5, "hey": 0.5, "howdy": 0.5,
+        "good morning": 0.5, "good evening": 0.5,
+    },
+    "spending": {
+        "spend": 1.0, "spent": 1.0, "spending": 1.0, "expense": 1.0, "expenses": 1.0,
+        "how much did i spend": 1.0, "top category": 1.0,
+    },
+    "budget": {"budget": 1.0, "budgets": 1.0, "over budget": 1.0, "allocated": 0.5},
+    "goal": {
+        "goal": 1.0, "goals": 1.0, "saving": 1.0, "savings": 1.0, "save": 1.0, "saved": 0.5,
+        "target": 0.5,
+    },
+    "challenge": {"challenge": 1.0, "challenges": 1.0, "badge": 0.5, "badges": 0.5, "streak": 0.5},
+    "income": {"income": 1.0, "salary": 1.0, "earn": 1.0, "earning": 1.0, "earnings": 1.0, "paycheck": 1.0},
+    "investment": {
+        "invest": 1.0, "investing": 1.0, "investment": 1.0, "investments": 1.0, "stock": 1.0,
+        "stocks": 1.0, "mutual fund": 1.5, "mutual funds": 1.5, "sip": 1.0, "ppf": 1.0, "nps": 1.0,
+    },
+}
+_intent_matcher = IntentMatcher(_INTENT_KEYWORDS)
+
+# Most intents answered in a single reply
+MAX_INTENTS_PER_REPLY = 3
+
+
+def select_intents(question: str) -> list[str]:
+    """Intents to answer, best first; a greeting is dropped when anything else matched."""
+    intents = _intent_matcher.rank(question)
+    if len(intents) > 1 and "greeting" in intents:
+        intents.remove("greeting")
+    return intents[:MAX_INTENTS_PER_REPLY]
 
-    if any(w in q for w in ["invest", "investment", "stock", "mutual fund", "sip"]):
-        return _investment_advice()
 
-    return _fallback_response()
+def _generate_response(db: Session, user_id: uuid.UUID, question: str) -> str:
+    intents = select_intents(question)
+    if not intents:
+        return _fallback_response()
+
+    ctx = FinancialContext(db, user_id)
+    builders = {
+        "greeting": lambda: _greeting(ctx),
+        "spending": lambda: _spending_response(ctx),
+        "budget": lambda: _budget_response(ctx),
+        "goal": lambda: _goal_response(ctx),
+        "challenge": lambda: _challenge_response(ctx),
+        "income": lambda: _income_response(ctx),
+        "investment": _investment_advice,
+    }
+    return "\n\n".join(builders[name]() for name in intents)
 
 
 # ---------------------------------------------------------------------------
 # Individual response builders
 # ---------------------------------------------------------------------------
 
-def _greeting(db: Session, user_id: uuid.UUID) -> str:
-    user = db.query(User).filter(User.id == user_id).first()
+def _greeting(ctx: FinancialContext) -> str:
+    user = ctx.user
     name = user.name.split()[0] if user and user.name else "there"
     return (
         f"Hi {name}! I'm your B4U financial advisor. "
@@ -88,87 +200,33 @@ def _greeting(db: Session, user_id: uuid.UUID) -> str:
     )
 
 
-def _spending_response(db: Session, user_id: uuid.UUID) -> str:
-    today = date.today()
-    first_of_month = today.replace(day=1)
-
-    total = (
-        db.query(func.coalesce(func.sum(Expense.amount), 0))
-        .filter(
-            Expense.user_id == user_id,
-            Expense.date >= first_of_month,
-            Expense.date <= today,
-        )
-        .scalar()
-    )
-    total = float(total)
-
-    # Top category this month
-    top_row = (
-        db.query(Expense.category, func.sum(Expense.amount).label("cat_total"))
-        .filter(
-            Expense.user_id == user_id,
-            Expense.date >= first_of_month,
-            Expense.date <= today,
-        )
-        .group_by(Expense.category)
-        .order_by(func.sum(Expense.amount).desc())
-        .first()
-    )
-
-    month_name = today.strftime("%B")
+def _spending_response(ctx: FinancialContext) -> str:
+    total = ctx.month_spent
+    month_name = ctx.today.strftime("%B")
     if total == 0:
         return f"You haven't recorded any expenses in {month_name} yet. Start tracking to get insights!"
 
     msg = f"You've spent \u20b9{total:,.2f} so far in {month_name}."
-    if top_row:
-        cat_label = top_row.category.value.replace("_", " ").title()
-        msg += f" Your top category is {cat_label} (\u20b9{float(top_row.cat_total):,.2f})."
+    top = ctx.top_category
+    if top:
+        category, cat_total = top
+        cat_label = category.value.replace("_", " ").title()
+        msg += f" Your top category is {cat_label} (\u20b9{cat_total:,.2f})."
     msg += " Keep tracking to stay on top of your finances!"
     return msg
 
 
-def _budget_response(db: Session, user_id: uuid.UUID) -> str:
-    today = date.today()
-    first_of_month = today.replace(day=1)
-
-    budget = (
-        db.query(Budget)
-        .filter(
-            Budget.user_id == user_id,
-            Budget.month == today.month,
-            Budget.year == today.year,
-        )
-        .first()
-    )
-    if not budget:
+def _budget_response(ctx: FinancialContext) -> str:
+    allocated = ctx.budget_allocated
+    if allocated is None:
         return (
             "You haven't set a budget for this month yet. "
             "Head to the Budget Planner to set one up!"
         )
 
-    # Total allocated
-    allocated = (
-        db.query(func.coalesce(func.sum(BudgetCategory.allocated_amount), 0))
-        .filter(BudgetCategory.budget_id == budget.id)
-        .scalar()
-    )
-    allocated = float(allocated)
-
-    # Total spent
-    spent = (
-        db.query(func.coalesce(func.sum(Expense.amount), 0))
-        .filter(
-            Expense.user_id == user_id,
-            Expense.date >= first_of_month,
-            Expense.date <= today,
-        )
-        .scalar()
-    )
-    spent = float(spent)
-
+    spent = ctx.month_spent
     remaining = allocated - spent
-    month_name = today.strftime("%B")
+    month_name = ctx.today.strftime("%B")
 
     if remaining >= 0:
         return (
@@ -184,27 +242,20 @@ def _budget_response(db: Session, user_id: uuid.UUID) -> str:
         )
 
 
-def _goal_response(db: Session, user_id: uuid.UUID) -> str:
-    goals = (
-        db.query(Goal)
-        .filter(Goal.user_id == user_id, Goal.is_active == True)
-        .order_by(Goal.created_at.desc())
-        .all()
-    )
+def _goal_response(ctx: FinancialContext) -> str:
+    goals = ctx.active_goals
     if not goals:
         return (
             "You don't have any active savings goals. "
             "Set one up in the Goals section to start working toward something meaningful!"
         )
 
-    goal = goals[0]
-    target = float(goal.target_amount)
-    saved = float(goal.saved_amount)
+    name, saved, target = goals[0]
     remaining = max(0, target - saved)
     pct = min(100, (saved / target * 100)) if target > 0 else 0
 
     msg = (
-        f"Your top goal is \"{goal.name}\": you've saved \u20b9{saved:,.2f} of "
+        f"Your top goal is \"{name}\": you've saved \u20b9{saved:,.2f} of "
         f"\u20b9{target:,.2f} ({pct:.1f}% complete), with \u20b9{remaining:,.2f} left to go."
     )
     if len(goals) > 1:
@@ -212,37 +263,28 @@ def _goal_response(db: Session, user_id: uuid.UUID) -> str:
     return msg
 
 
-def _challenge_response(db: Session, user_id: uuid.UUID) -> str:
-    active_ucs = (
-        db.query(UserChallenge)
-        .filter(
-            UserChallenge.user_id == user_id,
-            UserChallenge.status == ChallengeStatus.ACTIVE,
-        )
-        .all()
-    )
-    if not active_ucs:
+def _challenge_response(ctx: FinancialContext) -> str:
+    challenges = ctx.active_challenges
+    if not challenges:
         return (
             "You're not in any challenges right now. "
             "Check out the Challenges section to join one and earn badges!"
         )
 
-    uc = active_ucs[0]
-    challenge = uc.challenge
-    today = date.today()
-    days_left = max(0, (uc.end_date - today).days)
+    title, end_date = challenges[0]
+    days_left = max(0, (end_date - ctx.today).days)
 
     msg = (
-        f"You're currently in the \"{challenge.title}\" challenge with {days_left} day(s) remaining."
+        f"You're currently in the \"{title}\" challenge with {days_left} day(s) remaining."
     )
-    if len(active_ucs) > 1:
-        msg += f" You have {len(active_ucs)} active challenges in total."
+    if len(challenges) > 1:
+        msg += f" You have {len(challenges)} active challenges in total."
     msg += " Keep it up!"
     return msg
 
 
-def _income_response(db: Session, user_id: uuid.UUID) -> str:
-    user = db.query(User).filter(User.id == user_id).first()
+def _income_response(ctx: FinancialContext) -> str:
+    user = ctx.user
     if not user or (not user.monthly_salary and not user.other_income):
         return (
             "I don't have your income details on file. "
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.models.checklist import ChecklistItemType, ChecklistStatus, UserChecklistItem
 from app.schemas.checklist import ChecklistItemUpdate
+from app.services.dashboard_service import invalidate_dashboard
 
 
 def get_all_items(db: Session, user_id: uuid.UUID) -> list[UserChecklistItem]:
@@ -32,6 +33,7 @@ def update_item(db: Session, user_id: uuid.UUID, item_type: ChecklistItemType, d
     elif data.status != ChecklistStatus.COMPLETE:
         item.completed_at = None
     db.commit()
+    invalidate_dashboard(user_id)
     db.refresh(item)
     return item
 
@@ -0,0 +1,141 @@
+import threading
+import uuid
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func, literal, select, true
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.checklist import ChecklistStatus, UserChecklistItem
+from app.models.expense import UserMonthCategoryTotal
+from app.models.goal import Goal
+from app.schemas.dashboard import DashboardResponse, GoalPreview
+from app.utils.cache import TTLCache
+from app.utils.calculations import goal_progress_percent
+
+if TYPE_CHECKING:
+    from app.services.user_service import UserSnapshot
+
+# user_id -> (date computed for, figures); the greeting is always rebuilt
+_dashboard_cache = TTLCache(settings.DASHBOARD_CACHE_MAX_ENTRIES, settings.DASHBOARD_CACHE_TTL_SECONDS)
+# Bumped by every invalidation; a load stores its figures only if none
+# happened since it started, as with the user snapshot cache
+_dashboard_version = 0
+_dashboard_lock = threading.Lock()
+
+
+def invalidate_dashboard(user_id: uuid.UUID) -> None:
+    """Drop the cached figures; call after any write that feeds the dashboard."""
+    global _dashboard_version
+    with _dashboard_lock:
+        _dashboard_version += 1
+        _dashboard_cache.invalidate(user_id)
+
+
+def _greeting(name: str) -> str:
+    hour = datetime.now().hour
+    if hour < 12:
+        period = "Morning"
+    elif hour < 17:
+        period = "Afternoon"
+    else:
+        period = "Evening"
+    return f"Good {period}, {name}!"
+
+
+def _load_figures(db: Session, user_id: uuid.UUID, month: int, year: int) -> dict:
+    """Month spend, checklist score and the active goal in a single statement."""
+    month_spent = (
+        select(func.coalesce(func.sum(UserMonthCategoryTotal.total), 0))
+        .where(
+            UserMonthCategoryTotal.user_id == user_id,
+            UserMonthCategoryTotal.year == year,
+            UserMonthCategoryTotal.month == month,
+        )
+        .scalar_subquery()
+    )
+    checklist_completed = (
+        select(func.count())
+        .where(UserChecklistItem.user_id == user_id, UserChecklistItem.status == ChecklistStatus.COMPLETE)
+        .scalar_subquery()
+    )
+    checklist_total = (
+        select(func.count())
+        .where(UserChecklistItem.user_id == user_id)
+        .scalar_subquery()
+    )
+    active_goal = (
+        select(Goal.name, Goal.saved_amount, Goal.target_amount)
+        .where(Goal.user_id == user_id, Goal.is_active == True)
+        .limit(1)
+        .subquery()
+    )
+    one_row = select(literal(1).label("one")).subquery()
+
+    row = db.execute(
+        select(
+            month_spent.label("month_spent"),
+            checklist_completed.label("checklist_completed"),
+            checklist_total.label("checklist_total"),
+            active_goal.c.name,
+            active_goal.c.saved_amount,
+            active_goal.c.target_amount,
+        ).select_from(one_row.outerjoin(active_goal, true()))
+    ).one()
+
+    goal_preview = None
+    if row.name is not None:
+        saved = float(row.saved_amount)
+        target = float(row.target_amount)
+        goal_preview = GoalPreview(
+            name=row.name,
+            progress_percent=goal_progress_percent(saved, target),
+            saved_amount=saved,
+            target_amount=target,
+        )
+
+    return {
+        "month_spent": float(row.month_spent),
+        "health_score": row.checklist_completed,
+        "health_total": row.checklist_total,
+        "active_goal": goal_preview,
+    }
+
+
+def get_dashboard(db: Session, user: "UserSnapshot") -> DashboardResponse:
+    today = date.today()
+
+    version = _dashboard_version
+    cached = _dashboard_cache.get(user.id)
+    if cached is not None and cached[0] == today:
+        figures = cached[1]
+    else:
+        figures = _load_figures(db, user.id, today.month, today.year)
+        with _dashboard_lock:
+            if version == _dashboard_version:
+                _dashboard_cache.set(user.id, (today, figures))
+
+    # Income
+    salary = float(user.monthly_salary or 0)
+    other = float(user.other_income or 0)
+    total_income = salary + other
+
+    # Fixed expenses plus variable spending this month
+    fixed_total = sum(fe.amount for fe in user.fixed_expenses)
+    total_out = fixed_total + figures["month_spent"]
+    remaining = total_income - total_out
+    spend_percent = int(total_out / total_income * 100) if total_income > 0 else 0
+
+    return DashboardResponse(
+        greeting=_greeting(user.name),
+        month_label=today.strftime("%B %Y"),
+        total_income=total_income,
+        total_spent=total_out,
+        total_saved=remaining if remaining > 0 else 0,
+        remaining=remaining,
+        spend_percent=min(spend_percent, 999),
+        health_score=figures["health_score"],
+        health_total=figures["health_total"],
+        active_goal=figures["active_goal"],
+    )
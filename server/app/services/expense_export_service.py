@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+import uuid
+from collections.abc import Iterator
+from datetime import date
+
+from sqlalchemy import select
+
+from app.database import SessionLocal
+from app.models.expense import Expense, ExpenseCategory
+
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_COLUMNS = ("id", "date", "category", "amount", "description", "created_at")
+
+
+def _export_rows(
+    user_id: uuid.UUID,
+    start_date: date | None,
+    end_date: date | None,
+    category: ExpenseCategory | None,
+) -> Iterator[list]:
+    """Yield lists of rows read through a server-side cursor, oldest first.
+
+    Opens its own session: the response body is produced after request
+    dependencies (and their sessions) have already been closed.
+    """
+    stmt = select(
+        Expense.id,
+        Expense.date,
+        Expense.category,
+        Expense.amount,
+        Expense.description,
+        Expense.created_at,
+    ).where(Expense.user_id == user_id)
+    if start_date:
+        stmt = stmt.where(Expense.date >= start_date)
+    if end_date:
+        stmt = stmt.where(Expense.date <= end_date)
+    if category:
+        stmt = stmt.where(Expense.category == category)
+    stmt = stmt.order_by(Expense.date, Expense.created_at, Expense.id)
+
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        for partition in result.partitions():
+            yield partition
+    finally:
+        db.close()
+
+
+def stream_expenses_csv(
+    user_id: uuid.UUID,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    category: ExpenseCategory | None = None,
+) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in _export_rows(user_id, start_date, end_date, category):
+        for r in rows:
+            writer.writerow([
+                r.id, r.date.isoformat(), r.category.value, f"{r.amount:.2f}",
+                r.description or "", r.created_at.isoformat(),
+            ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_expenses_ndjson(
+    user_id: uuid.UUID,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    category: ExpenseCategory | None = None,
+) -> Iterator[str]:
+    for rows in _export_rows(user_id, start_date, end_date, category):
+        yield "".join(
+            json.dumps({
+                "id": str(r.id),
+                "date": r.date.isoformat(),
+                "category": r.category.value,
+                "amount": float(r.amount),
+                "description": r.description,
+                "created_at": r.created_at.isoformat(),
+            }) + "\n"
+            for r in rows
+        )
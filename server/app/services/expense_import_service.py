@@ -0,0 +1,148 @@
+import codecs
+import csv
+import io
+import json
+import uuid
+from collections.abc import AsyncIterator
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.expense import Expense
+from app.schemas.expense import ExpenseCreate
+from app.services import leaderboard_service, rollup_service
+from app.services.dashboard_service import invalidate_dashboard
+from app.services.financial_context_service import invalidate_financial_context
+
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+REQUIRED_CSV_COLUMNS = {"amount", "category", "date"}
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a streamed UTF-8 body into lines without buffering it whole."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def _iter_records(lines: AsyncIterator[str], fmt: str) -> AsyncIterator[tuple[int, dict | None, str | None]]:
+    """Yield (row number, raw record, parse error) for every non-blank line.
+
+    CSV needs a header row naming the columns; quoted fields spanning lines
+    are not supported. Row numbers are 1-based data rows.
+    """
+    header: list[str] | None = None
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        if fmt == "csv" and header is None:
+            header = [h.strip().lower() for h in next(csv.reader([line]))]
+            missing = REQUIRED_CSV_COLUMNS - set(header)
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"CSV header is missing: {', '.join(sorted(missing))}",
+                )
+            continue
+
+        row_number += 1
+        try:
+            if fmt == "csv":
+                values = next(csv.reader([line]))
+                record = {k: (v if v != "" else None) for k, v in zip(header, values)}
+            else:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("expected a JSON object")
+        except (ValueError, csv.Error) as exc:
+            yield row_number, None, f"Unparseable row: {exc}"
+            continue
+        yield row_number, record, None
+
+
+def _validation_message(exc: ValidationError) -> str:
+    first = exc.errors()[0]
+    field = ".".join(str(p) for p in first["loc"]) or "row"
+    return f"{field}: {first['msg']}"
+
+
+def insert_batch(db: Session, user_id: uuid.UUID, rows: list[ExpenseCreate]) -> int:
+    """Insert validated rows and update derived aggregates once for the batch."""
+    if not rows:
+        return 0
+    records = [{"id": uuid.uuid4(), "user_id": user_id, **r.model_dump()} for r in rows]
+    if db.bind.dialect.driver == "psycopg2":
+        _copy_expenses(db, records)
+    else:
+        db.execute(insert(Expense), records)
+
+    deltas: rollup_service.RollupDeltas = {}
+    for r in rows:
+        rollup_service.add_delta(deltas, user_id, r.date, r.category, r.amount, 1)
+    rollup_service.apply_deltas(db, deltas)
+    leaderboard_service.refresh_user_entries(db, user_id, [r.date for r in rows])
+    db.commit()
+    invalidate_dashboard(user_id)
+    invalidate_financial_context(user_id)
+    return len(rows)
+
+
+def _copy_expenses(db: Session, records: list[dict]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for r in records:
+        writer.writerow([
+            r["id"], r["user_id"], r["amount"], r["category"].value,
+            r["description"] if r["description"] is not None else "", r["date"].isoformat(),
+        ])
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    # Unquoted empty fields load as NULL, matching ExpenseCreate, which never
+    # keeps a blank description; created_at/updated_at use column defaults
+    cursor.copy_expert(
+        "COPY expenses (id, user_id, amount, category, description, date) FROM STDIN WITH (FORMAT csv)",
+        buffer,
+    )
+
+
+async def import_expenses(
+    db: Session, user_id: uuid.UUID, chunks: AsyncIterator[bytes], fmt: str
+) -> dict:
+    """Stream-parse a CSV or NDJSON body, validating and inserting in batches.
+
+    Invalid rows are skipped and reported; each full batch is committed on
+    its own, so rows accepted before a later failure stay inserted.
+    """
+    inserted = 0
+    failed = 0
+    errors: list[dict] = []
+    batch: list[ExpenseCreate] = []
+
+    async for row_number, record, error in _iter_records(_iter_lines(chunks), fmt):
+        if record is not None:
+            try:
+                batch.append(ExpenseCreate(**record))
+            except ValidationError as exc:
+                error = _validation_message(exc)
+        if error:
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": row_number, "error": error})
+        if len(batch) >= BATCH_SIZE:
+            inserted += await run_in_threadpool(insert_batch, db, user_id, batch)
+            batch = []
+
+    inserted += await run_in_threadpool(insert_batch, db, user_id, batch)
+    return {"inserted": inserted, "failed": failed, "errors": errors}
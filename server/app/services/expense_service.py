@@ -2,17 +2,30 @@ import uuid
 from datetime import date
 
 from fastapi import HTTPException, status
-from sqlalchemy import extract, func
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
 from app.models.expense import Expense, ExpenseCategory
 from app.schemas.expense import CategorySummary, ExpenseCreate, ExpenseUpdate
+from app.services import leaderboard_service, rollup_service
+from app.services.dashboard_service import invalidate_dashboard
+from app.services.financial_context_service import invalidate_financial_context
+from app.utils.date_ranges import in_month
+from app.utils.pagination import decode_expense_cursor, encode_expense_cursor
 
 
 def create_expense(db: Session, user_id: uuid.UUID, data: ExpenseCreate) -> Expense:
     expense = Expense(user_id=user_id, **data.model_dump())
     db.add(expense)
+
+    deltas: rollup_service.RollupDeltas = {}
+    rollup_service.add_delta(deltas, user_id, expense.date, expense.category, expense.amount, 1)
+    rollup_service.apply_deltas(db, deltas)
+    db.flush()
+    leaderboard_service.refresh_user_entries(db, user_id, [expense.date])
     db.commit()
+    invalidate_dashboard(user_id)
+    invalidate_financial_context(user_id)
     db.refresh(expense)
     return expense
 
@@ -25,91 +38,104 @@ def list_expenses(
     category: ExpenseCategory | None = None,
     page: int = 1,
     page_size: int = 20,
-) -> tuple[list[Expense], int]:
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> tuple[list[Expense], int | None, str | None]:
+    """List expenses newest first.
+
+    With ``cursor`` the page starts right after the cursor position (keyset
+    pagination) and ``page`` is ignored; otherwise ``page`` is used as an
+    offset. The returned ``next_cursor`` works in either mode, and the total
+    count is only computed when ``include_total`` is set.
+    """
     query = db.query(Expense).filter(Expense.user_id == user_id)
 
     if month and year:
-        query = query.filter(
-            extract("month", Expense.date) == month,
-            extract("year", Expense.date) == year,
-        )
+        query = query.filter(in_month(Expense.date, month, year))
     if category:
         query = query.filter(Expense.category == category)
 
-    total = query.count()
-    items = query.order_by(Expense.date.desc(), Expense.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
-    return items, total
-
-
-def get_expense(db: Session, user_id: uuid.UUID, expense_id: uuid.UUID) -> Expense:
-    expense = db.query(Expense).filter(Expense.id == expense_id, Expense.user_id == user_id).first()
+    total = query.count() if include_total else None
+
+    query = query.order_by(Expense.date.desc(), Expense.created_at.desc(), Expense.id.desc())
+    if cursor:
+        try:
+            after = decode_expense_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        query = query.filter(tuple_(Expense.date, Expense.created_at, Expense.id) < after)
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    # One extra row tells us whether another page exists
+    items = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        next_cursor = encode_expense_cursor(last.date, last.created_at, last.id)
+    return items, total, next_cursor
+
+
+def get_expense(db: Session, user_id: uuid.UUID, expense_id: uuid.UUID, for_update: bool = False) -> Expense:
+    """The user's expense, or 404.
+
+    ``for_update`` row-locks it until commit, so writes that derive rollup
+    deltas from the old values apply one at a time.
+    """
+    query = db.query(Expense).filter(Expense.id == expense_id, Expense.user_id == user_id)
+    if for_update:
+        query = query.with_for_update()
+    expense = query.first()
     if not expense:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Expense not found")
     return expense
 
 
 def update_expense(db: Session, user_id: uuid.UUID, expense_id: uuid.UUID, data: ExpenseUpdate) -> Expense:
-    expense = get_expense(db, user_id, expense_id)
+    expense = get_expense(db, user_id, expense_id, for_update=True)
+    old_date = expense.date
+    deltas: rollup_service.RollupDeltas = {}
+    rollup_service.add_delta(deltas, user_id, expense.date, expense.category, -expense.amount, -1)
+
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(expense, field, value)
+
+    rollup_service.add_delta(deltas, user_id, expense.date, expense.category, expense.amount, 1)
+    rollup_service.apply_deltas(db, deltas)
+    db.flush()
+    leaderboard_service.refresh_user_entries(db, user_id, [old_date, expense.date])
     db.commit()
+    invalidate_dashboard(user_id)
+    invalidate_financial_context(user_id)
     db.refresh(expense)
     return expense
 
 
 def delete_expense(db: Session, user_id: uuid.UUID, expense_id: uuid.UUID) -> None:
-    expense = get_expense(db, user_id, expense_id)
+    expense = get_expense(db, user_id, expense_id, for_update=True)
+    deltas: rollup_service.RollupDeltas = {}
+    rollup_service.add_delta(deltas, user_id, expense.date, expense.category, -expense.amount, -1)
+    rollup_service.apply_deltas(db, deltas)
     db.delete(expense)
+    db.flush()
+    leaderboard_service.refresh_user_entries(db, user_id, [expense.date])
     db.commit()
+    invalidate_dashboard(user_id)
+    invalidate_financial_context(user_id)
 
 
 def get_monthly_summary(db: Session, user_id: uuid.UUID, month: int, year: int) -> dict:
-    rows = (
-        db.query(Expense.category, func.sum(Expense.amount).label("total"))
-        .filter(
-            Expense.user_id == user_id,
-            extract("month", Expense.date) == month,
-            extract("year", Expense.date) == year,
-        )
-        .group_by(Expense.category)
-        .all()
-    )
+    totals = rollup_service.month_totals_by_category(db, user_id, month, year)
 
-    total_spent = sum(float(r.total) for r in rows)
+    total_spent = sum(totals.values())
     by_category = [
         CategorySummary(
-            category=r.category,
-            total=float(r.total),
-            percentage=round(float(r.total) / total_spent * 100, 1) if total_spent > 0 else 0,
+            category=category,
+            total=total,
+            percentage=round(total / total_spent * 100, 1) if total_spent > 0 else 0,
         )
-        for r in rows
+        for category, total in totals.items()
     ]
 
     return {"month": month, "year": year, "total_spent": total_spent, "by_category": by_category}
-
-
-def get_month_total(db: Session, user_id: uuid.UUID, month: int, year: int) -> float:
-    result = (
-        db.query(func.sum(Expense.amount))
-        .filter(
-            Expense.user_id == user_id,
-            extract("month", Expense.date) == month,
-            extract("year", Expense.date) == year,
-        )
-        .scalar()
-    )
-    return float(result) if result else 0.0
-
-
-def get_category_spend(db: Session, user_id: uuid.UUID, category: ExpenseCategory, month: int, year: int) -> float:
-    result = (
-        db.query(func.sum(Expense.amount))
-        .filter(
-            Expense.user_id == user_id,
-            Expense.category == category,
-            extract("month", Expense.date) == month,
-            extract("year", Expense.date) == year,
-        )
-        .scalar()
-    )
-    return float(result) if result else 0.0
@@ -0,0 +1,174 @@
+import threading
+import time
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
+from types import MappingProxyType
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.budget import Budget, BudgetCategory
+from app.models.challenge import Challenge, ChallengeStatus, UserChallenge
+from app.models.expense import ExpenseCategory
+from app.models.goal import Goal
+from app.services.rollup_service import month_to_date_totals_by_category
+from app.services.user_service import UserSnapshot, get_user_snapshot
+from app.utils.cache import TTLCache
+
+
+@dataclass(frozen=True)
+class _CachedContext:
+    """Figures loaded for one user and day.
+
+    Never mutated: a load publishes a copy with its datum added, and only
+    while ``generation`` is still the cached one, so a load that finishes
+    after an invalidation is dropped.
+    """
+
+    today: date
+    generation: object
+    expires_at: float
+    values: Mapping[str, object]
+
+
+# user_id -> _CachedContext; values are plain tuples/floats/read-only mappings
+_context_cache = TTLCache(settings.FINANCIAL_CONTEXT_CACHE_MAX_ENTRIES, settings.FINANCIAL_CONTEXT_CACHE_TTL_SECONDS)
+# Makes the generation check and the publish of a new copy one step
+_context_lock = threading.Lock()
+
+_MISSING = object()
+
+
+def invalidate_financial_context(user_id: uuid.UUID) -> None:
+    """Drop cached figures; call after writes to expenses, budgets, goals or challenges."""
+    with _context_lock:
+        _context_cache.invalidate(user_id)
+
+
+def _start_generation(user_id: uuid.UUID, today: date) -> _CachedContext:
+    with _context_lock:
+        cached = _context_cache.get(user_id)
+        if cached is not None and cached.today == today:
+            return cached
+        cached = _CachedContext(today, object(), time.monotonic() + _context_cache.ttl_seconds, MappingProxyType({}))
+        _context_cache.set(user_id, cached)
+        return cached
+
+
+def _publish(user_id: uuid.UUID, generation: object, name: str, value: object) -> None:
+    with _context_lock:
+        cached = _context_cache.get(user_id)
+        if cached is None or cached.generation is not generation:
+            return
+        remaining = cached.expires_at - time.monotonic()
+        if remaining <= 0:
+            return
+        values = MappingProxyType({**cached.values, name: value})
+        _context_cache.set(user_id, _CachedContext(cached.today, generation, cached.expires_at, values), remaining)
+
+
+class FinancialContext:
+    """Lazily loaded view of one user's current-month finances.
+
+    Each datum is queried at most once, on first access, so a reply that
+    touches several topics shares the loads. Loaded values are kept in a
+    short-lived per-user cache and reused by follow-up messages until a
+    write invalidates them.
+    """
+
+    def __init__(self, db: Session, user_id: uuid.UUID, today: date | None = None) -> None:
+        self._db = db
+        self.user_id = user_id
+        self.today = today or date.today()
+        self._cached = _start_generation(user_id, self.today)
+        # This instance's own reads, so one reply sees consistent figures
+        self._values: dict[str, object] = {}
+
+    def _get(self, name: str, loader):
+        value = self._values.get(name, _MISSING)
+        if value is _MISSING:
+            value = self._cached.values.get(name, _MISSING)
+            if value is _MISSING:
+                value = loader()
+                _publish(self.user_id, self._cached.generation, name, value)
+            self._values[name] = value
+        return value
+
+    @property
+    def user(self) -> UserSnapshot | None:
+        # The snapshot has its own cache and invalidation
+        return get_user_snapshot(self._db, self.user_id)
+
+    @property
+    def month_totals(self) -> Mapping[ExpenseCategory, float]:
+        """Spend so far this month by category, up to and including today."""
+        return self._get(
+            "month_totals",
+            lambda: MappingProxyType(month_to_date_totals_by_category(self._db, self.user_id, self.today)),
+        )
+
+    @property
+    def month_spent(self) -> float:
+        return sum(self.month_totals.values())
+
+    @property
+    def top_category(self) -> tuple[ExpenseCategory, float] | None:
+        totals = self.month_totals
+        if not totals:
+            return None
+        category = max(totals, key=totals.get)
+        return category, totals[category]
+
+    @property
+    def budget_allocated(self) -> float | None:
+        """Total allocated in this month's budget, or None when there is no budget."""
+        return self._get("budget_allocated", self._load_budget_allocated)
+
+    @property
+    def active_goals(self) -> tuple[tuple[str, float, float], ...]:
+        """(name, saved, target) for active goals, newest first."""
+        return self._get("active_goals", self._load_active_goals)
+
+    @property
+    def active_challenges(self) -> tuple[tuple[str, date], ...]:
+        """(title, end date) for active challenges, in join order."""
+        return self._get("active_challenges", self._load_active_challenges)
+
+    def _load_budget_allocated(self) -> float | None:
+        row = (
+            self._db.query(Budget.id, func.coalesce(func.sum(BudgetCategory.allocated_amount), 0).label("allocated"))
+            .outerjoin(BudgetCategory, BudgetCategory.budget_id == Budget.id)
+            .filter(
+                Budget.user_id == self.user_id,
+                Budget.month == self.today.month,
+                Budget.year == self.today.year,
+            )
+            .group_by(Budget.id)
+            .first()
+        )
+        return float(row.allocated) if row else None
+
+    def _load_active_goals(self) -> tuple[tuple[str, float, float], ...]:
+        rows = (
+            self._db.query(Goal.name, Goal.saved_amount, Goal.target_amount)
+            .filter(Goal.user_id == self.user_id, Goal.is_active == True)
+            .order_by(Goal.created_at.desc())
+            .all()
+        )
+        return tuple((r.name, float(r.saved_amount), float(r.target_amount)) for r in rows)
+
+    def _load_active_challenges(self) -> tuple[tuple[str, date], ...]:
+        rows = (
+            self._db.query(Challenge.title, UserChallenge.end_date)
+            .join(Challenge, Challenge.id == UserChallenge.challenge_id)
+            .filter(
+                UserChallenge.user_id == self.user_id,
+                UserChallenge.status == ChallengeStatus.ACTIVE,
+            )
+            .order_by(UserChallenge.created_at)
+            .all()
+        )
+        return tuple((r.title, r.end_date) for r in rows)
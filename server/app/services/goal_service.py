@@ -6,6 +6,9 @@ from sqlalchemy.orm import Session
 
 from app.models.goal import Goal, GoalContribution
 from app.schemas.goal import ContributionCreate, GoalCreate, GoalUpdate
+from app.services import leaderboard_service
+from app.services.dashboard_service import invalidate_dashboard
+from app.services.financial_context_service import invalidate_financial_context
 from app.utils.calculations import goal_progress_percent, monthly_amount_needed, months_remaining
 
 
@@ -34,8 +37,12 @@ def create_goal(db: Session, user_id: uuid.UUID, data: GoalCreate) -> Goal:
             date=date.today(),
         )
         db.add(contribution)
+        db.flush()
+        leaderboard_service.refresh_user_entries(db, user_id, [contribution.date])
 
     db.commit()
+    invalidate_dashboard(user_id)
+    invalidate_financial_context(user_id)
     db.refresh(goal)
     return goal
 
@@ -56,14 +63,22 @@ def update_goal(db: Session, user_id: uuid.UUID, goal_id: uuid.UUID, data: GoalU
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(goal, field, value)
     db.commit()
+    invalidate_dashboard(user_id)
+    invalidate_financial_context(user_id)
     db.refresh(goal)
     return goal
 
 
 def delete_goal(db: Session, user_id: uuid.UUID, goal_id: uuid.UUID) -> None:
     goal = get_goal(db, user_id, goal_id)
+    contribution_dates = [c.date for c in goal.contributions]
     db.delete(goal)
+    if contribution_dates:
+        db.flush()
+        leaderboard_service.refresh_user_entries(db, user_id, contribution_dates)
     db.commit()
+    invalidate_dashboard(user_id)
+    invalidate_financial_context(user_id)
 
 
 def add_contribution(db: Session, user_id: uuid.UUID, goal_id: uuid.UUID, data: ContributionCreate) -> GoalContribution:
@@ -71,7 +86,11 @@ def add_contribution(db: Session, user_id: uuid.UUID, goal_id: uuid.UUID, data:
     contribution = GoalContribution(goal_id=goal.id, user_id=user_id, amount=data.amount, date=data.date)
     goal.saved_amount = float(goal.saved_amount) + data.amount
     db.add(contribution)
+    db.flush()
+    leaderboard_service.refresh_user_entries(db, user_id, [contribution.date])
     db.commit()
+    invalidate_dashboard(user_id)
+    invalidate_financial_context(user_id)
     db.refresh(contribution)
     return contribution
 
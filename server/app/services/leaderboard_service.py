@@ -0,0 +1,173 @@
+import uuid
+from datetime import date
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.challenge import ChallengeLeaderboardEntry, ChallengeStatus, UserChallenge
+from app.services.challenge_progress_service import (
+    calculate_challenge_progress,
+    calculate_progress_batch,
+)
+
+RANKED_STATUSES = (ChallengeStatus.ACTIVE, ChallengeStatus.COMPLETED)
+REBUILD_CHUNK_SIZE = 500
+
+
+def upsert_entries(
+    db: Session,
+    user_challenges: list[UserChallenge],
+    progress_by_id: dict[uuid.UUID, dict] | None = None,
+) -> None:
+    """Store scores for the given user-challenges. The caller commits.
+
+    ``progress_by_id`` reuses a ``calculate_progress_batch`` result the caller
+    already has; otherwise progress is computed here.
+    """
+    if not user_challenges:
+        return
+    if progress_by_id is None:
+        progress_by_id = calculate_progress_batch(db, user_challenges)
+    stmt = insert(ChallengeLeaderboardEntry).values([
+        {
+            "user_challenge_id": uc.id,
+            "challenge_id": uc.challenge_id,
+            "user_id": uc.user_id,
+            "progress_percent": progress_by_id[uc.id]["progress_percent"],
+        }
+        # Conflict-key order, so concurrent upserts (the sweep and a user's
+        # own write) lock shared rows in the same order
+        for uc in sorted(user_challenges, key=lambda uc: uc.id)
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_challenge_id"],
+        set_={"progress_percent": stmt.excluded.progress_percent, "updated_at": func.now()},
+    )
+    db.execute(stmt)
+
+
+def remove_entry(db: Session, user_challenge_id: uuid.UUID) -> None:
+    db.query(ChallengeLeaderboardEntry).filter(
+        ChallengeLeaderboardEntry.user_challenge_id == user_challenge_id
+    ).delete(synchronize_session=False)
+
+
+def refresh_user_entries(db: Session, user_id: uuid.UUID, dates: list[date] | None = None) -> None:
+    """Re-score a user's ranked challenges whose window covers any of ``dates``.
+
+    Call after the triggering write has been flushed and before commit, so the
+    new score lands in the same transaction. ``dates=None`` re-scores all of
+    the user's ranked challenges.
+    """
+    query = db.query(UserChallenge).filter(
+        UserChallenge.user_id == user_id,
+        UserChallenge.status.in_(RANKED_STATUSES),
+    )
+    if dates:
+        query = query.filter(
+            UserChallenge.start_date <= max(dates),
+            UserChallenge.end_date >= min(dates),
+        )
+    upsert_entries(db, query.all())
+
+
+def get_top_entries(db: Session, challenge_id: uuid.UUID, limit: int) -> list[ChallengeLeaderboardEntry]:
+    return (
+        db.query(ChallengeLeaderboardEntry)
+        .filter(ChallengeLeaderboardEntry.challenge_id == challenge_id)
+        .order_by(
+            ChallengeLeaderboardEntry.progress_percent.desc(),
+            ChallengeLeaderboardEntry.user_challenge_id.desc(),
+        )
+        .limit(limit)
+        .all()
+    )
+
+
+def count_participants(db: Session, challenge_id: uuid.UUID) -> int:
+    return (
+        db.query(func.count(ChallengeLeaderboardEntry.user_challenge_id))
+        .filter(ChallengeLeaderboardEntry.challenge_id == challenge_id)
+        .scalar()
+    )
+
+
+def get_user_rank(db: Session, challenge_id: uuid.UUID, user_id: uuid.UUID) -> int | None:
+    """1-based rank of the user's entry, consistent with ``get_top_entries`` ordering."""
+    mine = (
+        db.query(ChallengeLeaderboardEntry)
+        .filter(
+            ChallengeLeaderboardEntry.challenge_id == challenge_id,
+            ChallengeLeaderboardEntry.user_id == user_id,
+        )
+        .order_by(ChallengeLeaderboardEntry.progress_percent.desc())
+        .first()
+    )
+    if not mine:
+        return None
+    ahead = (
+        db.query(func.count(ChallengeLeaderboardEntry.user_challenge_id))
+        .filter(
+            ChallengeLeaderboardEntry.challenge_id == challenge_id,
+            or_(
+                ChallengeLeaderboardEntry.progress_percent > mine.progress_percent,
+                and_(
+                    ChallengeLeaderboardEntry.progress_percent == mine.progress_percent,
+                    ChallengeLeaderboardEntry.user_challenge_id > mine.user_challenge_id,
+                ),
+            ),
+        )
+        .scalar()
+    )
+    return ahead + 1
+
+
+# ---------------------------------------------------------------------------
+# Rebuild / consistency check
+# ---------------------------------------------------------------------------
+
+def _ranked_user_challenges(db: Session, challenge_id: uuid.UUID | None):
+    query = db.query(UserChallenge).filter(UserChallenge.status.in_(RANKED_STATUSES))
+    if challenge_id:
+        query = query.filter(UserChallenge.challenge_id == challenge_id)
+    return query.order_by(UserChallenge.id)
+
+
+def rebuild_leaderboards(db: Session, challenge_id: uuid.UUID | None = None) -> int:
+    """Recompute every stored score from scratch and commit. Returns the number of entries written."""
+    written = rescore_leaderboards(db, challenge_id)
+    db.commit()
+    return written
+
+
+def rescore_leaderboards(db: Session, challenge_id: uuid.UUID | None = None) -> int:
+    """``rebuild_leaderboards`` without the commit, for schema setup's transaction."""
+    delete_q = db.query(ChallengeLeaderboardEntry)
+    if challenge_id:
+        delete_q = delete_q.filter(ChallengeLeaderboardEntry.challenge_id == challenge_id)
+    delete_q.delete(synchronize_session=False)
+
+    ids = [uc_id for (uc_id,) in _ranked_user_challenges(db, challenge_id).with_entities(UserChallenge.id)]
+    for i in range(0, len(ids), REBUILD_CHUNK_SIZE):
+        chunk = db.query(UserChallenge).filter(UserChallenge.id.in_(ids[i:i + REBUILD_CHUNK_SIZE])).all()
+        upsert_entries(db, chunk)
+    return len(ids)
+
+
+def verify_leaderboards(db: Session, challenge_id: uuid.UUID | None = None) -> list[dict]:
+    """Compare stored scores with ``calculate_challenge_progress`` and return mismatches."""
+    stored_q = db.query(ChallengeLeaderboardEntry)
+    if challenge_id:
+        stored_q = stored_q.filter(ChallengeLeaderboardEntry.challenge_id == challenge_id)
+    stored = {e.user_challenge_id: e.progress_percent for e in stored_q.all()}
+
+    mismatches = []
+    for uc in _ranked_user_challenges(db, challenge_id).all():
+        expected = calculate_challenge_progress(db, uc)["progress_percent"]
+        got = stored.pop(uc.id, None)
+        if got is None or abs(got - expected) > 0.05:
+            mismatches.append({"user_challenge_id": uc.id, "expected": expected, "stored": got})
+    for uc_id, got in stored.items():
+        mismatches.append({"user_challenge_id": uc_id, "expected": None, "stored": got})
+    return mismatches
@@ -1,13 +1,14 @@
 import uuid
+from dataclasses import dataclass, field
 from datetime import date
 
+from sqlalchemy import String, literal, select, union_all
 from sqlalchemy.orm import Session
 
-from app.models.expense import ExpenseCategory
+from app.models.budget import Budget, BudgetCategory
+from app.models.expense import ExpenseCategory, UserMonthCategoryTotal
 from app.models.goal import Goal
 from app.schemas.nudge import AdjustmentOption, BudgetImpact, GoalImpact, NudgeCheckResponse
-from app.services.budget_service import get_category_allocation, get_current_budget
-from app.services.expense_service import get_category_spend, get_month_total
 from app.utils.calculations import days_remaining_in_month
 
 CATEGORY_LABELS = {
@@ -25,6 +26,48 @@ CATEGORY_LABELS = {
 }
 
 
+@dataclass(frozen=True)
+class SpendSnapshot:
+    """Everything a nudge needs for one user's month, loaded once."""
+
+    allocations: dict[ExpenseCategory, float] = field(default_factory=dict)
+    spend: dict[ExpenseCategory, float] = field(default_factory=dict)
+    goal_names: list[str] = field(default_factory=list)
+
+
+def load_snapshot(db: Session, user_id: uuid.UUID, month: int, year: int) -> SpendSnapshot:
+    # Allocations and spend share one round trip; active goals are the second.
+    spend_q = select(
+        literal("spend", String).label("kind"),
+        UserMonthCategoryTotal.category,
+        UserMonthCategoryTotal.total.label("amount"),
+    ).where(
+        UserMonthCategoryTotal.user_id == user_id,
+        UserMonthCategoryTotal.year == year,
+        UserMonthCategoryTotal.month == month,
+    )
+    alloc_q = (
+        select(
+            literal("alloc", String).label("kind"),
+            BudgetCategory.category,
+            BudgetCategory.allocated_amount.label("amount"),
+        )
+        .join(Budget, BudgetCategory.budget_id == Budget.id)
+        .where(Budget.user_id == user_id, Budget.month == month, Budget.year == year)
+    )
+
+    allocations: dict[ExpenseCategory, float] = {}
+    spend: dict[ExpenseCategory, float] = {}
+    for row in db.execute(union_all(spend_q, alloc_q)):
+        target = spend if row.kind == "spend" else allocations
+        target[row.category] = float(row.amount)
+
+    goal_names = [
+        name for (name,) in db.query(Goal.name).filter(Goal.user_id == user_id, Goal.is_active == True).all()
+    ]
+    return SpendSnapshot(allocations=allocations, spend=spend, goal_names=goal_names)
+
+
 def evaluate_spend(
     db: Session,
     user_id: uuid.UUID,
@@ -32,11 +75,31 @@ def evaluate_spend(
     category: ExpenseCategory,
 ) -> NudgeCheckResponse:
     today = date.today()
-    month, year = today.month, today.year
+    snapshot = load_snapshot(db, user_id, today.month, today.year)
+    return evaluate_against_snapshot(snapshot, amount, category)
+
+
+def evaluate_spend_batch(
+    db: Session,
+    user_id: uuid.UUID,
+    candidates: list[tuple[float, ExpenseCategory]],
+) -> list[NudgeCheckResponse]:
+    """Evaluate each candidate purchase independently against one snapshot."""
+    today = date.today()
+    snapshot = load_snapshot(db, user_id, today.month, today.year)
+    return [evaluate_against_snapshot(snapshot, amount, category) for amount, category in candidates]
+
+
+def evaluate_against_snapshot(
+    snapshot: SpendSnapshot,
+    amount: float,
+    category: ExpenseCategory,
+) -> NudgeCheckResponse:
+    label = CATEGORY_LABELS.get(category, category.value)
 
     # 1. Category budget and current spend
-    allocation = get_category_allocation(db, user_id, category, month, year)
-    current_spend = get_category_spend(db, user_id, category, month, year)
+    allocation = snapshot.allocations.get(category, 0.0)
+    current_spend = snapshot.spend.get(category, 0.0)
 
     remaining_before = allocation - current_spend
     remaining_after = remaining_before - amount
@@ -45,18 +108,15 @@ def evaluate_spend(
     percent_used_after = int((current_spend + amount) / allocation * 100) if allocation > 0 else 100
 
     budget_impact = BudgetImpact(
-        category_name=CATEGORY_LABELS.get(category, category.value),
+        category_name=label,
         remaining_before=remaining_before,
         remaining_after=remaining_after,
         percent_used_after=min(percent_used_after, 999),
     )
 
     # 3. Goal impact
-    goals = db.query(Goal).filter(Goal.user_id == user_id, Goal.is_active == True).all()
-    goal_impacts = []
-    for g in goals:
-        # Simple heuristic: if over budget, it could affect goal savings
-        goal_impacts.append(GoalImpact(goal_name=g.name, affected=remaining_after < 0))
+    # Simple heuristic: if over budget, it could affect goal savings
+    goal_impacts = [GoalImpact(goal_name=name, affected=remaining_after < 0) for name in snapshot.goal_names]
 
     # 4. Determine status
     days_left = days_remaining_in_month()
@@ -67,28 +127,18 @@ def evaluate_spend(
         message = "No budget set for this category. Consider creating a budget to track your spending."
     elif remaining_after >= 0 and percent_used_after <= 75:
         nudge_status = "OK"
-        message = f"This fits within your {CATEGORY_LABELS.get(category, category.value)} budget. You'll have {_fmt(remaining_after)} left."
+        message = f"This fits within your {label} budget. You'll have {_fmt(remaining_after)} left."
     elif remaining_after >= 0 and percent_used_after > 75:
         nudge_status = "WARNING"
-        message = f"You'll use {percent_used_after}% of your {CATEGORY_LABELS.get(category, category.value)} budget with {days_left} days left this month."
+        message = f"You'll use {percent_used_after}% of your {label} budget with {days_left} days left this month."
     else:
         nudge_status = "EXCEEDS"
-        message = f"This would exceed your {CATEGORY_LABELS.get(category, category.value)} budget by {_fmt(abs(remaining_after))}."
+        message = f"This would exceed your {label} budget by {_fmt(abs(remaining_after))}."
 
     # 5. Adjustment options (if exceeds, find spare budget in other categories)
     adjustment_options = []
     if nudge_status == "EXCEEDS":
-        budget = get_current_budget(db, user_id, month, year)
-        if budget:
-            for bc in budget.categories:
-                if bc.category != category:
-                    cat_spent = get_category_spend(db, user_id, bc.category, month, year)
-                    available = float(bc.allocated_amount) - cat_spent
-                    if available > 0:
-                        adjustment_options.append(AdjustmentOption(
-                            category=CATEGORY_LABELS.get(bc.category, bc.category.value),
-                            available=available,
-                        ))
+        adjustment_options = _adjustment_options(snapshot, category)
 
     return NudgeCheckResponse(
         status=nudge_status,
@@ -100,5 +150,19 @@ def evaluate_spend(
     )
 
 
+def _adjustment_options(snapshot: SpendSnapshot, category: ExpenseCategory) -> list[AdjustmentOption]:
+    options = []
+    for other, allocated in snapshot.allocations.items():
+        if other == category:
+            continue
+        available = allocated - snapshot.spend.get(other, 0.0)
+        if available > 0:
+            options.append(AdjustmentOption(
+                category=CATEGORY_LABELS.get(other, other.value),
+                available=available,
+            ))
+    return options
+
+
 def _fmt(amount: float) -> str:
     return f"\u20b9{int(round(amount)):,}"
@@ -0,0 +1,228 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Integer, cast, extract, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.expense import Expense, ExpenseCategory, UserDayCategoryTotal, UserMonthCategoryTotal
+
+# (user_id, day, category) -> (amount delta, count delta). Daily deltas are
+# applied to the daily rollup and summed into the monthly one.
+RollupKey = tuple[uuid.UUID, date, ExpenseCategory]
+RollupDeltas = dict[RollupKey, tuple[Decimal, int]]
+
+
+def _to_decimal(amount) -> Decimal:
+    return amount if isinstance(amount, Decimal) else Decimal(str(amount))
+
+
+def add_delta(deltas: RollupDeltas, user_id: uuid.UUID, expense_date, category: ExpenseCategory, amount, count: int) -> None:
+    key = (user_id, expense_date, category)
+    prev_amount, prev_count = deltas.get(key, (Decimal("0"), 0))
+    deltas[key] = (prev_amount + _to_decimal(amount), prev_count + count)
+
+
+def _conflict_key(row: dict, index_elements: list[str]) -> tuple:
+    return tuple(getattr(row[c], "value", row[c]) for c in index_elements)
+
+
+def _upsert(db: Session, model, index_elements: list[str], rows: list[dict]) -> None:
+    if not rows:
+        return
+    # Rows are locked in VALUES order; one global order keeps two
+    # transactions touching overlapping keys from deadlocking each other
+    rows = sorted(rows, key=lambda row: _conflict_key(row, index_elements))
+    stmt = insert(model).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={
+            "total": model.total + stmt.excluded.total,
+            "expense_count": model.expense_count + stmt.excluded.expense_count,
+        },
+    )
+    db.execute(stmt)
+
+
+def apply_deltas(db: Session, deltas: RollupDeltas) -> None:
+    """Upsert daily and monthly rollup rows inside the caller's transaction; the caller commits."""
+    monthly: dict[tuple, tuple[Decimal, int]] = {}
+    day_rows = []
+    for (user_id, day, category), (amount, count) in deltas.items():
+        if amount == 0 and count == 0:
+            continue
+        day_rows.append({
+            "user_id": user_id,
+            "day": day,
+            "category": category,
+            "total": amount,
+            "expense_count": count,
+        })
+        month_key = (user_id, day.year, day.month, category)
+        prev_amount, prev_count = monthly.get(month_key, (Decimal("0"), 0))
+        monthly[month_key] = (prev_amount + amount, prev_count + count)
+
+    month_rows = [
+        {
+            "user_id": user_id,
+            "year": year,
+            "month": month,
+            "category": category,
+            "total": amount,
+            "expense_count": count,
+        }
+        for (user_id, year, month, category), (amount, count) in monthly.items()
+        if amount != 0 or count != 0
+    ]
+    _upsert(db, UserDayCategoryTotal, ["user_id", "day", "category"], day_rows)
+    _upsert(db, UserMonthCategoryTotal, ["user_id", "year", "month", "category"], month_rows)
+
+
+def month_totals_by_category(db: Session, user_id: uuid.UUID, month: int, year: int) -> dict[ExpenseCategory, float]:
+    rows = (
+        db.query(UserMonthCategoryTotal.category, UserMonthCategoryTotal.total)
+        .filter(
+            UserMonthCategoryTotal.user_id == user_id,
+            UserMonthCategoryTotal.year == year,
+            UserMonthCategoryTotal.month == month,
+            UserMonthCategoryTotal.expense_count > 0,
+        )
+        .all()
+    )
+    return {r.category: float(r.total) for r in rows}
+
+
+def month_to_date_totals_by_category(db: Session, user_id: uuid.UUID, today: date) -> dict[ExpenseCategory, float]:
+    """Spend from the first of ``today``'s month through ``today``; future-dated expenses are left out."""
+    rows = (
+        db.query(UserDayCategoryTotal.category, func.sum(UserDayCategoryTotal.total).label("total"))
+        .filter(
+            UserDayCategoryTotal.user_id == user_id,
+            UserDayCategoryTotal.day >= today.replace(day=1),
+            UserDayCategoryTotal.day <= today,
+        )
+        .group_by(UserDayCategoryTotal.category)
+        .having(func.sum(UserDayCategoryTotal.expense_count) > 0)
+        .all()
+    )
+    return {r.category: float(r.total) for r in rows}
+
+
+# ---------------------------------------------------------------------------
+# Rebuild / drift verification
+# ---------------------------------------------------------------------------
+
+def _aggregate_from_expenses(db: Session, user_id: uuid.UUID | None = None):
+    year_col = cast(extract("year", Expense.date), Integer).label("year")
+    month_col = cast(extract("month", Expense.date), Integer).label("month")
+    query = db.query(
+        Expense.user_id,
+        year_col,
+        month_col,
+        Expense.category,
+        func.sum(Expense.amount).label("total"),
+        func.count(Expense.id).label("expense_count"),
+    )
+    if user_id:
+        query = query.filter(Expense.user_id == user_id)
+    return query.group_by(Expense.user_id, year_col, month_col, Expense.category)
+
+
+def _daily_aggregate_from_expenses(db: Session, user_id: uuid.UUID | None = None):
+    query = db.query(
+        Expense.user_id,
+        Expense.date.label("day"),
+        Expense.category,
+        func.sum(Expense.amount).label("total"),
+        func.count(Expense.id).label("expense_count"),
+    )
+    if user_id:
+        query = query.filter(Expense.user_id == user_id)
+    return query.group_by(Expense.user_id, Expense.date, Expense.category)
+
+
+def rebuild_rollups(db: Session, user_id: uuid.UUID | None = None) -> int:
+    """Recompute daily and monthly rollup rows from raw expenses. Returns the number of rows written."""
+    written = 0
+    for model, columns, aggregate in (
+        (UserMonthCategoryTotal, ["user_id", "year", "month", "category"], _aggregate_from_expenses),
+        (UserDayCategoryTotal, ["user_id", "day", "category"], _daily_aggregate_from_expenses),
+    ):
+        delete_q = db.query(model)
+        if user_id:
+            delete_q = delete_q.filter(model.user_id == user_id)
+        delete_q.delete(synchronize_session=False)
+
+        stmt = insert(model).from_select(
+            columns + ["total", "expense_count"],
+            aggregate(db, user_id).statement,
+        )
+        written += db.execute(stmt).rowcount
+    db.commit()
+    return written
+
+
+def _drift(expected: dict, stored: dict) -> list[tuple]:
+    mismatches = []
+    for key in expected.keys() | stored.keys():
+        exp_total, exp_count = expected.get(key, (Decimal("0"), 0))
+        got_total, got_count = stored.get(key, (Decimal("0"), 0))
+        if exp_total != got_total or exp_count != got_count:
+            mismatches.append((key, exp_total, got_total, exp_count, got_count))
+    return mismatches
+
+
+def verify_rollups(db: Session, user_id: uuid.UUID | None = None) -> list[dict]:
+    """Compare both rollup tables with a fresh aggregate and return every mismatch.
+
+    Monthly entries carry ``year``/``month``; daily entries carry ``day``.
+    """
+    expected = {
+        (r.user_id, r.year, r.month, r.category): (Decimal(r.total), r.expense_count)
+        for r in _aggregate_from_expenses(db, user_id).all()
+    }
+    stored_q = db.query(UserMonthCategoryTotal)
+    if user_id:
+        stored_q = stored_q.filter(UserMonthCategoryTotal.user_id == user_id)
+    stored = {
+        (r.user_id, r.year, r.month, r.category): (Decimal(r.total), r.expense_count)
+        for r in stored_q.all()
+    }
+
+    drift = []
+    for (user, year, month, category), exp_total, got_total, exp_count, got_count in _drift(expected, stored):
+        drift.append({
+            "user_id": user,
+            "year": year,
+            "month": month,
+            "category": category,
+            "expected_total": float(exp_total),
+            "stored_total": float(got_total),
+            "expected_count": exp_count,
+            "stored_count": got_count,
+        })
+
+    expected_daily = {
+        (r.user_id, r.day, r.category): (Decimal(r.total), r.expense_count)
+        for r in _daily_aggregate_from_expenses(db, user_id).all()
+    }
+    stored_daily_q = db.query(UserDayCategoryTotal)
+    if user_id:
+        stored_daily_q = stored_daily_q.filter(UserDayCategoryTotal.user_id == user_id)
+    stored_daily = {
+        (r.user_id, r.day, r.category): (Decimal(r.total), r.expense_count)
+        for r in stored_daily_q.all()
+    }
+
+    for (user, day, category), exp_total, got_total, exp_count, got_count in _drift(expected_daily, stored_daily):
+        drift.append({
+            "user_id": user,
+            "day": day,
+            "category": category,
+            "expected_total": float(exp_total),
+            "stored_total": float(got_total),
+            "expected_count": exp_count,
+            "stored_count": got_count,
+        })
+    return drift
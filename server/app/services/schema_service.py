@@ -0,0 +1,110 @@
+import logging
+from pathlib import Path
+
+from sqlalchemy import column, func, inspect, select, table
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+
+from app.models.schema_state import SchemaState
+from app.utils.seed_challenges import SEED_VERSION, seed_challenges
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+# Revision this code expects; tests/unit/test_schema_revision.py keeps it at
+# the Alembic head. A constant lets the startup check skip importing Alembic.
+HEAD_REVISION = "0009"
+# Schema that create_all produced before migrations existed; such databases
+# are stamped with it on first setup and upgraded from there
+BASELINE_REVISION = "0001"
+# pg_advisory_xact_lock key serialising setup across workers and the CLI
+SETUP_LOCK_KEY = 0x42345550
+# Adds the persisted leaderboard. Scores are computed in Python, so
+# databases upgraded across it are rescored here rather than in the migration
+LEADERBOARD_REVISION = "0003"
+
+_alembic_version = table("alembic_version", column("version_num"))
+
+
+def _alembic_config(connection=None):
+    from alembic.config import Config
+
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def applied_versions(db: Session) -> tuple[str | None, int | None] | None:
+    """(Alembic revision, seed_version) recorded in the database, or None if never set up."""
+    stmt = select(
+        select(_alembic_version.c.version_num).scalar_subquery(),
+        select(SchemaState.seed_version).where(SchemaState.id == 1).scalar_subquery(),
+    )
+    try:
+        # A savepoint keeps a missing table from aborting the caller's transaction
+        with db.begin_nested():
+            row = db.execute(stmt).one()
+    except ProgrammingError:
+        return None
+    return row[0], row[1]
+
+
+def is_current(db: Session) -> bool:
+    return applied_versions(db) == (HEAD_REVISION, SEED_VERSION)
+
+
+def apply_schema_and_seed(db: Session, force: bool = False) -> dict:
+    """Upgrade to HEAD_REVISION, seed reference data and record the seed version.
+
+    Everything runs in one transaction holding an advisory lock, so workers
+    starting together wait for the first one and then find the marker current.
+    ``force`` re-runs seeding even then. A database that existed before
+    LEADERBOARD_REVISION has its leaderboard scored in the same transaction.
+    """
+    connection = db.connection()
+    connection.execute(select(func.pg_advisory_xact_lock(SETUP_LOCK_KEY)))
+
+    before = applied_versions(db)
+    if before == (HEAD_REVISION, SEED_VERSION) and not force:
+        db.commit()
+        return {"revision": HEAD_REVISION, "seed_version": SEED_VERSION, "upgraded": False, "seeded": 0, "rescored": 0}
+
+    from alembic import command
+    from alembic.migration import MigrationContext
+
+    config = _alembic_config(connection)
+    tables = inspect(connection)
+    if not tables.has_table("alembic_version") and tables.has_table("users"):
+        logger.info("Stamping pre-migration schema as revision %s", BASELINE_REVISION)
+        command.stamp(config, BASELINE_REVISION)
+    # None for an empty database, which has nothing to rescore
+    from_revision = MigrationContext.configure(connection).get_current_revision()
+    command.upgrade(config, HEAD_REVISION)
+
+    seeded = seed_challenges(db)
+    stmt = insert(SchemaState).values(id=1, seed_version=SEED_VERSION)
+    stmt = stmt.on_conflict_do_update(index_elements=["id"], set_={"seed_version": stmt.excluded.seed_version})
+    db.execute(stmt)
+
+    rescored = 0
+    if from_revision is not None and from_revision < LEADERBOARD_REVISION:
+        from app.services.leaderboard_service import rescore_leaderboards
+
+        rescored = rescore_leaderboards(db)
+    db.commit()
+
+    upgraded = before is None or before[0] != HEAD_REVISION
+    logger.info(
+        "Schema at revision %s, seed v%s (%s challenge(s) seeded, %s leaderboard entries scored)",
+        HEAD_REVISION, SEED_VERSION, seeded, rescored,
+    )
+    return {
+        "revision": HEAD_REVISION,
+        "seed_version": SEED_VERSION,
+        "upgraded": upgraded,
+        "seeded": seeded,
+        "rescored": rescored,
+    }
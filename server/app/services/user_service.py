@@ -1,14 +1,99 @@
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
-from app.models.user import FixedExpense, User
+from app.config import settings
+from app.models.user import DependentType, FixedExpense, FixedExpenseCategory, User
 from app.schemas.user import DependentUpdate, FixedExpensesUpdate, IncomeUpdate, UserUpdate
+from app.services.dashboard_service import invalidate_dashboard
+from app.utils.cache import TTLCache
+
+
+@dataclass(frozen=True)
+class FixedExpenseSnapshot:
+    category: FixedExpenseCategory
+    amount: float
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Immutable, detached copy of the fields read-only endpoints need."""
+
+    id: uuid.UUID
+    phone: str
+    name: str
+    age: int | None
+    city: str | None
+    monthly_salary: float | None
+    other_income: float
+    dependent_type: DependentType | None
+    onboarding_complete: bool
+    created_at: datetime
+    fixed_expenses: tuple[FixedExpenseSnapshot, ...]
+
+
+_snapshot_cache = TTLCache(settings.USER_CACHE_MAX_ENTRIES, settings.USER_CACHE_TTL_SECONDS)
+# Bumped by every invalidation. A load only stores its snapshot if no
+# invalidation happened since it started, so a profile write that commits
+# mid-load cannot be masked by the older copy for a whole TTL.
+_snapshot_version = 0
+_snapshot_lock = threading.Lock()
+
+
+def _to_snapshot(user: User) -> UserSnapshot:
+    return UserSnapshot(
+        id=user.id,
+        phone=user.phone,
+        name=user.name,
+        age=user.age,
+        city=user.city,
+        monthly_salary=float(user.monthly_salary) if user.monthly_salary is not None else None,
+        other_income=float(user.other_income or 0),
+        dependent_type=user.dependent_type,
+        onboarding_complete=user.onboarding_complete,
+        created_at=user.created_at,
+        fixed_expenses=tuple(
+            FixedExpenseSnapshot(category=fe.category, amount=float(fe.amount)) for fe in user.fixed_expenses
+        ),
+    )
+
+
+def get_user_snapshot(db: Session, user_id: uuid.UUID) -> UserSnapshot | None:
+    version = _snapshot_version
+    snapshot = _snapshot_cache.get(user_id)
+    if snapshot is None:
+        user = (
+            db.query(User)
+            .options(selectinload(User.fixed_expenses))
+            .filter(User.id == user_id)
+            .first()
+        )
+        if not user:
+            return None
+        snapshot = _to_snapshot(user)
+        with _snapshot_lock:
+            if version == _snapshot_version:
+                _snapshot_cache.set(user_id, snapshot)
+    return snapshot
+
+
+def invalidate_user_snapshot(user_id: uuid.UUID) -> None:
+    global _snapshot_version
+    with _snapshot_lock:
+        _snapshot_version += 1
+        _snapshot_cache.invalidate(user_id)
+    invalidate_dashboard(user_id)
 
 
 def update_profile(db: Session, user: User, data: UserUpdate) -> User:
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(user, field, value)
     db.commit()
+    invalidate_user_snapshot(user.id)
     db.refresh(user)
     return user
 
@@ -17,6 +102,7 @@ def set_income(db: Session, user: User, data: IncomeUpdate) -> User:
     user.monthly_salary = data.monthly_salary
     user.other_income = data.other_income
     db.commit()
+    invalidate_user_snapshot(user.id)
     db.refresh(user)
     return user
 
@@ -27,6 +113,7 @@ def set_fixed_expenses(db: Session, user: User, data: FixedExpensesUpdate) -> Us
     for exp in data.expenses:
         db.add(FixedExpense(user_id=user.id, category=exp.category, amount=exp.amount))
     db.commit()
+    invalidate_user_snapshot(user.id)
     db.refresh(user)
     return user
 
@@ -34,6 +121,7 @@ def set_fixed_expenses(db: Session, user: User, data: FixedExpensesUpdate) -> Us
 def set_dependents(db: Session, user: User, data: DependentUpdate) -> User:
     user.dependent_type = data.dependent_type
     db.commit()
+    invalidate_user_snapshot(user.id)
     db.refresh(user)
     return user
 
@@ -43,5 +131,6 @@ def complete_onboarding(db: Session, user: User) -> User:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Income must be set before completing onboarding")
     user.onboarding_complete = True
     db.commit()
+    invalidate_user_snapshot(user.id)
     db.refresh(user)
     return user
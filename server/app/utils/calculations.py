@@ -1,6 +1,8 @@
 import math
 from datetime import date
 
+from app.utils.date_ranges import month_bounds
+
 
 def months_remaining(target_date: date) -> int:
     today = date.today()
@@ -20,11 +22,8 @@ def monthly_amount_needed(target: float, saved: float, target_date: date) -> flo
 
 def days_remaining_in_month() -> int:
     today = date.today()
-    if today.month == 12:
-        last_day = date(today.year + 1, 1, 1)
-    else:
-        last_day = date(today.year, today.month + 1, 1)
-    return (last_day - today).days
+    _, next_first = month_bounds(today.month, today.year)
+    return (next_first - today).days
 
 
 def goal_progress_percent(saved: float, target: float) -> int:
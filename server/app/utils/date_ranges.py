@@ -0,0 +1,20 @@
+from datetime import date
+
+from sqlalchemy import and_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def month_bounds(month: int, year: int) -> tuple[date, date]:
+    """Return the half-open range [first day, first day of next month)."""
+    first = date(year, month, 1)
+    if month == 12:
+        next_first = date(year + 1, 1, 1)
+    else:
+        next_first = date(year, month + 1, 1)
+    return first, next_first
+
+
+def in_month(column, month: int, year: int) -> ColumnElement[bool]:
+    """Index-friendly month filter: ``column >= first AND column < next_first``."""
+    first, next_first = month_bounds(month, year)
+    return and_(column >= first, column < next_first)
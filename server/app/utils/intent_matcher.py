@@ -0,0 +1,50 @@
+import re
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_HITS = "\0hits"
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class IntentMatcher:
+    """Weighted keyword matcher compiled into a token trie.
+
+    Keywords match whole tokens only, so "hi" does not fire on "this" or
+    "shipping"; multi-word keywords ("mutual fund") match consecutive tokens.
+    A message is scanned once, walking the trie from each token, and every
+    intent collects the weights of its keywords that occur.
+    """
+
+    def __init__(self, intents: dict[str, dict[str, float]]) -> None:
+        # Declaration order breaks ties between equal scores
+        self._order = {name: i for i, name in enumerate(intents)}
+        self._root: dict = {}
+        self._max_len = 1
+        for intent, keywords in intents.items():
+            for phrase, weight in keywords.items():
+                tokens = tokenize(phrase)
+                node = self._root
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node.setdefault(_HITS, []).append((intent, weight))
+                self._max_len = max(self._max_len, len(tokens))
+
+    def scores(self, text: str) -> dict[str, float]:
+        tokens = tokenize(text)
+        scores: dict[str, float] = {}
+        for i in range(len(tokens)):
+            node = self._root
+            for token in tokens[i:i + self._max_len]:
+                node = node.get(token)
+                if node is None:
+                    break
+                for intent, weight in node.get(_HITS, ()):
+                    scores[intent] = scores.get(intent, 0.0) + weight
+        return scores
+
+    def rank(self, text: str) -> list[str]:
+        """Matched intents, best first."""
+        scores = self.scores(text)
+        return sorted(scores, key=lambda name: (-scores[name], self._order[name]))
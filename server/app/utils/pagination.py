@@ -0,0 +1,36 @@
+import base64
+import json
+import uuid
+from datetime import date, datetime
+
+
+def encode_expense_cursor(expense_date: date, created_at: datetime, expense_id: uuid.UUID) -> str:
+    """Opaque cursor for the (date, created_at, id) keyset ordering."""
+    raw = json.dumps([expense_date.isoformat(), created_at.isoformat(), str(expense_id)])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_expense_cursor(cursor: str) -> tuple[date, datetime, uuid.UUID]:
+    """Inverse of ``encode_expense_cursor``; raises ValueError on malformed input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        d, created, expense_id = json.loads(base64.urlsafe_b64decode(padded))
+        return date.fromisoformat(d), datetime.fromisoformat(created), uuid.UUID(expense_id)
+    except (TypeError, json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+
+
+def encode_chat_cursor(created_at: datetime, message_id: uuid.UUID) -> str:
+    """Opaque cursor for the (created_at, id) chat history ordering."""
+    raw = json.dumps([created_at.isoformat(), str(message_id)])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_chat_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of ``encode_chat_cursor``; raises ValueError on malformed input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created, message_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created), uuid.UUID(message_id)
+    except (TypeError, json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
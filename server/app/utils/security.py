@@ -1,32 +1,147 @@
+import asyncio
+import functools
+import hashlib
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
-import bcrypt
-from jose import jwt
-
 from app.config import settings
 
+# bcrypt and the JWT library are imported on first use, so processes that
+# never reach the auth path (health checks, cold starts) don't load them.
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the bcrypt queue is full and the request should be shed."""
+
+
+class _PasswordHasher:
+    """Runs bcrypt on a small dedicated pool so a login burst cannot take
+    every request thread's CPU; callers await the result on the event loop,
+    so waiting logins hold no threadpool thread, and anything beyond
+    ``max_pending`` is rejected instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self.max_pending = max_pending
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+
+    async def run(self, fn, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            return await asyncio.wrap_future(self._executor.submit(self._timed, fn, *args))
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def _timed(self, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.completed += 1
+                self.busy_seconds += time.perf_counter() - start
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rounds": settings.BCRYPT_ROUNDS,
+                "pending": self.pending,
+                "peak_pending": self.peak_pending,
+                "max_pending": self.max_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_ms": round(self.busy_seconds * 1000 / self.completed, 2) if self.completed else 0.0,
+            }
+
+
+password_hasher = _PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+
+
+def _hash(password: str) -> str:
+    import bcrypt
+
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
 
+def _verify(plain: str, hashed: str) -> bool:
+    import bcrypt
 
-def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
 
 
+async def hash_password(password: str) -> str:
+    return await password_hasher.run(_hash, password)
+
+
+async def verify_password(plain: str, hashed: str) -> bool:
+    return await password_hasher.run(_verify, plain, hashed)
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """True when the stored hash was made with a different bcrypt cost."""
+    try:
+        return int(hashed.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+class InvalidToken(Exception):
+    """Token failed signature, expiry or format checks."""
+
+
+@functools.cache
+def _jwt_backend():
+    if settings.JWT_BACKEND == "pyjwt":
+        import jwt as pyjwt
+
+        return pyjwt.encode, pyjwt.decode, pyjwt.PyJWTError
+    if settings.JWT_BACKEND != "jose":
+        raise ValueError(f"Unknown JWT_BACKEND {settings.JWT_BACKEND!r}; use 'jose' or 'pyjwt'")
+    from jose import JWTError, jwt
+
+    return jwt.encode, jwt.decode, JWTError
+
+
 def create_access_token(user_id: uuid.UUID) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {"sub": str(user_id), "exp": expire, "type": "access"}
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encode, _, _ = _jwt_backend()
+    return encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def create_refresh_token(user_id: uuid.UUID) -> tuple[str, datetime]:
     expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     payload = {"sub": str(user_id), "exp": expire, "type": "refresh", "jti": str(uuid.uuid4())}
-    token = jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encode, _, _ = _jwt_backend()
+    token = encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return token, expire
 
 
+def hash_token(token: str) -> str:
+    """Fixed-width digest used to store and look up refresh tokens."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 def decode_token(token: str) -> dict:
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    """Verify signature and expiry; raises InvalidToken whichever backend is in use."""
+    _, decode, error = _jwt_backend()
+    try:
+        return decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except error as exc:
+        raise InvalidToken(str(exc)) from exc
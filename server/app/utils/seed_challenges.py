@@ -3,6 +3,9 @@ from sqlalchemy.orm import Session
 from app.models.challenge import BadgeType, Challenge, ChallengeType
 from app.models.expense import ExpenseCategory
 
+# Bump when SEED_CHALLENGES changes so the next setup run applies it
+SEED_VERSION = 1
+
 SEED_CHALLENGES = [
     {
         "title": "30-Day Savings Sprint",
@@ -52,13 +55,16 @@ SEED_CHALLENGES = [
 ]
 
 
-def seed_challenges(db: Session) -> None:
-    existing_count = db.query(Challenge).count()
-    if existing_count > 0:
-        return
+def seed_challenges(db: Session) -> int:
+    """Insert seed challenges whose title is not present yet. Returns how many were added.
 
-    for data in SEED_CHALLENGES:
-        challenge = Challenge(**data)
-        db.add(challenge)
+    Only flushes: schema_service commits together with the version marker
+    while holding the setup lock, so concurrent runs cannot both insert.
+    """
+    existing = {title for (title,) in db.query(Challenge.title).all()}
+    missing = [data for data in SEED_CHALLENGES if data["title"] not in existing]
+    for data in missing:
+        db.add(Challenge(**data))
 
-    db.commit()
+    db.flush()
+    return len(missing)
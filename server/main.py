@@ -1,27 +1,70 @@
+import asyncio
+import contextlib
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.database import SessionLocal, engine
-from app.models.base import Base
+from app.database import SessionLocal, async_engine, get_pool_status
+from app.middleware.lazy_routers import ROUTER_MODULES, LazyRouterMiddleware, include_router_module
+from app.utils.security import password_hasher
 
-# Import all models so Base.metadata knows about them
-from app.models import budget, challenge, chat, checklist, expense, goal, user  # noqa: F401
-from app.routers import auth, budgets, challenges, chat as chat_router, checklist as checklist_router, dashboard, expenses, goals, nudge, users
-from app.utils.seed_challenges import seed_challenges
+logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
+def _run_sweep() -> dict:
+    from app.services.challenge_lifecycle_service import sweep_challenges
+
     db = SessionLocal()
     try:
-        seed_challenges(db)
+        return sweep_challenges(db)
     finally:
         db.close()
+
+
+async def _sweep_challenges_periodically(interval: int) -> None:
+    while True:
+        try:
+            result = await asyncio.to_thread(_run_sweep)
+            logger.info("Challenge sweep: %s", result)
+        except Exception:
+            logger.exception("Challenge sweep failed")
+        await asyncio.sleep(interval)
+
+
+def _check_schema() -> None:
+    """One read of the Alembic revision and seed marker; migrations and seeding only run when behind."""
+    # Imported here: it loads every model, Alembic and the seed data
+    from app.services import schema_service
+
+    db = SessionLocal()
+    try:
+        if schema_service.is_current(db):
+            return
+        if settings.SCHEMA_AUTO_APPLY and not settings.is_serverless:
+            schema_service.apply_schema_and_seed(db)
+        else:
+            logger.warning("Database schema or seed data is out of date; run `python -m app.cli db-setup`")
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _check_schema()
+
+    sweeper = None
+    if not settings.is_serverless and settings.CHALLENGE_SWEEP_INTERVAL_SECONDS > 0:
+        sweeper = asyncio.create_task(_sweep_challenges_periodically(settings.CHALLENGE_SWEEP_INTERVAL_SECONDS))
     yield
+    if sweeper:
+        sweeper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sweeper
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 app = FastAPI(
@@ -40,18 +83,24 @@ app.add_middleware(
 )
 
 # Mount routers
-app.include_router(auth.router, prefix="/api/v1")
-app.include_router(users.router, prefix="/api/v1")
-app.include_router(expenses.router, prefix="/api/v1")
-app.include_router(budgets.router, prefix="/api/v1")
-app.include_router(goals.router, prefix="/api/v1")
-app.include_router(checklist_router.router, prefix="/api/v1")
-app.include_router(nudge.router, prefix="/api/v1")
-app.include_router(dashboard.router, prefix="/api/v1")
-app.include_router(challenges.router, prefix="/api/v1")
-app.include_router(chat_router.router, prefix="/api/v1")
+API_PREFIX = "/api/v1"
+if settings.lazy_routers:
+    app.add_middleware(LazyRouterMiddleware, fastapi_app=app, api_prefix=API_PREFIX, modules=ROUTER_MODULES)
+else:
+    for module_path in ROUTER_MODULES.values():
+        include_router_module(app, module_path, API_PREFIX)
 
 
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/db-pool")
+def db_pool_health():
+    return get_pool_status()
+
+
+@app.get("/health/password-hasher")
+def password_hasher_health():
+    return password_hasher.stats()
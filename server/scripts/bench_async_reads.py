@@ -0,0 +1,127 @@
+"""Load-test the ported read routes with the sync Session path and the asyncpg path.
+
+Run from the server directory against a database that is already set up:
+``DATABASE_URL=... python scripts/bench_async_reads.py [--concurrency N] [--requests N]``.
+Starts uvicorn twice on a local port, with DB_ASYNC_ENABLED=false and
+then true. Each run drives the same mix of GETs (dashboard, expense list,
+monthly summary, spending series, chat history) for one synthetic user, with N
+requests in flight at once. Both runs use the same pool size.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+from app.database import SessionLocal  # noqa: E402
+from app.utils.security import create_access_token  # noqa: E402
+from bench_data import create_bench_user  # noqa: E402
+
+SERVER_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+
+def read_paths(today: date) -> tuple[str, ...]:
+    year_ago = today.replace(year=today.year - 1)
+    return (
+        "/api/v1/dashboard",
+        "/api/v1/expenses?page_size=20",
+        f"/api/v1/expenses/summary/monthly?month={today.month}&year={today.year}",
+        f"/api/v1/expenses/analytics/series?start_date={year_ago}&end_date={today}&granularity=month",
+        "/api/v1/chat/history",
+    )
+
+
+def start_server(port: int, async_enabled: bool) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DB_ASYNC_ENABLED": "true" if async_enabled else "false",
+        "CHALLENGE_SWEEP_INTERVAL_SECONDS": "0",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=SERVER_DIR,
+        env=env,
+    )
+
+
+async def wait_until_up(base_url: str) -> None:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(100):
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+async def load(base_url: str, headers: dict, paths: tuple[str, ...], concurrency: int, total: int) -> tuple[list[float], int, float]:
+    timings: list[float] = []
+    errors = 0
+    next_index = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=60) as client:
+        for path in paths:  # warm-up: lazy imports, caches, pool
+            await client.get(path)
+
+        async def worker() -> None:
+            nonlocal errors, next_index
+            while next_index < total:
+                path = paths[next_index % len(paths)]
+                next_index += 1
+                start = time.perf_counter()
+                try:
+                    resp = await client.get(path)
+                    ok = resp.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                timings.append((time.perf_counter() - start) * 1000)
+                errors += not ok
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return timings, errors, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--port", type=int, default=8123)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        user_id = create_bench_user(db, months=12)
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+    base_url = f"http://127.0.0.1:{args.port}"
+    paths = read_paths(date.today())
+
+    print(f"{args.requests} GETs, {args.concurrency} in flight")
+    for label, async_enabled in (("sync Session + threadpool", False), ("AsyncSession (asyncpg)", True)):
+        server = start_server(args.port, async_enabled)
+        try:
+            asyncio.run(wait_until_up(base_url))
+            timings, errors, elapsed = asyncio.run(load(base_url, headers, paths, args.concurrency, args.requests))
+        finally:
+            server.terminate()
+            server.wait()
+        timings.sort()
+        p99 = timings[int(len(timings) * 0.99) - 1]
+        print(
+            f"{label:>26}: {len(timings) / elapsed:7.1f} req/s, p50 {statistics.median(timings):7.1f} ms, "
+            f"p99 {p99:7.1f} ms, {errors} error(s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Per-request overhead of the access-token dependency.
+
+Run from the server directory: ``DATABASE_URL=... python scripts/bench_auth.py [--rounds N]``.
+Settings need ``DATABASE_URL``, but nothing connects to it. Each case calls ``get_current_user_id`` with the
+same bearer token, the way a mobile client reuses one token until it
+expires. The "before" case replays the original dependency body:
+``decode_token`` with python-jose, then the type check and ``uuid.UUID``.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.middleware import auth  # noqa: E402
+from app.utils import security  # noqa: E402
+
+
+def use_backend(name: str) -> None:
+    settings.JWT_BACKEND = name
+    security._jwt_backend.cache_clear()
+
+
+def before(credentials: HTTPAuthorizationCredentials) -> None:
+    payload = security.decode_token(credentials.credentials)
+    if payload.get("type") != "access":
+        raise ValueError("not an access token")
+    uuid.UUID(payload["sub"])
+
+
+def uncached(credentials: HTTPAuthorizationCredentials) -> None:
+    auth._claims_cache.clear()
+    auth.get_current_user_id(credentials)
+
+
+def cached(credentials: HTTPAuthorizationCredentials) -> None:
+    auth.get_current_user_id(credentials)
+
+
+def measure(fn, credentials: HTTPAuthorizationCredentials, rounds: int) -> float:
+    fn(credentials)  # warm-up: backend import, first cache fill
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(credentials)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{args.rounds} calls per case, {settings.ALGORITHM}")
+    for label, backend, fn in (
+        ("before: jose decode every request", "jose", before),
+        ("jose, cache miss", "jose", uncached),
+        ("pyjwt, cache miss", "pyjwt", uncached),
+        ("cache hit", "jose", cached),
+    ):
+        use_backend(backend)
+        token = security.create_access_token(uuid.uuid4())
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        print(f"{label:>34}: {measure(fn, credentials, args.rounds):7.1f} us median")
+
+
+if __name__ == "__main__":
+    main()
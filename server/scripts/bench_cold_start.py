@@ -0,0 +1,70 @@
+"""Time the database work a worker does at startup: the schema/seed marker check
+against the create_all + seed lookup every worker ran before.
+
+Run from the server directory against a database that is already set up:
+``DATABASE_URL=... python scripts/bench_cold_start.py [--rounds N]``.
+Each round opens a new connection, as a cold worker would.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.models import Base, Challenge  # noqa: E402
+from app.services import schema_service  # noqa: E402
+
+
+def old_startup(db: Session) -> None:
+    # What lifespan did before the marker: create_all checks every table, then the seed lookup
+    Base.metadata.create_all(bind=db.connection())
+    db.query(Challenge.title).all()
+
+
+def marker_check(db: Session) -> None:
+    assert schema_service.is_current(db), "run `python -m app.cli db-setup` first"
+
+
+def measure(engine, fn, rounds: int) -> tuple[float, int]:
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    timings = []
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            with Session(engine) as db:
+                fn(db)
+                db.rollback()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return statistics.median(timings), statements // rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    print(f"{args.rounds} rounds, new connection each")
+    for label, fn in (("create_all + seed lookup (old)", old_startup), ("marker check", marker_check)):
+        ms, statements = measure(engine, fn, args.rounds)
+        print(f"{label:>31}: {ms:7.2f} ms median, {statements} statement(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Compare the dashboard's database work before and after the single-statement assembler.
+
+Run from the server directory against a database that is already set up:
+``DATABASE_URL=... python scripts/bench_dashboard.py [--months N] [--rounds N]``.
+A synthetic user with ``--months`` of expenses is created first. The
+"before" path replays the original route's queries (user, lazy fixed
+expenses, month total over ``expenses``, every checklist row, the goal).
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import event, extract, func  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import SessionLocal, engine  # noqa: E402
+from app.models.checklist import ChecklistStatus, UserChecklistItem  # noqa: E402
+from app.models.expense import Expense  # noqa: E402
+from app.models.goal import Goal  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services import dashboard_service, user_service  # noqa: E402
+from bench_data import create_bench_user  # noqa: E402
+
+
+def before(db: Session, user_id: uuid.UUID) -> None:
+    today = date.today()
+    user = db.query(User).filter(User.id == user_id).first()
+    sum(float(fe.amount) for fe in user.fixed_expenses)
+    db.query(func.sum(Expense.amount)).filter(
+        Expense.user_id == user_id,
+        extract("month", Expense.date) == today.month,
+        extract("year", Expense.date) == today.year,
+    ).scalar()
+    items = db.query(UserChecklistItem).filter(UserChecklistItem.user_id == user_id).all()
+    sum(1 for i in items if i.status == ChecklistStatus.COMPLETE)
+    db.query(Goal).filter(Goal.user_id == user_id, Goal.is_active == True).first()
+
+
+def after_uncached(db: Session, user_id: uuid.UUID) -> None:
+    user_service.invalidate_user_snapshot(user_id)
+    dashboard_service.get_dashboard(db, user_service.get_user_snapshot(db, user_id))
+
+
+def after_cached(db: Session, user_id: uuid.UUID) -> None:
+    dashboard_service.get_dashboard(db, user_service.get_user_snapshot(db, user_id))
+
+
+def measure(fn, user_id: uuid.UUID, rounds: int) -> tuple[float, int]:
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    timings = []
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        for _ in range(rounds):
+            with SessionLocal() as db:
+                db.connection()  # check out before timing, as the request's session would be open already
+                start = time.perf_counter()
+                fn(db, user_id)
+                timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return statistics.median(timings), statements / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        user_id = create_bench_user(db, months=args.months)
+
+    print(f"{args.rounds} rounds, user with {args.months} months of expenses")
+    for label, fn in (
+        ("before (5 queries, expenses scan)", before),
+        ("after, cache miss", after_uncached),
+        ("after, cache hit", after_cached),
+    ):
+        ms, statements = measure(fn, user_id, args.rounds)
+        print(f"{label:>34}: {ms:7.3f} ms median, {statements:.0f} statement(s)")
+
+
+if __name__ == "__main__":
+    main()
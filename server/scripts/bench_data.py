@@ -0,0 +1,69 @@
+"""Synthetic user shared by the benchmark scripts.
+
+``create_bench_user`` inserts one user with fixed expenses, a checklist,
+an active goal and ``months`` months of expenses ending today, then
+rebuilds that user's rollups so the rollup-backed reads see the data.
+"""
+
+import random
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.models.checklist import ChecklistItemType, ChecklistStatus, UserChecklistItem
+from app.models.expense import Expense, ExpenseCategory
+from app.models.goal import Goal, GoalIcon
+from app.models.user import FixedExpense, FixedExpenseCategory, User
+from app.services import rollup_service
+
+
+def create_bench_user(db: Session, months: int = 36, per_day: int = 3, seed: int = 7) -> uuid.UUID:
+    rng = random.Random(seed)
+    user = User(
+        phone=str(uuid.uuid4().int)[:12],
+        name="Bench User",
+        password_hash="not-a-real-hash",
+        monthly_salary=90000,
+        other_income=5000,
+        onboarding_complete=True,
+    )
+    db.add(user)
+    db.flush()
+
+    db.add_all([
+        FixedExpense(user_id=user.id, category=FixedExpenseCategory.RENT, amount=18000),
+        FixedExpense(user_id=user.id, category=FixedExpenseCategory.BILLS, amount=3500),
+    ])
+    db.add_all(
+        UserChecklistItem(
+            user_id=user.id,
+            item_type=item_type,
+            status=ChecklistStatus.COMPLETE if i % 2 else ChecklistStatus.MISSING,
+        )
+        for i, item_type in enumerate(ChecklistItemType)
+    )
+    db.add(Goal(
+        user_id=user.id, name="Trip", icon=GoalIcon.TRIP, target_amount=60000,
+        saved_amount=12000, target_date=date.today() + timedelta(days=180),
+    ))
+
+    categories = list(ExpenseCategory)
+    today = date.today()
+    day = today - timedelta(days=months * 30)
+    rows = []
+    while day <= today:
+        for _ in range(per_day):
+            rows.append({
+                "id": uuid.uuid4(),
+                "user_id": user.id,
+                "amount": round(rng.uniform(20, 2500), 2),
+                "category": rng.choice(categories),
+                "date": day,
+            })
+        day += timedelta(days=1)
+    db.bulk_insert_mappings(Expense, rows)
+    db.commit()
+
+    rollup_service.rebuild_rollups(db, user.id)
+    return user.id
@@ -0,0 +1,67 @@
+"""Time chat intent selection: the token-trie matcher against the old substring cascade.
+
+Run from the server directory: ``python scripts/bench_intent_matcher.py [--rounds N]``.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+# app.config needs a URL to import; nothing here connects
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.services.chat_service import select_intents  # noqa: E402
+
+MESSAGES = [
+    "hi",
+    "hi, how much did I spend this month?",
+    "am I over budget on groceries",
+    "how are my savings goals doing",
+    "should I invest in mutual funds or a SIP",
+    "my salary vs spending",
+    "budget, goals, challenges and income",
+    "tell me a joke",
+    "I went shopping this weekend and was wondering whether that blew my food and dining budget, "
+    "and also how the emergency fund goal is tracking against the target date I set in January",
+]
+
+# The keyword cascade chat_service used before the matcher: first substring hit wins
+_OLD_CASCADE = [
+    ("greeting", ["hi", "hello", "hey", "howdy"]),
+    ("spending", ["spend", "spent", "expense", "expenses", "spending"]),
+    ("budget", ["budget"]),
+    ("goal", ["goal", "saving", "save", "target"]),
+    ("challenge", ["challenge"]),
+    ("income", ["income", "salary", "earn", "earning"]),
+    ("investment", ["invest", "investment", "stock", "mutual fund", "sip"]),
+]
+
+
+def old_select(question: str) -> list[str]:
+    q = question.lower()
+    for intent, words in _OLD_CASCADE:
+        if any(w in q for w in words):
+            return [intent]
+    return []
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{len(MESSAGES)} messages x {args.rounds} rounds")
+    for label, fn in (("substring cascade (old)", old_select), ("token trie", select_intents)):
+        seconds = min(timeit.repeat(lambda: [fn(m) for m in MESSAGES], number=args.rounds, repeat=3))
+        per_message_us = seconds / (args.rounds * len(MESSAGES)) * 1e6
+        print(f"{label:>24}: {per_message_us:6.2f} us/message")
+
+    print("\nmessage -> old | new")
+    for m in MESSAGES:
+        print(f"  {m[:60]!r}: {old_select(m)} | {select_intents(m)}")
+
+
+if __name__ == "__main__":
+    main()
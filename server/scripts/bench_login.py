@@ -0,0 +1,99 @@
+"""Measure login latency and dashboard-read latency while a login burst is running.
+
+Run from the server directory against a database that is already set up:
+``DATABASE_URL=... BCRYPT_ROUNDS=10 python scripts/bench_login.py [--logins N] [--readers N]``.
+Requests go through the ASGI app in process, so FastAPI's threadpool and
+the bcrypt pool behave as they do under uvicorn, without network noise.
+Each reader issues dashboard GETs back to back while the logins run.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+from main import app  # noqa: E402
+
+PASSWORD = "bench-pass-1"
+
+
+def percentiles(samples: list[float]) -> str:
+    if not samples:
+        return "no samples"
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {statistics.median(ordered):7.1f} ms, p99 {p99:7.1f} ms, n={len(ordered)}"
+
+
+async def timed(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> float:
+    start = time.perf_counter()
+    resp = await client.request(method, url, **kwargs)
+    resp.raise_for_status()
+    return (time.perf_counter() - start) * 1000
+
+
+async def register(client: httpx.AsyncClient) -> tuple[str, dict]:
+    phone = str(uuid.uuid4().int)[:12]
+    resp = await client.post("/api/v1/auth/register", json={"phone": phone, "name": "Bench", "password": PASSWORD})
+    resp.raise_for_status()
+    return phone, {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+async def readers(client: httpx.AsyncClient, headers: dict, count: int, stop: asyncio.Event) -> list[float]:
+    samples: list[float] = []
+
+    async def reader() -> None:
+        while not stop.is_set():
+            samples.append(await timed(client, "GET", "/api/v1/dashboard", headers=headers))
+
+    await asyncio.gather(*(reader() for _ in range(count)))
+    return samples
+
+
+async def run(args: argparse.Namespace) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        phone, headers = await register(client)
+        login = {"phone": phone, "password": PASSWORD}
+        await timed(client, "GET", "/api/v1/dashboard", headers=headers)
+
+        stop = asyncio.Event()
+        idle_task = asyncio.create_task(readers(client, headers, args.readers, stop))
+        await asyncio.sleep(args.idle_seconds)
+        stop.set()
+        idle = await idle_task
+
+        stop = asyncio.Event()
+        busy_task = asyncio.create_task(readers(client, headers, args.readers, stop))
+        start = time.perf_counter()
+        logins = await asyncio.gather(
+            *(timed(client, "POST", "/api/v1/auth/login", json=login) for _ in range(args.logins))
+        )
+        burst_seconds = time.perf_counter() - start
+        stop.set()
+        busy = await busy_task
+
+    print(f"{args.logins} concurrent logins, {args.readers} dashboard readers, BCRYPT_ROUNDS={os.environ.get('BCRYPT_ROUNDS', '12')}")
+    print(f"  dashboard, no logins : {percentiles(idle)}")
+    print(f"  dashboard, during    : {percentiles(busy)}")
+    print(f"  login                : {percentiles(logins)}")
+    print(f"  login throughput     : {args.logins / burst_seconds:7.1f} /s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=60)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--idle-seconds", type=float, default=3.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
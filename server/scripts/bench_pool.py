@@ -0,0 +1,71 @@
+"""Per-request database latency under each pool configuration.
+
+Run from the server directory: ``DATABASE_URL=... python scripts/bench_pool.py [--threads N] [--requests N]``.
+A "request" opens a session, runs one small query and closes the session,
+which is what a handler using ``get_db`` does around its own work.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import NullPool, QueuePool  # noqa: E402
+
+from app.config import settings  # noqa: E402
+
+CONFIGS = {
+    "NullPool + pre_ping (baseline)": {"poolclass": NullPool, "pool_pre_ping": True},
+    "NullPool (serverless default)": {"poolclass": NullPool, "pool_pre_ping": False},
+    "QueuePool + pre_ping (server default)": {"poolclass": QueuePool, "pool_pre_ping": True},
+    "QueuePool, no pre_ping": {"poolclass": QueuePool, "pool_pre_ping": False},
+}
+
+
+def run(options: dict, threads: int, requests: int) -> list[float]:
+    if options["poolclass"] is QueuePool:
+        options = {**options, "pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW}
+    engine = create_engine(settings.DATABASE_URL, **options)
+    timings: list[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        mine = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            with Session(engine) as db:
+                db.execute(text("SELECT 1"))
+            mine.append((time.perf_counter() - start) * 1000)
+        with lock:
+            timings.extend(mine)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    engine.dispose()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=250)
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads x {args.requests} requests, pool_size={settings.DB_POOL_SIZE}")
+    for label, options in CONFIGS.items():
+        samples = sorted(run(options, args.threads, args.requests))
+        p99 = samples[int(len(samples) * 0.99) - 1]
+        print(f"{label:>38}: p50 {statistics.median(samples):6.2f} ms, p99 {p99:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Time the spending series over 12- and 36-month ranges and count its statements.
+
+Run from the server directory against a database that is already set up:
+``DATABASE_URL=... python scripts/bench_series.py [--rounds N]``.
+A synthetic user with 36 months of expenses is created first. The
+"before" path is what a client had to do without the endpoint: one
+``get_monthly_summary`` call per month in the range.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import SessionLocal, engine  # noqa: E402
+from app.services.analytics_service import get_spending_series  # noqa: E402
+from app.services.expense_service import get_monthly_summary  # noqa: E402
+from app.utils.date_ranges import month_bounds  # noqa: E402
+from bench_data import create_bench_user  # noqa: E402
+
+
+def whole_months(months: int) -> tuple[date, date]:
+    """The ``months`` whole months ending with the current one."""
+    today = date.today()
+    index = today.year * 12 + today.month - 1 - (months - 1)
+    start = date(index // 12, index % 12 + 1, 1)
+    end = month_bounds(today.month, today.year)[1] - timedelta(days=1)
+    return start, end
+
+
+def monthly_summaries(db: Session, user_id: uuid.UUID, start: date, end: date) -> None:
+    current = start
+    while current <= end:
+        get_monthly_summary(db, user_id, current.month, current.year)
+        current = month_bounds(current.month, current.year)[1]
+
+
+def measure(fn, rounds: int) -> tuple[float, float]:
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    timings = []
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        for _ in range(rounds):
+            with SessionLocal() as db:
+                db.connection()  # check out before timing, as the request's session would be open already
+                start = time.perf_counter()
+                fn(db)
+                timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return statistics.median(timings), statements / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        user_id = create_bench_user(db, months=36)
+
+    print(f"{args.rounds} rounds, user with 36 months of expenses")
+    for months in (12, 36):
+        start, end = whole_months(months)
+        cases = {
+            "before: get_monthly_summary per month": lambda db: monthly_summaries(db, user_id, start, end),
+            "series, month": lambda db: get_spending_series(db, user_id, start, end, "month"),
+            "series, week": lambda db: get_spending_series(db, user_id, start, end, "week"),
+            "series, day": lambda db: get_spending_series(db, user_id, start, end, "day"),
+        }
+        print(f"{months} months ({start} to {end})")
+        for label, fn in cases.items():
+            ms, statements = measure(fn, args.rounds)
+            print(f"{label:>40}: {ms:7.2f} ms median, {statements:.0f} statement(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import uuid
+
+from app.models.user import User
+
+
+def _register(client, phone: str | None = None) -> dict:
+    phone = phone or str(uuid.uuid4().int)[:12]
+    resp = client.post("/api/v1/auth/register", json={"phone": phone, "name": "Token User", "password": "secret123"})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+def _stored_hash(db, phone: str) -> str:
+    db.expire_all()
+    return db.query(User.password_hash).filter(User.phone == phone).scalar()
+
+
+def test_refresh_token_rotates_once(client):
+    tokens = _register(client)
+
+    rotated = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert rotated.status_code == 200, rotated.text
+    assert rotated.json()["refresh_token"] != tokens["refresh_token"]
+
+    replay = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert replay.status_code == 401
+
+
+def test_logout_revokes_refresh_token(client):
+    tokens = _register(client)
+
+    assert client.post("/api/v1/auth/logout", json={"refresh_token": tokens["refresh_token"]}).status_code == 200
+    resp = client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert resp.status_code == 401
+
+
+def test_login_rehashes_a_hash_made_with_another_cost(client, db, monkeypatch):
+    phone = str(uuid.uuid4().int)[:12]
+    _register(client, phone)
+    assert client.post("/api/v1/auth/login", json={"phone": phone, "password": "wrong"}).status_code == 401
+
+    monkeypatch.setattr("app.utils.security.settings.BCRYPT_ROUNDS", 5)
+    resp = client.post("/api/v1/auth/login", json={"phone": phone, "password": "secret123"})
+    assert resp.status_code == 200, resp.text
+    assert _stored_hash(db, phone).startswith("$2b$05$")
+
+
+def test_login_succeeds_when_the_pool_is_too_busy_to_rehash(client, db, monkeypatch):
+    from app.utils import security
+
+    phone = str(uuid.uuid4().int)[:12]
+    _register(client, phone)
+    old_hash = _stored_hash(db, phone)
+
+    async def busy_hash(password):
+        raise security.PasswordHasherBusy()
+
+    monkeypatch.setattr("app.utils.security.settings.BCRYPT_ROUNDS", 5)
+    monkeypatch.setattr("app.services.auth_service.hash_password", busy_hash)
+    resp = client.post("/api/v1/auth/login", json={"phone": phone, "password": "secret123"})
+    assert resp.status_code == 200, resp.text
+    assert _stored_hash(db, phone) == old_hash
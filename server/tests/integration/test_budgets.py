@@ -0,0 +1,48 @@
+from datetime import date
+
+from app.database import engine
+from app.models.expense import ExpenseCategory
+from tests.helpers import capture_queries
+
+
+def _current_budget_queries(client, headers) -> tuple[int, dict]:
+    with capture_queries(engine) as statements:
+        resp = client.get("/api/v1/budgets/current", headers=headers)
+    assert resp.status_code == 200, resp.text
+    return len(statements), resp.json()
+
+
+def _set_categories(client, headers, budget_id: str, categories: list[ExpenseCategory]) -> None:
+    resp = client.put(
+        f"/api/v1/budgets/{budget_id}/categories",
+        json={"categories": [{"category": c.value, "allocated_amount": 1000} for c in categories]},
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+
+
+def test_current_budget_query_count_does_not_grow_with_categories(client, auth_headers):
+    today = date.today()
+    budget = client.post(
+        "/api/v1/budgets",
+        json={"month": today.month, "year": today.year, "total_income": 50000},
+        headers=auth_headers,
+    ).json()
+    for category in (ExpenseCategory.GROCERIES, ExpenseCategory.TRANSPORT):
+        resp = client.post(
+            "/api/v1/expenses",
+            json={"amount": 250, "category": category.value, "date": str(today)},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201, resp.text
+
+    _set_categories(client, auth_headers, budget["id"], [ExpenseCategory.GROCERIES, ExpenseCategory.TRANSPORT])
+    few, body = _current_budget_queries(client, auth_headers)
+    assert {c["category"]: c["spent_amount"] for c in body["categories"]} == {"GROCERIES": 250, "TRANSPORT": 250}
+
+    _set_categories(client, auth_headers, budget["id"], list(ExpenseCategory))
+    many, body = _current_budget_queries(client, auth_headers)
+    assert len(body["categories"]) == len(ExpenseCategory)
+
+    # Budget, its categories (selectin) and one spend lookup for all of them
+    assert few == many <= 3
@@ -0,0 +1,57 @@
+import uuid
+from datetime import date
+
+from app.database import SessionLocal
+from app.models.challenge import Challenge, ChallengeLeaderboardEntry, ChallengeStatus, UserBadge, UserChallenge
+from app.models.expense import Expense, ExpenseCategory
+from app.services import challenge_lifecycle_service
+from app.services.challenge_lifecycle_service import sweep_challenges
+
+
+def test_sweep_rescores_entries_changed_behind_the_users_back(client, auth_headers, db, user_id):
+    challenge = db.query(Challenge).filter(Challenge.title == "No Shopping Challenge").one()
+    resp = client.post("/api/v1/challenges/join", json={"challenge_id": str(challenge.id)}, headers=auth_headers)
+    assert resp.status_code == 201, resp.text
+    uc_id = resp.json()["id"]
+
+    def stored_score():
+        db.expire_all()
+        return db.query(ChallengeLeaderboardEntry.progress_percent).filter(
+            ChallengeLeaderboardEntry.user_challenge_id == uc_id
+        ).scalar()
+
+    assert stored_score() == 100
+
+    # Written without going through expense_service, so no leaderboard refresh
+    db.add(Expense(user_id=user_id, amount=250, category=ExpenseCategory.SHOPPING, date=date.today()))
+    db.commit()
+    assert stored_score() == 100
+
+    sweep_challenges(db)
+    assert stored_score() == 0
+
+
+def test_sweep_skips_challenges_settled_after_it_read_them(client, auth_headers, db, user_id, monkeypatch):
+    challenge = db.query(Challenge).filter(Challenge.title == "No Shopping Challenge").one()
+    resp = client.post("/api/v1/challenges/join", json={"challenge_id": str(challenge.id)}, headers=auth_headers)
+    assert resp.status_code == 201, resp.text
+    uc_id = uuid.UUID(resp.json()["id"])
+
+    real_batch = challenge_lifecycle_service.calculate_progress_batch
+
+    def abandon_while_scoring(session, user_challenges):
+        progress = real_batch(session, user_challenges)
+        with SessionLocal() as other:
+            other.query(UserChallenge).filter(UserChallenge.id == uc_id).update(
+                {"status": ChallengeStatus.ABANDONED}
+            )
+            other.commit()
+        progress[uc_id]["is_completed"] = True
+        return progress
+
+    monkeypatch.setattr(challenge_lifecycle_service, "calculate_progress_batch", abandon_while_scoring)
+    sweep_challenges(db)
+
+    db.expire_all()
+    assert db.get(UserChallenge, uc_id).status == ChallengeStatus.ABANDONED
+    assert db.query(UserBadge).filter(UserBadge.user_id == user_id).count() == 0
@@ -0,0 +1,30 @@
+from app.database import pool_metrics
+from app.services import dashboard_service
+from app.services.user_service import get_user_snapshot, invalidate_user_snapshot
+
+
+def test_figures_loaded_across_an_invalidation_are_not_cached(db, user_id, monkeypatch):
+    real_load = dashboard_service._load_figures
+
+    def load_during_write(db, user_id, month, year):
+        figures = real_load(db, user_id, month, year)
+        # An expense write commits and invalidates before this load stores its result
+        dashboard_service.invalidate_dashboard(user_id)
+        return figures
+
+    user = get_user_snapshot(db, user_id)
+    dashboard_service.invalidate_dashboard(user_id)
+    monkeypatch.setattr(dashboard_service, "_load_figures", load_during_write)
+    dashboard_service.get_dashboard(db, user)
+    assert dashboard_service._dashboard_cache.get(user_id) is None
+
+    monkeypatch.setattr(dashboard_service, "_load_figures", real_load)
+    dashboard_service.get_dashboard(db, user)
+    assert dashboard_service._dashboard_cache.get(user_id) is not None
+
+
+def test_dashboard_request_checks_out_one_connection(client, auth_headers, user_id):
+    invalidate_user_snapshot(user_id)
+    before = pool_metrics.snapshot()["checkouts"]
+    assert client.get("/api/v1/dashboard", headers=auth_headers).status_code == 200
+    assert pool_metrics.snapshot()["checkouts"] - before == 1
@@ -0,0 +1,31 @@
+from app.database import engine
+from app.models.expense import ExpenseCategory
+from app.services.expense_service import list_expenses
+from tests.helpers import capture_queries, explain
+
+
+def _plans(db, **filters) -> list[str]:
+    with capture_queries(engine) as statements:
+        list_expenses(db, filters.pop("user_id"), **filters)
+    plans = [explain(db, stmt, params) for stmt, params in statements if "FROM expenses" in stmt]
+    db.rollback()
+    assert plans
+    return plans
+
+
+def _index_conditions(plan: str) -> str:
+    return "\n".join(line for line in plan.splitlines() if "Index Cond:" in line)
+
+
+def test_month_filter_is_an_index_range_scan(db, user_id):
+    for plan in _plans(db, user_id=user_id, month=3, year=2024, include_total=True):
+        conditions = _index_conditions(plan)
+        assert "date >= '2024-03-01'" in conditions and "date < '2024-04-01'" in conditions
+        assert "date_part" not in plan and "EXTRACT" not in plan
+
+
+def test_category_month_filter_is_an_index_range_scan(db, user_id):
+    for plan in _plans(db, user_id=user_id, month=3, year=2024, category=ExpenseCategory.GROCERIES):
+        conditions = _index_conditions(plan)
+        assert "date >= '2024-03-01'" in conditions and "date < '2024-04-01'" in conditions
+        assert "date_part" not in plan and "EXTRACT" not in plan
@@ -0,0 +1,130 @@
+import csv
+import io
+import json
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+
+from fastapi import HTTPException
+
+from app.database import SessionLocal
+from app.models.expense import Expense
+from app.services import expense_service, rollup_service
+
+
+def _add_expenses(client, headers, count: int, start: date = date(2024, 3, 1)) -> None:
+    for i in range(count):
+        resp = client.post(
+            "/api/v1/expenses",
+            json={"amount": 10 + i, "category": "GROCERIES", "description": f"item {i}", "date": str(start + timedelta(days=i % 3))},
+            headers=headers,
+        )
+        assert resp.status_code == 201, resp.text
+
+
+def test_cursor_pages_cover_every_expense_once(client, auth_headers):
+    _add_expenses(client, auth_headers, 7)
+
+    seen = []
+    params = {"page_size": 3}
+    while True:
+        body = client.get("/api/v1/expenses", params=params, headers=auth_headers).json()
+        seen.extend(item["id"] for item in body["items"])
+        if not body["next_cursor"]:
+            break
+        params = {"page_size": 3, "cursor": body["next_cursor"]}
+
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_export_streams_csv(client, auth_headers, monkeypatch):
+    # Several partitions, not just one
+    monkeypatch.setattr("app.services.expense_export_service.EXPORT_CHUNK_SIZE", 2)
+    _add_expenses(client, auth_headers, 5)
+
+    resp = client.get("/api/v1/expenses/export", params={"format": "csv"}, headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 5
+    assert sorted(float(r["amount"]) for r in rows) == [10, 11, 12, 13, 14]
+    assert [r["date"] for r in rows] == sorted(r["date"] for r in rows)
+
+
+def test_export_streams_ndjson(client, auth_headers, monkeypatch):
+    monkeypatch.setattr("app.services.expense_export_service.EXPORT_CHUNK_SIZE", 2)
+    _add_expenses(client, auth_headers, 5)
+
+    resp = client.get(
+        "/api/v1/expenses/export",
+        params={"format": "ndjson", "start_date": "2024-03-02"},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    records = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(records) == 3
+    assert all(r["date"] >= "2024-03-02" and r["category"] == "GROCERIES" for r in records)
+
+
+def test_blank_description_is_stored_the_same_by_api_and_import(client, auth_headers):
+    resp = client.post(
+        "/api/v1/expenses",
+        json={"amount": 5, "category": "OTHER", "description": "", "date": "2024-05-01"},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 201, resp.text
+    assert resp.json()["description"] is None
+
+    body = "\n".join(
+        json.dumps({"amount": 6, "category": "OTHER", "description": desc, "date": "2024-05-02"})
+        for desc in ("", None)
+    )
+    resp = client.post(
+        "/api/v1/expenses/bulk",
+        content=body,
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert resp.json()["inserted"] == 2, resp.text
+
+    items = client.get("/api/v1/expenses", headers=auth_headers).json()["items"]
+    assert [item["description"] for item in items] == [None, None, None]
+
+
+def test_concurrent_deletes_apply_the_rollup_delta_once(client, auth_headers, user_id):
+    resp = client.post(
+        "/api/v1/expenses",
+        json={"amount": 30, "category": "TRANSPORT", "date": "2024-06-01"},
+        headers=auth_headers,
+    )
+    expense_id = uuid.UUID(resp.json()["id"])
+
+    holder = SessionLocal()
+    holder.query(Expense).filter(Expense.id == expense_id).with_for_update().one()
+    outcome = []
+
+    def delete_in_other_session():
+        db = SessionLocal()
+        try:
+            expense_service.delete_expense(db, user_id, expense_id)
+            outcome.append("deleted")
+        except HTTPException as exc:
+            outcome.append(exc.status_code)
+        finally:
+            db.close()
+
+    racer = threading.Thread(target=delete_in_other_session)
+    racer.start()
+    time.sleep(0.3)
+    assert racer.is_alive(), "delete did not wait for the row lock"
+
+    expense_service.delete_expense(holder, user_id, expense_id)
+    racer.join()
+    holder.close()
+
+    assert outcome == [404]
+    with SessionLocal() as db:
+        assert rollup_service.verify_rollups(db, user_id) == []
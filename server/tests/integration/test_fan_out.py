@@ -0,0 +1,28 @@
+import threading
+
+from sqlalchemy import text
+
+from app import database
+
+
+def _task(session):
+    session.execute(text("SELECT 1"))
+    return threading.current_thread().name
+
+
+def test_runs_inline_when_no_helper_permit_is_free(db, monkeypatch):
+    monkeypatch.setattr(database, "_fanout_permits", threading.BoundedSemaphore(0))
+    names = database.fan_out(db, _task, _task, _task)
+    assert names == [threading.current_thread().name] * 3
+
+
+def test_helpers_return_their_permits(db, monkeypatch):
+    permits = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(database, "_fanout_permits", permits)
+    monkeypatch.setattr(database.settings, "DB_FANOUT_CONCURRENCY", 3)
+
+    for _ in range(3):
+        assert len(database.fan_out(db, _task, _task, _task)) == 3
+    # All released: the bounded semaphore can be taken once, and only once
+    assert permits.acquire(blocking=False)
+    assert not permits.acquire(blocking=False)
@@ -0,0 +1,35 @@
+from datetime import date
+
+from app.services.financial_context_service import FinancialContext
+
+
+def test_month_spent_excludes_future_dated_expenses(client, auth_headers, db, user_id):
+    for amount, day in ((100, "2024-03-05"), (40, "2024-03-10"), (900, "2024-03-20")):
+        resp = client.post(
+            "/api/v1/expenses",
+            json={"amount": amount, "category": "SHOPPING", "date": day},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201, resp.text
+
+    ctx = FinancialContext(db, user_id, today=date(2024, 3, 10))
+    assert ctx.month_spent == 140
+
+
+def test_load_finishing_after_invalidation_is_not_cached(db, user_id, monkeypatch):
+    from app.models.expense import ExpenseCategory
+    from app.services import financial_context_service
+
+    real_loader = financial_context_service.month_to_date_totals_by_category
+
+    def stale_loader(db, user_id, today):
+        # A write commits and invalidates while this load is in flight
+        financial_context_service.invalidate_financial_context(user_id)
+        return {ExpenseCategory.SHOPPING: 999.0}
+
+    today = date(2024, 4, 10)
+    monkeypatch.setattr(financial_context_service, "month_to_date_totals_by_category", stale_loader)
+    assert FinancialContext(db, user_id, today=today).month_spent == 999
+
+    monkeypatch.setattr(financial_context_service, "month_to_date_totals_by_category", real_loader)
+    assert FinancialContext(db, user_id, today=today).month_spent == 0
@@ -0,0 +1,16 @@
+SWEEP_URL = "/api/v1/internal/challenges/sweep"
+
+
+def test_sweep_endpoint_is_off_without_a_secret(client, monkeypatch):
+    monkeypatch.setattr("app.routers.internal.settings.CRON_SECRET", "")
+    assert client.get(SWEEP_URL, headers={"Authorization": "Bearer "}).status_code == 404
+
+
+def test_sweep_endpoint_requires_the_cron_secret(client, monkeypatch):
+    monkeypatch.setattr("app.routers.internal.settings.CRON_SECRET", "s3cret")
+    assert client.get(SWEEP_URL).status_code == 401
+    assert client.get(SWEEP_URL, headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    resp = client.get(SWEEP_URL, headers={"Authorization": "Bearer s3cret"})
+    assert resp.status_code == 200, resp.text
+    assert set(resp.json()) == {"checked", "completed", "failed"}
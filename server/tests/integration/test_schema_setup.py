@@ -0,0 +1,130 @@
+import threading
+from datetime import date
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, func, inspect, select, text
+from sqlalchemy.orm import Session
+
+from app.models import Base
+from app.models.challenge import Challenge
+from app.services import schema_service
+from app.utils.security import hash_token
+from app.utils.seed_challenges import SEED_CHALLENGES, SEED_VERSION
+from tests.conftest import TEST_DATABASE_URL
+
+SCRATCH_SCHEMA = "schema_setup_test"
+
+
+@pytest.fixture
+def scratch_engine(migrated_engine):
+    """Engine whose search_path is an empty schema of its own."""
+    engine = create_engine(TEST_DATABASE_URL, connect_args={"options": f"-csearch_path={SCRATCH_SCHEMA}"})
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCRATCH_SCHEMA}"))
+    yield engine
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA {SCRATCH_SCHEMA} CASCADE"))
+    engine.dispose()
+
+
+def _challenge_count(engine) -> int:
+    with Session(engine) as db:
+        return db.scalar(select(func.count()).select_from(Challenge))
+
+
+def test_empty_database_is_migrated_to_head_and_seeded(scratch_engine):
+    with Session(scratch_engine) as db:
+        assert not schema_service.is_current(db)
+        result = schema_service.apply_schema_and_seed(db)
+
+        assert result["upgraded"] and result["seeded"] == len(SEED_CHALLENGES)
+        assert result["rescored"] == 0
+        assert schema_service.applied_versions(db) == (schema_service.HEAD_REVISION, SEED_VERSION)
+        assert schema_service.is_current(db)
+
+
+def test_migrations_match_the_models(scratch_engine):
+    with Session(scratch_engine) as db:
+        schema_service.apply_schema_and_seed(db)
+
+    with scratch_engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+    assert diff == []
+
+
+def test_pre_migration_database_is_stamped_then_upgraded(scratch_engine):
+    # What create_all built before migrations: the baseline tables, no alembic_version
+    with scratch_engine.begin() as conn:
+        command.upgrade(schema_service._alembic_config(conn), schema_service.BASELINE_REVISION)
+        conn.execute(text("DROP TABLE alembic_version"))
+        conn.execute(text(
+            "INSERT INTO users (id, phone, name, password_hash, other_income, onboarding_complete) "
+            "VALUES (gen_random_uuid(), '9000000000', 'Old', 'x', 0, false)"
+        ))
+        conn.execute(text(
+            "INSERT INTO refresh_tokens (id, token, user_id, expires_at) "
+            "SELECT gen_random_uuid(), 'raw-token', id, now() + interval '1 day' FROM users"
+        ))
+        conn.execute(text(
+            "INSERT INTO expenses (id, user_id, amount, category, date) "
+            "SELECT gen_random_uuid(), id, amount, 'SHOPPING', day FROM users, "
+            "(VALUES (100, date '2024-03-05'), (40, date '2024-03-05'), (7, date '2024-04-01')) AS e(amount, day)"
+        ))
+        # A finished challenge: the sweep never revisits it, so only setup can score it
+        conn.execute(text(
+            "INSERT INTO challenges (id, title, description, challenge_type, duration_days, badge_type, is_active) "
+            "VALUES (gen_random_uuid(), 'Expense Tracking Streak', 'x', 'STREAK', 30, 'STREAK_CHAMPION', true)"
+        ))
+        conn.execute(text(
+            "INSERT INTO user_challenges (id, user_id, challenge_id, status, start_date, end_date) "
+            "SELECT gen_random_uuid(), users.id, challenges.id, 'COMPLETED', date '2024-03-05', date '2024-04-04' "
+            "FROM users, challenges"
+        ))
+
+    with Session(scratch_engine) as db:
+        result = schema_service.apply_schema_and_seed(db)
+        assert schema_service.is_current(db)
+    assert result["rescored"] == 1
+
+    tables = inspect(scratch_engine)
+    assert tables.has_table("user_month_category_totals")
+    token_columns = {c["name"] for c in tables.get_columns("refresh_tokens")}
+    assert "token_hash" in token_columns and "token" not in token_columns
+    with scratch_engine.connect() as conn:
+        assert conn.scalars(text("SELECT token_hash FROM refresh_tokens")).all() == [hash_token("raw-token")]
+        monthly = conn.execute(text(
+            "SELECT year, month, total, expense_count FROM user_month_category_totals ORDER BY year, month"
+        )).all()
+        daily = conn.execute(text(
+            "SELECT day, total, expense_count FROM user_day_category_totals ORDER BY day"
+        )).all()
+    assert [tuple(r) for r in monthly] == [(2024, 3, 140, 2), (2024, 4, 7, 1)]
+    assert [tuple(r) for r in daily] == [(date(2024, 3, 5), 140, 2), (date(2024, 4, 1), 7, 1)]
+    with scratch_engine.connect() as conn:
+        assert conn.scalar(text("SELECT count(*) FROM challenge_leaderboard_entries")) == 1
+
+
+def test_concurrent_setup_runs_once(scratch_engine):
+    results = []
+    errors = []
+
+    def setup():
+        try:
+            with Session(scratch_engine) as db:
+                results.append(schema_service.apply_schema_and_seed(db))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=setup) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert sorted(r["upgraded"] for r in results) == [False, False, False, True]
+    assert _challenge_count(scratch_engine) == len(SEED_CHALLENGES)
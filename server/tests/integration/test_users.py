@@ -0,0 +1,19 @@
+from app.services import user_service
+
+
+def test_snapshot_loaded_across_an_invalidation_is_not_cached(db, user_id, monkeypatch):
+    real_to_snapshot = user_service._to_snapshot
+
+    def to_snapshot_during_write(user):
+        # A profile update commits and invalidates while this load is in flight
+        user_service.invalidate_user_snapshot(user.id)
+        return real_to_snapshot(user)
+
+    user_service.invalidate_user_snapshot(user_id)
+    monkeypatch.setattr(user_service, "_to_snapshot", to_snapshot_during_write)
+    assert user_service.get_user_snapshot(db, user_id).id == user_id
+    assert user_service._snapshot_cache.get(user_id) is None
+
+    monkeypatch.setattr(user_service, "_to_snapshot", real_to_snapshot)
+    snapshot = user_service.get_user_snapshot(db, user_id)
+    assert user_service._snapshot_cache.get(user_id) is snapshot
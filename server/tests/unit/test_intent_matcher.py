@@ -0,0 +1,48 @@
+import pytest
+
+from app.services.chat_service import select_intents
+from app.utils.intent_matcher import IntentMatcher
+
+# Labelled chat messages -> intents answered, in reply order
+LABELLED_MESSAGES = [
+    ("hi", ["greeting"]),
+    ("Hello there!", ["greeting"]),
+    ("good morning", ["greeting"]),
+    ("hi, how much did I spend this month?", ["spending"]),
+    ("hey, any badges or streak?", ["challenge"]),
+    ("show my expenses", ["spending"]),
+    ("what's my top category", ["spending"]),
+    ("am I over budget", ["budget"]),
+    ("how are my savings goals doing", ["goal"]),
+    ("I saved towards my target", ["goal"]),
+    ("which challenges can I join", ["challenge"]),
+    ("should I invest in mutual funds or a SIP", ["investment"]),
+    ("my salary vs spending", ["spending", "income"]),
+    ("Which stocks should I buy with my paycheck?", ["income", "investment"]),
+    ("budget, goals, challenges and income", ["budget", "goal", "challenge"]),
+    ("What is this?", []),
+    ("shipping costs", []),
+    ("tell me a joke", []),
+]
+
+
+@pytest.mark.parametrize(("message", "expected"), LABELLED_MESSAGES)
+def test_labelled_messages(message, expected):
+    assert select_intents(message) == expected
+
+
+def test_keywords_match_whole_tokens_only():
+    matcher = IntentMatcher({"greeting": {"hi": 1.0}})
+    assert matcher.rank("this is shipping") == []
+    assert matcher.rank("Hi!") == ["greeting"]
+
+
+def test_multi_word_keywords_need_consecutive_tokens():
+    matcher = IntentMatcher({"investment": {"mutual fund": 1.0}})
+    assert matcher.scores("a mutual fund") == {"investment": 1.0}
+    assert matcher.scores("mutual trust fund") == {}
+
+
+def test_ties_follow_declaration_order():
+    matcher = IntentMatcher({"b": {"x": 1.0}, "a": {"y": 1.0}})
+    assert matcher.rank("y x") == ["b", "a"]
@@ -0,0 +1,9 @@
+from alembic.script import ScriptDirectory
+
+from app.services import schema_service
+
+
+def test_head_revision_constant_matches_alembic_head():
+    scripts = ScriptDirectory.from_config(schema_service._alembic_config())
+    assert scripts.get_heads() == [schema_service.HEAD_REVISION]
+